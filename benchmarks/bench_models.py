@@ -0,0 +1,65 @@
+"""모델 생성 비용 벤치마크
+
+검색 결과 파싱 루프에서 대량으로 생성되는 `SearchResult`의 생성 시간과
+인스턴스당 메모리를 측정한다. 기존 pydantic 모델과 slots dataclass를 비교한다.
+
+    python -m benchmarks.bench_models --count 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from src.core.models import SearchResult
+
+
+class _PydanticSearchResult(BaseModel):
+    """비교 기준: 기존 pydantic 기반 SearchResult"""
+
+    title: str
+    url: str
+    snippet: str = ""
+
+
+def _measure(factory: Callable[[int], object], count: int) -> tuple[float, float]:
+    """(생성 1건당 µs, 인스턴스 1건당 bytes)를 반환한다."""
+    start = time.perf_counter()
+    for i in range(count):
+        factory(i)
+    elapsed = time.perf_counter() - start
+
+    # 문자열은 미리 만들어 두고 인스턴스 자체의 메모리만 측정한다
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    return elapsed / count * 1e6, (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="모델 생성 비용 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="생성할 인스턴스 수")
+    args = parser.parse_args()
+
+    titles = [f"기사 제목 {i}" for i in range(args.count)]
+    urls = [f"https://www.example.com/news/{i}" for i in range(args.count)]
+
+    cases: dict[str, Callable[[int], object]] = {
+        "SearchResult (pydantic)": lambda i: _PydanticSearchResult(title=titles[i], url=urls[i]),
+        "SearchResult (slots dataclass)": lambda i: SearchResult(title=titles[i], url=urls[i]),
+    }
+
+    print(f"{'타입':<32}{'µs/건':>10}{'bytes/건':>12}")
+    for name, factory in cases.items():
+        usec, nbytes = _measure(factory, args.count)
+        print(f"{name:<32}{usec:>10.2f}{nbytes:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
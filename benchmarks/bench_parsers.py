@@ -0,0 +1,203 @@
+"""채널 파서 벤치마크와 처리량 회귀 검사
+
+채널마다 합성 검색 결과/기사 페이지(약 500KB, benchmarks/synthetic.py)를 만들어
+`parse_search_results`와 `parse_article`의 처리량(문서/초)과 최대 메모리를 측정한다.
+기준선 파일(benchmarks/parsers_baseline.json)과 비교하여 처리량이 `--threshold` 이상
+떨어진 항목이 있으면 종료 코드 1로 끝난다.
+
+    python -m benchmarks.bench_parsers                  # 측정 후 기준선과 비교
+    python -m benchmarks.bench_parsers --save-baseline  # 기준선 갱신
+    python -m benchmarks.bench_parsers --channel naver_news --min-time 2
+
+처리량은 머신 속도에 묶이므로 기준선은 검사를 돌릴 머신에서 저장해야 한다. 기준선에
+기록된 머신/파이썬 버전이 현재와 다르면 경고만 출력한다.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.synthetic import CHANNELS, SyntheticPage, article_page, search_page
+from src.core.models import SearchResult
+
+BASELINE_PATH = Path(__file__).with_name("parsers_baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+_Cases = dict[str, tuple[SyntheticPage, Callable[[str], object]]]
+
+
+@dataclass(slots=True)
+class CaseResult:
+    case: str
+    bytes: int
+    docs_per_sec: float
+    peak_kib: float
+
+
+def build_cases(channels: list[str]) -> _Cases:
+    """{"채널.search|article": (문서, 파싱 함수)}. 결과가 기대와 다르면 바로 실패한다."""
+    cases: _Cases = {}
+    for channel in channels:
+        parser = importlib.import_module(f"src.channels.{channel}.parser")
+        search = search_page(channel)
+        found = parser.parse_search_results(search.html)
+        if len(found) != search.expected_items:
+            raise SystemExit(
+                f"{channel} 검색 결과 파싱 결과가 {len(found)}건입니다 "
+                f"(기대값 {search.expected_items}건). 합성 페이지와 선택자를 확인하세요."
+            )
+        cases[f"{channel}.search"] = (search, parser.parse_search_results)
+
+        target = found[0]
+        keyword = "반도체"
+
+        def parse_article(html: str, parser=parser, target: SearchResult = target) -> object:
+            return parser.parse_article(html, target, keyword)
+
+        cases[f"{channel}.article"] = (article_page(channel), parse_article)
+    return cases
+
+
+def _throughput(parse: Callable[[str], object], html: str, min_time: float, rounds: int) -> float:
+    """라운드마다 min_time 이상 반복 파싱하여 가장 빠른 라운드의 문서/초를 반환한다."""
+    best = 0.0
+    for _ in range(rounds):
+        count = 0
+        started = time.perf_counter()
+        while True:
+            parse(html)
+            count += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = max(best, count / elapsed)
+    return best
+
+
+def _peak_kib(parse: Callable[[str], object], html: str) -> float:
+    """문서 1건을 파싱하는 동안 새로 할당된 메모리의 최댓값 (KiB)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        parse(html)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024
+
+
+def run(cases: _Cases, min_time: float, rounds: int) -> list[CaseResult]:
+    results: list[CaseResult] = []
+    for case, (page, parse) in cases.items():
+        parse(page.html)  # 워밍업 (모듈 import, 선택자 컴파일 캐시)
+        results.append(
+            CaseResult(
+                case=case,
+                bytes=page.size,
+                docs_per_sec=_throughput(parse, page.html, min_time, rounds),
+                peak_kib=_peak_kib(parse, page.html),
+            )
+        )
+    return results
+
+
+def compare(results: list[CaseResult], baseline: dict) -> dict[str, float | None]:
+    """항목별 (현재 처리량 / 기준 처리량) 비율. 기준선에 없는 항목은 None"""
+    ratios: dict[str, float | None] = {}
+    for result in results:
+        base = baseline.get("results", {}).get(result.case)
+        ratios[result.case] = result.docs_per_sec / base["docs_per_sec"] if base else None
+    return ratios
+
+
+def regressions(ratios: dict[str, float | None], threshold: float) -> list[str]:
+    return [case for case, ratio in ratios.items() if ratio is not None and ratio < 1 - threshold]
+
+
+def _environment() -> dict[str, str]:
+    return {"python": platform.python_version(), "machine": platform.machine()}
+
+
+def save_baseline(path: Path, results: list[CaseResult]) -> None:
+    payload = {
+        **_environment(),
+        "results": {
+            r.case: {k: round(v, 2) if isinstance(v, float) else v for k, v in asdict(r).items()}
+            for r in results
+        },
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="채널 파서 처리량/메모리 벤치마크")
+    parser.add_argument(
+        "--channel", action="append", choices=CHANNELS, help="측정할 채널 (반복 지정 가능)"
+    )
+    parser.add_argument("--min-time", type=float, default=0.5, help="라운드당 최소 측정 시간(초)")
+    parser.add_argument("--rounds", type=int, default=3, help="라운드 수 (가장 빠른 값 사용)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준선 파일")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="허용하는 처리량 감소 비율 (기본 0.2 = 20%%)",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준선으로 저장")
+    args = parser.parse_args()
+
+    cases = build_cases(args.channel or list(CHANNELS))
+    results = run(cases, args.min_time, args.rounds)
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        recorded = {key: baseline.get(key) for key in _environment()}
+        if recorded != _environment():
+            print(f"경고: 기준선 측정 환경이 다릅니다 ({recorded} → {_environment()})")
+    ratios = compare(results, baseline)
+
+    if not args.save_baseline:
+        # 일시적인 부하로 느려졌을 수 있으므로 회귀 항목은 라운드를 늘려 한 번 더 측정한다
+        suspects = regressions(ratios, args.threshold)
+        if suspects:
+            retried = run({c: cases[c] for c in suspects}, args.min_time, args.rounds * 2)
+            by_case = {r.case: r for r in retried}
+            results = [
+                r
+                if r.case not in by_case or r.docs_per_sec >= by_case[r.case].docs_per_sec
+                else by_case[r.case]
+                for r in results
+            ]
+            ratios = compare(results, baseline)
+
+    print(f"{'항목':<24}{'KB':>8}{'문서/초':>10}{'기준 대비':>10}{'peak MiB':>10}")
+    for r in results:
+        ratio = ratios[r.case]
+        vs = f"{ratio:.0%}" if ratio is not None else "-"
+        print(
+            f"{r.case:<24}{r.bytes / 1000:>8.0f}{r.docs_per_sec:>10.2f}{vs:>10}"
+            f"{r.peak_kib / 1024:>10.1f}"
+        )
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"기준선 저장: {args.baseline}")
+        return
+
+    failed = regressions(ratios, args.threshold)
+    if failed:
+        print(f"처리량 회귀 ({args.threshold:.0%} 초과 감소): {', '.join(failed)}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""mock 뉴스 사이트 대상 오케스트레이터 부하 테스트
+
+mock 사이트(benchmarks/mock_site.py)를 별도 프로세스로 띄우고 `CrawlOrchestrator` 전체를
+실행해 기사 처리량(기사/초), 요청 지연 시간 p50/p99, 최대 RSS(브라우저 프로세스 포함)를
+출력한다. 정적(httpx) 채널과 동적(playwright) 채널은 경로별로 따로 측정한다.
+첫 기사까지 걸린 시간(TTFA)도 출력하므로 `--no-warmup`과 비교하면 연결 미리 준비의
+효과를 볼 수 있다.
+
+    python -m benchmarks.loadtest --keywords 200 --pages 2
+    python -m benchmarks.loadtest --path static --keywords 1000 --latency 0.2 --error-rate 0.02
+    python -m benchmarks.loadtest --keywords 10 --no-warmup
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import time
+from pathlib import Path
+
+from benchmarks.mock_site import (
+    MockNewsSite,
+    MockSiteConfig,
+    MockSiteFetchStrategy,
+    add_site_arguments,
+)
+from config.settings import CrawlerSettings
+from src.pipeline.channel_registry import CHANNEL_MAP, get_strategy_type
+from src.pipeline.orchestrator import CrawlOrchestrator
+
+
+def _run_site(config: MockSiteConfig, conn) -> None:
+    """자식 프로세스: mock 사이트를 띄우고 포트를 부모에게 알린다."""
+
+    async def serve() -> None:
+        server = await MockNewsSite(config).start()
+        conn.send(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def _start_site(config: MockSiteConfig) -> tuple[multiprocessing.Process, str]:
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe()
+    process = ctx.Process(target=_run_site, args=(config, child), daemon=True)
+    process.start()
+    port = parent.recv()
+    return process, f"http://127.0.0.1:{port}"
+
+
+def _rss_kib(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _descendants(pid: int) -> list[int]:
+    children: list[int] = []
+    try:
+        for tid in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{tid}/children", encoding="ascii") as f:
+                children.extend(int(c) for c in f.read().split())
+    except OSError:
+        return []
+    return children + [d for c in children for d in _descendants(c)]
+
+
+class RssSampler:
+    """이 프로세스와 자식 프로세스(브라우저 등) RSS 합계의 최댓값을 주기적으로 기록한다.
+
+    /proc가 없는 환경에서는 이 프로세스의 최대 RSS(getrusage)만 보고한다.
+    """
+
+    def __init__(self, exclude: set[int], interval: float = 0.2) -> None:
+        self._exclude = exclude
+        self._interval = interval
+        self.peak_kib = 0
+        self._task: asyncio.Task | None = None
+
+    def sample(self) -> None:
+        pid = os.getpid()
+        pids = [pid] + [p for p in _descendants(pid) if p not in self._exclude]
+        self.peak_kib = max(self.peak_kib, sum(_rss_kib(p) for p in pids))
+
+    async def _run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self._interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._task.cancel()
+        self.sample()
+        if not self.peak_kib:
+            self.peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _percentile(values: list[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+async def run_path(
+    name: str,
+    channels: list[str],
+    keywords: list[str],
+    settings: CrawlerSettings,
+    base_url: str,
+    exclude_pids: set[int],
+) -> dict:
+    """채널 묶음 하나를 mock 사이트 대상으로 크롤링하고 측정값을 반환한다."""
+    latencies: list[float] = []
+    articles = errors = 0
+    first_article: float | None = None
+    orchestrator = CrawlOrchestrator(
+        settings, strategy_wrapper=lambda s: MockSiteFetchStrategy(s, base_url, latencies)
+    )
+    with RssSampler(exclude_pids) as rss:
+        started = time.perf_counter()
+        async with orchestrator:
+            async for event in orchestrator.run_iter(keywords, channels):
+                if event.article is not None:
+                    articles += 1
+                    if first_article is None:
+                        first_article = time.perf_counter() - started
+                else:
+                    errors += 1
+        elapsed = time.perf_counter() - started
+    return {
+        "path": name,
+        "channels": channels,
+        "articles": articles,
+        "errors": errors,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "articles_per_sec": round(articles / elapsed, 2),
+        "ttfa_ms": round((first_article or 0.0) * 1000, 1),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "peak_rss_mib": round(rss.peak_kib / 1024, 1),
+    }
+
+
+async def _main(args: argparse.Namespace, base_url: str, site_pid: int) -> list[dict]:
+    keywords = [f"부하{i:05d}" for i in range(args.keywords)]
+    settings = CrawlerSettings().model_copy(
+        update={
+            "max_pages": args.pages,
+            "request_delay": 0.0,
+            "max_workers": args.workers,
+            "warmup_connections": 0 if args.no_warmup else CrawlerSettings().warmup_connections,
+        }
+    )
+    paths = ["static", "dynamic"] if args.path == "both" else [args.path]
+    results = []
+    for path in paths:
+        channels = [c for c in (args.channels or list(CHANNEL_MAP)) if get_strategy_type(c) == path]
+        if not channels:
+            continue
+        try:
+            results.append(await run_path(path, channels, keywords, settings, base_url, {site_pid}))
+        except Exception as e:  # playwright 미설치 등
+            print(f"[{path}] 측정 실패: {e!r}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="mock 뉴스 사이트 대상 부하 테스트")
+    parser.add_argument("--keywords", type=int, default=50, help="생성할 키워드 수")
+    parser.add_argument("--pages", type=int, default=1, help="키워드당 검색 페이지 수")
+    parser.add_argument(
+        "--channels", nargs="+", choices=list(CHANNEL_MAP), help="측정할 채널 (기본: 전체)"
+    )
+    parser.add_argument(
+        "--path",
+        choices=["static", "dynamic", "both"],
+        default="both",
+        help="측정할 경로 (static: httpx 채널, dynamic: playwright 채널)",
+    )
+    parser.add_argument("--workers", type=int, default=16, help="스케줄러 워커 수")
+    parser.add_argument(
+        "--no-warmup", action="store_true", help="연결 미리 준비 없이 측정 (TTFA 비교용)"
+    )
+    parser.add_argument("--json", type=Path, default=None, help="결과를 JSON 파일로 저장")
+    add_site_arguments(parser)
+    args = parser.parse_args()
+
+    config = MockSiteConfig(
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        page_bytes=args.page_kb * 1000,
+        items_per_page=args.items,
+    )
+    site, base_url = _start_site(config)
+    try:
+        results = asyncio.run(_main(args, base_url, site.pid))
+    finally:
+        site.terminate()
+
+    print(
+        f"{'경로':<10}{'기사':>8}{'에러':>6}{'요청':>8}{'초':>8}{'기사/초':>10}"
+        f"{'TTFA ms':>9}{'p50 ms':>9}{'p99 ms':>9}{'RSS MiB':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['path']:<10}{r['articles']:>8}{r['errors']:>6}{r['requests']:>8}"
+            f"{r['seconds']:>8.1f}{r['articles_per_sec']:>10.1f}{r['ttfa_ms']:>9.1f}"
+            f"{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['peak_rss_mib']:>9.1f}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""부하 테스트용 로컬 mock 뉴스 사이트
+
+다섯 채널의 검색 결과/기사 페이지를 합성 페이지(benchmarks/synthetic.py)로 응답하는
+HTTP/1.1 서버다. 요청 경로의 첫 부분이 원래 호스트이며(`/www.mk.co.kr/search?...`),
+`MockSiteFetchStrategy`가 크롤러의 실제 사이트 URL을 이 형식으로 바꿔 보낸다.
+응답 지연 시간(로그 정규 분포), 에러 비율, 페이지 크기를 설정할 수 있다.
+
+    python -m benchmarks.mock_site --port 8800 --latency 0.1 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import zlib
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from benchmarks.synthetic import article_page, search_page
+from src.core.fetch_strategy import FetchStrategy
+
+# 원래 호스트 → (채널, 검색 결과 페이지 경로 접두사). 접두사가 None이면 기사 전용 호스트
+SITE_ROUTES: dict[str, tuple[str, str | None]] = {
+    "www.mk.co.kr": ("mk", "/search"),
+    "www.m-i.kr": ("maeililbo", "/news/articleList.html"),
+    "www.chosun.com": ("chosun", "/nsearch"),
+    "search.hani.co.kr": ("hani", "/"),
+    "www.hani.co.kr": ("hani", None),
+    "search.naver.com": ("naver_news", "/search.naver"),
+    "n.news.naver.com": ("naver_news", None),
+}
+
+# 기사 페이지 변형 수 (URL별로 하나를 골라 캐시된 페이지로 응답)
+_ARTICLE_VARIANTS = 8
+
+_REASONS = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}
+
+
+@dataclass(slots=True)
+class MockSiteConfig:
+    # 응답 지연 시간 중앙값(초)과 로그 정규 분포의 sigma (클수록 꼬리가 길다)
+    latency: float = 0.05
+    latency_sigma: float = 0.5
+    # 503(Retry-After: 1)으로 응답하는 비율
+    error_rate: float = 0.0
+    page_bytes: int = 500_000
+    items_per_page: int = 10
+    seed: int = 0
+
+
+def route(path: str) -> tuple[str, str] | None:
+    """`/원래호스트/경로` 요청을 (채널, "search" 또는 "article")로 분류한다."""
+    host, _, rest = path.lstrip("/").partition("/")
+    site = SITE_ROUTES.get(host)
+    if site is None:
+        return None
+    channel, search_prefix = site
+    if search_prefix is not None and f"/{rest}".startswith(search_prefix):
+        return channel, "search"
+    return channel, "article"
+
+
+class MockNewsSite:
+    """합성 뉴스 페이지를 응답하는 asyncio HTTP 서버"""
+
+    def __init__(self, config: MockSiteConfig | None = None) -> None:
+        self.config = config or MockSiteConfig()
+        self._rng = random.Random(self.config.seed)
+        self._articles: dict[tuple[str, int], str] = {}
+        self.requests = 0
+        # 연결 미리 열기(HEAD) 요청 수 (requests에는 넣지 않는다)
+        self.head_requests = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._serve, host=host, port=port)
+
+    def render(self, path: str) -> tuple[int, str]:
+        """요청 경로(쿼리 포함)에 대한 (상태 코드, HTML)"""
+        target = route(path.split("?", 1)[0])
+        if target is None:
+            return 404, "<html><body>not found</body></html>"
+        channel, kind = target
+        key = zlib.crc32(path.encode("utf-8"))
+        if kind == "search":
+            # 검색어/페이지마다 다른 기사 번호 범위를 주어 기사 URL이 겹치지 않게 한다
+            items = self.config.items_per_page
+            return 200, self._search(channel, key, (key % 1_000_000) * items, items)
+        return 200, self._article(channel, key % _ARTICLE_VARIANTS)
+
+    def _search(self, channel: str, seed: int, offset: int, items: int) -> str:
+        return search_page(channel, items, self.config.page_bytes, seed, offset).html
+
+    def _article(self, channel: str, variant: int) -> str:
+        key = (channel, variant)
+        if key not in self._articles:
+            self._articles[key] = article_page(channel, self.config.page_bytes, variant).html
+        return self._articles[key]
+
+    def _delay(self) -> float:
+        if self.config.latency <= 0:
+            return 0.0
+        return self.config.latency * math.exp(self._rng.gauss(0.0, self.config.latency_sigma))
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while request_line := await reader.readline():
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                close = False
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection":
+                        close = value.strip().lower() == "close"
+                if method == "HEAD":
+                    self.head_requests += 1
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+                    await writer.drain()
+                    if close:
+                        break
+                    continue
+                self.requests += 1
+                await asyncio.sleep(self._delay())
+                if self._rng.random() < self.config.error_rate:
+                    status, body, extra = (
+                        503,
+                        "<html><body>busy</body></html>",
+                        "Retry-After: 1\r\n",
+                    )
+                else:
+                    (status, body), extra = self.render(path), ""
+                payload = body.encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    "Content-Type: text/html; charset=utf-8\r\n"
+                    f"Content-Length: {len(payload)}\r\n{extra}\r\n".encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class MockSiteFetchStrategy(FetchStrategy):
+    """실제 사이트 URL을 mock 사이트 주소(`{base_url}/{호스트}{경로}`)로 바꿔 요청하는 래퍼
+
+    요청마다 걸린 시간을 `latencies`에 모은다 (부하 테스트의 p50/p99 계산용).
+    """
+
+    def __init__(self, inner: FetchStrategy, base_url: str, latencies: list[float]) -> None:
+        self._inner = inner
+        self._base_url = base_url.rstrip("/")
+        self._latencies = latencies
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up([self.rewrite(url) for url in urls], connections)
+
+    def rewrite(self, url: str) -> str:
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self._base_url}/{parts.hostname}{parts.path or '/'}{query}"
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            return await self._inner.fetch(self.rewrite(url), wait_selector=wait_selector)
+        finally:
+            self._latencies.append(loop.time() - started)
+
+
+async def _serve_forever(args: argparse.Namespace) -> None:
+    site = MockNewsSite(
+        MockSiteConfig(
+            latency=args.latency,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            page_bytes=args.page_kb * 1000,
+            items_per_page=args.items,
+        )
+    )
+    server = await site.start(args.host, args.port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"mock 뉴스 사이트: http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def add_site_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연 중앙값(초)")
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="지연 시간 로그 정규 분포 sigma"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--page-kb", type=int, default=500, help="페이지 크기(KB)")
+    parser.add_argument("--items", type=int, default=10, help="검색 결과 페이지당 기사 수")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="부하 테스트용 mock 뉴스 사이트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    add_site_arguments(parser)
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""채널별 합성 검색 결과/기사 페이지 생성기
+
+실제 페이지처럼 본문보다 내비게이션, 인라인 스크립트, 광고, 추천 기사 영역이 훨씬 큰
+약 500KB 문서를 만든다. 각 채널 파서가 현재 사용하는 선택자 구조를 따르며, 같은
+seed면 항상 같은 문서를 만든다. 채우기용 링크는 채널의 기사 링크 패턴과 겹치지 않게
+만들어 파싱 결과 건수가 항상 `items`와 같다.
+"""
+
+import json
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+DEFAULT_TARGET_BYTES = 500_000
+DEFAULT_ITEMS = 20
+_PADDING_VARIANTS = 4
+
+_WORDS = (
+    "정부",
+    "반도체",
+    "수출",
+    "금리",
+    "시장",
+    "기업",
+    "투자",
+    "경제",
+    "발표",
+    "회의",
+    "지역",
+    "주민",
+    "정책",
+    "예산",
+    "국회",
+    "법안",
+    "개정",
+    "산업",
+    "기술",
+    "개발",
+    "인공지능",
+    "데이터",
+    "플랫폼",
+    "서비스",
+    "소비자",
+    "가격",
+    "상승",
+    "하락",
+    "전망",
+    "분석",
+    "교육",
+    "학생",
+    "병원",
+    "의료",
+    "환경",
+    "기후",
+    "에너지",
+    "전력",
+    "교통",
+    "도시",
+)
+_SECTIONS = ("politics", "economy", "society", "culture", "sports", "opinion", "world", "tech")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticPage:
+    html: str
+    # 검색 결과 페이지면 파서가 찾아야 할 기사 수, 기사 페이지면 0
+    expected_items: int
+
+    @property
+    def size(self) -> int:
+        return len(self.html.encode("utf-8"))
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)) + "."
+
+
+def _title(rng: random.Random) -> str:
+    return f"{rng.choice(_WORDS)} {rng.choice(_WORDS)}, {_sentence(rng, 5)[:-1]}"
+
+
+def _paragraphs(rng: random.Random, count: int) -> list[str]:
+    return [" ".join(_sentence(rng) for _ in range(4)) for _ in range(count)]
+
+
+def _filler_block(rng: random.Random, index: int) -> str:
+    """페이지 크기를 채우는 블록 하나 (메뉴, 추적 스크립트, 광고, 많이 본 뉴스)"""
+    kind = index % 4
+    if kind == 0:
+        links = "".join(
+            f'<li class="gnb__item"><a href="/{rng.choice(_SECTIONS)}/list?page={i}">'
+            f"{rng.choice(_WORDS)}</a></li>"
+            for i in range(30)
+        )
+        return f'<nav class="gnb gnb--{index}"><ul class="gnb__list">{links}</ul></nav>'
+    if kind == 1:
+        config = {
+            "slot": f"ad-slot-{index}",
+            "targeting": {w: rng.randint(0, 9999) for w in rng.sample(_WORDS, 20)},
+            "sizes": [[300, 250], [728, 90], [970, 250]],
+        }
+        return (
+            f"<script>window.__ads=window.__ads||[];"
+            f"window.__ads.push({json.dumps(config, ensure_ascii=False)});</script>"
+        )
+    if kind == 2:
+        return (
+            f'<div class="ad-banner" id="banner-{index}" data-track="{rng.getrandbits(64):x}">'
+            f'<iframe src="about:blank" width="728" height="90"></iframe>'
+            f'<span class="ad-label">광고</span></div>'
+        )
+    items = "".join(
+        f'<li class="ranking__item"><span class="ranking__no">{i + 1}</span>'
+        f'<a href="/{rng.choice(_SECTIONS)}/ranking?rank={i}">{_title(rng)}</a></li>'
+        for i in range(10)
+    )
+    return f'<aside class="ranking"><h3>많이 본 뉴스</h3><ol>{items}</ol></aside>'
+
+
+def _fill(rng: random.Random, target_bytes: int, used: int) -> str:
+    blocks: list[str] = []
+    index = 0
+    while used < target_bytes:
+        block = _filler_block(rng, index)
+        blocks.append(block)
+        used += len(block.encode("utf-8"))
+        index += 1
+    return "".join(blocks)
+
+
+@lru_cache(maxsize=64)
+def _padding(size: int, variant: int) -> tuple[str, str]:
+    """문서 앞뒤 채우기 블록 (mock 서버가 페이지를 빨리 만들도록 크기/변형별로 캐시)"""
+    rng = random.Random(variant)
+    top = _fill(rng, size // 2, 0)
+    return top, _fill(rng, size - len(top.encode("utf-8")), 0)
+
+
+def _document(rng: random.Random, target_bytes: int, head: str, main: str) -> str:
+    """head/main 앞뒤를 채우기 블록으로 감싸 target_bytes 이상인 문서를 만든다."""
+    shell = (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>뉴스</title>'
+        f"{head}</head><body><header>{{top}}</header><main>{main}</main>"
+        "<footer>{bottom}</footer></body></html>"
+    )
+    remaining = max(target_bytes - len(shell.encode("utf-8")), 0)
+    # 캐시가 잘 맞도록 채울 크기를 1KB 단위로 올림한다
+    top, bottom = _padding(-(-remaining // 1024) * 1024, rng.randrange(_PADDING_VARIANTS))
+    return shell.replace("{top}", top, 1).replace("{bottom}", bottom, 1)
+
+
+def _article_body(rng: random.Random) -> str:
+    return "".join(f"<p>{p}</p>" for p in _paragraphs(rng, 30))
+
+
+# ── 조선일보: Next.js __NEXT_DATA__ + 서버 렌더링 마크업 ──
+
+
+def _next_data_script(page_props: dict, rng: random.Random, extra_items: int) -> str:
+    # 실제 Next.js 페이지처럼 화면과 무관한 props(메뉴, 추천 목록)도 함께 싣는다
+    page_props = {
+        **page_props,
+        "navigation": [
+            {"label": rng.choice(_WORDS), "href": f"/{rng.choice(_SECTIONS)}/"}
+            for _ in range(extra_items)
+        ],
+        "recommended": [
+            {"headline": _title(rng), "href": f"/{rng.choice(_SECTIONS)}/ranking?rank={i}"}
+            for i in range(extra_items)
+        ],
+    }
+    data = {"props": {"pageProps": page_props}, "page": "/", "buildId": "synthetic"}
+    return (
+        '<script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(data, ensure_ascii=False)}</script>"
+    )
+
+
+def _chosun_search(rng: random.Random, ids: range, target_bytes: int) -> SyntheticPage:
+    entries = [
+        {
+            "title": _title(rng),
+            "url": f"/economy/2024/01/{i % 28 + 1:02d}/ARTICLE{i:08X}/",
+            "description": _sentence(rng, 20),
+            "display_date": f"2024-01-{i % 28 + 1:02d}T09:30:00.000Z",
+        }
+        for i in ids
+    ]
+    cards = "".join(
+        f'<div class="story-card"><a class="story-card__headline" href="{e["url"]}">'
+        f'{e["title"]}</a><p class="story-card__deck">{e["description"]}</p></div>'
+        for e in entries
+    )
+    head = _next_data_script({"searchResult": {"items": entries}}, rng, 400)
+    main = f'<div class="search-feed">{cards}</div>'
+    return SyntheticPage(_document(rng, target_bytes, head, main), len(ids))
+
+
+def _chosun_article(rng: random.Random, target_bytes: int) -> SyntheticPage:
+    body = _article_body(rng)
+    article = {"content": body, "publishedAt": "2024-01-15T09:30:00+09:00"}
+    head = _next_data_script({"article": article}, rng, 400)
+    main = f'<section class="article-body">{body}</section>'
+    return SyntheticPage(_document(rng, target_bytes, head, main), 0)
+
+
+# ── 한겨레: '/arti/' 링크 목록 ──
+
+
+def _hani_search(rng: random.Random, ids: range, target_bytes: int) -> SyntheticPage:
+    rows = "".join(
+        f'<li class="search-item"><a href="https://www.hani.co.kr/arti/economy/{1100000 + i}.html">'
+        f'{_title(rng)}</a><p class="search-item__text">{_sentence(rng, 20)}</p></li>'
+        for i in ids
+    )
+    main = f'<div class="search-inner"><ul class="search-list">{rows}</ul></div>'
+    return SyntheticPage(_document(rng, target_bytes, "", main), len(ids))
+
+
+def _hani_article(rng: random.Random, target_bytes: int) -> SyntheticPage:
+    main = (
+        '<div class="article-head"><span class="date-time">2024-01-15 10:30</span></div>'
+        f'<div class="article-text">{_article_body(rng)}</div>'
+    )
+    return SyntheticPage(_document(rng, target_bytes, "", main), 0)
+
+
+# ── 매일일보: ND소프트 기사 목록(li.clearfix) ──
+
+
+def _maeililbo_search(rng: random.Random, ids: range, target_bytes: int) -> SyntheticPage:
+    rows = "".join(
+        f'<li class="clearfix"><div class="auto-titles">'
+        f'<a href="/news/articleView.html?idxno={500000 + i}">{_title(rng)}</a></div>'
+        f'<p class="auto-sums">{_sentence(rng, 20)}</p>'
+        f'<span class="byline"><em>기자{i % 9}</em><em>2024.01.{i % 28 + 1:02d} 10:30</em></span>'
+        "</li>"
+        for i in ids
+    )
+    main = f'<section id="section-list"><ul class="type1">{rows}</ul></section>'
+    return SyntheticPage(_document(rng, target_bytes, "", main), len(ids))
+
+
+def _maeililbo_article(rng: random.Random, target_bytes: int) -> SyntheticPage:
+    main = (
+        '<ul class="infomation"><li>기자명 홍길동</li><li>승인 2024.01.15 10:30</li></ul>'
+        f'<div id="article-view-content-div">{_article_body(rng)}</div>'
+    )
+    return SyntheticPage(_document(rng, target_bytes, "", main), 0)
+
+
+# ── 매일경제: li.news_node 목록 ──
+
+
+def _mk_search(rng: random.Random, ids: range, target_bytes: int) -> SyntheticPage:
+    rows = "".join(
+        f'<li class="news_node"><a href="https://www.mk.co.kr/news/economy/{11000000 + i}">'
+        f'<h3 class="news_ttl">{_title(rng)}</h3><p class="news_desc">{_sentence(rng, 20)}</p>'
+        f'</a><p class="time_info">2024.01.{i % 28 + 1:02d} 09:30</p></li>'
+        for i in ids
+    )
+    main = f'<ul class="news_list">{rows}</ul>'
+    return SyntheticPage(_document(rng, target_bytes, "", main), len(ids))
+
+
+def _mk_article(rng: random.Random, target_bytes: int) -> SyntheticPage:
+    main = (
+        '<div class="time_area"><time datetime="2024-01-15">2024.01.15 09:30:00</time></div>'
+        f'<div class="news_cnt_detail_wrap">{_article_body(rng)}</div>'
+    )
+    return SyntheticPage(_document(rng, target_bytes, "", main), 0)
+
+
+# ── 네이버 뉴스: SDS 컴포넌트 (n.news.naver.com 링크 + 언론사 원문 제목 링크) ──
+
+
+def _naver_search(rng: random.Random, ids: range, target_bytes: int) -> SyntheticPage:
+    # 파서는 네이버 뉴스 링크의 부모에서 4단계 위 요소를 뉴스 아이템 컨테이너로 본다
+    rows = "".join(
+        '<li class="bx"><div class="news_wrap"><div class="news_area">'
+        '<div class="news_info"><div class="info_group">'
+        f'<a class="info press" href="https://www.press{i % 7}.co.kr/">언론사{i % 7}</a>'
+        f'<span class="info">{i % 23 + 1}시간 전</span>'
+        f'<a class="info" href="https://n.news.naver.com/mnews/article/0{i % 90:02d}/'
+        f'{1000000 + i:010d}">네이버뉴스</a></div></div>'
+        f'<a class="news_tit" href="https://www.press{i % 7}.co.kr/news/{700000 + i}">'
+        f'{_title(rng)}</a><div class="news_dsc">{_sentence(rng, 20)}</div>'
+        "</div></div></li>"
+        for i in ids
+    )
+    main = f'<div class="group_news"><ul class="list_news">{rows}</ul></div>'
+    return SyntheticPage(_document(rng, target_bytes, "", main), len(ids))
+
+
+def _naver_article(rng: random.Random, target_bytes: int) -> SyntheticPage:
+    main = (
+        '<div class="media_end_head_info_datestamp">'
+        '<span class="media_end_head_info_datestamp_time" '
+        'data-date-time="2024-01-15 09:30:00">2024.01.15. 오전 9:30</span></div>'
+        f'<article id="dic_area" class="go_trans _article_content">{_article_body(rng)}</article>'
+    )
+    return SyntheticPage(_document(rng, target_bytes, "", main), 0)
+
+
+_GENERATORS: dict[
+    str,
+    tuple[
+        Callable[[random.Random, range, int], SyntheticPage],
+        Callable[[random.Random, int], SyntheticPage],
+    ],
+] = {
+    "chosun": (_chosun_search, _chosun_article),
+    "hani": (_hani_search, _hani_article),
+    "maeililbo": (_maeililbo_search, _maeililbo_article),
+    "mk": (_mk_search, _mk_article),
+    "naver_news": (_naver_search, _naver_article),
+}
+
+CHANNELS = tuple(_GENERATORS)
+
+
+def search_page(
+    channel: str,
+    items: int = DEFAULT_ITEMS,
+    target_bytes: int = DEFAULT_TARGET_BYTES,
+    seed: int = 0,
+    offset: int = 0,
+) -> SyntheticPage:
+    """채널의 합성 검색 결과 페이지를 만든다. 기사 번호는 `offset`부터 `items`개다."""
+    return _GENERATORS[channel][0](random.Random(seed), range(offset, offset + items), target_bytes)
+
+
+def article_page(
+    channel: str,
+    target_bytes: int = DEFAULT_TARGET_BYTES,
+    seed: int = 0,
+) -> SyntheticPage:
+    """채널의 합성 기사 상세 페이지를 만든다."""
+    return _GENERATORS[channel][1](random.Random(seed), target_bytes)
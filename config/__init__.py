@@ -1,3 +1,10 @@
-from config.settings import CrawlerSettings
-
 __all__ = ["CrawlerSettings"]
+
+
+def __getattr__(name: str):
+    # pydantic-settings import 비용을 실제 사용 시점으로 미룬다 (config.logging만 쓰는 경우)
+    if name == "CrawlerSettings":
+        from config.settings import CrawlerSettings
+
+        return CrawlerSettings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,8 @@ class BrowserSettings(BaseSettings):
     model_config = {"env_prefix": "BROWSER_"}
 
     headless: bool = True
+    # 브라우저 컨텍스트 하나를 다시 쓸 최대 요청 수 (넘으면 닫고 새로 만든다)
+    context_max_uses: int = 50
 
 
 class CrawlerSettings(BaseSettings):
@@ -24,4 +26,76 @@ class CrawlerSettings(BaseSettings):
         "Chrome/120.0.0.0 Safari/537.36"
     )
     output_dir: str = "./output"
+    # 일반 실행의 진행 상황을 output_dir/journal에 기록할지 (끄면 --resume으로 이어서 실행 불가)
+    journal: bool = True
+    # 연결 미리 준비: 채널 크롤러를 만들 때 호스트마다 연결(정적 채널) 또는 브라우저
+    # 컨텍스트(동적 채널)를 몇 개 열어 둘지 (0이면 하지 않음), DNS 조회 결과 캐시 시간(초)
+    warmup_connections: int = 2
+    dns_cache_ttl: float = 300.0
+    # 정적 채널 응답 본문 크기 상한 (바이트, 0이면 제한 없음). 넘으면 앞부분만 쓴다.
+    # URL별 상한은 "호스트" 또는 "호스트/경로 접두사" → 상한으로 지정한다
+    max_page_bytes: int = 5_000_000
+    max_page_bytes_overrides: dict[str, int] = Field(default_factory=dict)
+    # 스트리밍 API(run_iter)의 이벤트 버퍼 크기. 소비자가 느리면 크롤링이 여기서 대기한다
+    stream_buffer_size: int = 100
+    # 작업 스케줄러: 전체 워커 수, 채널별 동시 실행 상한 (채널명 → 상한으로 개별 지정 가능)
+    # 적응형 동시성 제어를 켜면 채널 기본 상한은 adaptive_max_limit까지 넓어진다
+    max_workers: int = 16
+    channel_concurrency: int = 4
+    channel_concurrency_overrides: dict[str, int] = Field(default_factory=dict)
+    # 스케줄러 상태 로그 주기 (초, 0이면 종료 시에만 출력)
+    scheduler_report_interval: float = 30.0
+    # daemon 모드: API 주소, 동시 실행 작업 수, 작업 기본 제한 시간(초), 보관할 작업 수
+    daemon_host: str = "127.0.0.1"
+    daemon_port: int = 8765
+    daemon_max_jobs: int = 4
+    daemon_job_timeout: float = 600.0
+    daemon_job_history: int = 100
+    # 분산 모드: 임대 만료 시간(초), 작업당 최대 시도 횟수, 빈 frontier 폴링 주기(초)
+    frontier_visibility_timeout: float = 120.0
+    frontier_max_attempts: int = 3
+    frontier_poll_interval: float = 0.5
+    # 워커 프로세스 하나의 동시 작업 수, 클러스터 전체에서 지키는 호스트별 최소 요청 간격(초)
+    worker_concurrency: int = 8
+    host_request_interval: float = 1.0
+    # 요청 재시도: 최대 재시도 횟수, 지수 백오프 시작/최대 대기(초), 대기 시간 무작위 비율
+    fetch_max_retries: int = 2
+    fetch_retry_base_delay: float = 1.0
+    fetch_retry_max_delay: float = 30.0
+    fetch_retry_jitter: float = 0.5
+    # 호스트별 circuit breaker: 최근 요청 수 창, 판단 최소 요청 수, 실패 비율 임계값,
+    # open 유지 시간(초), 채널 작업을 미루는 최대 횟수 (넘으면 에러로 기록)
+    circuit_window: int = 20
+    circuit_min_requests: int = 5
+    circuit_error_threshold: float = 0.5
+    circuit_open_seconds: float = 30.0
+    circuit_max_deferrals: int = 3
+    # 호스트별 AIMD 동시 요청 제어: 사용 여부, 시작/최소/최대 상한, 감소 비율,
+    # 과부하로 보는 지연 시간 배수 (기준 지연 시간 대비). 채널별 동시 실행 상한이 최종 상한이다
+    adaptive_concurrency: bool = True
+    adaptive_initial_limit: int = 2
+    adaptive_min_limit: int = 1
+    adaptive_max_limit: int = 16
+    adaptive_backoff_ratio: float = 0.5
+    adaptive_latency_tolerance: float = 3.0
+    # 같은 페이지(정규화한 URL, 대기 선택자 기준)에 대한 동시 요청을 하나로 합칠지 여부
+    coalesce_requests: bool = True
+    # 요청 기록/재생: 모든 응답을 기록할 cassette 경로, 네트워크 대신 재생할 cassette 경로,
+    # 재생 시 기록된 응답 시간만큼 기다릴지 여부 (False면 최대한 빠르게 재생)
+    record_cassette: str | None = None
+    replay_cassette: str | None = None
+    replay_latency: bool = False
+    # 근접 중복 기사 처리: "off", "annotate"(군집 id만 표시), "drop"(중복 기사 제외),
+    # 같은 군집으로 볼 SimHash 지문의 최대 해밍 거리 (64비트 중)
+    dedup_mode: str = "off"
+    dedup_max_distance: int = 7
+    # 기사 URL별 본문 지문 DB 경로. 지정하면 이전 실행과 본문이 같은 기사는 내보내지 않는다
+    fingerprint_db: str | None = None
+    # 상세 페이지 생략: 항상 검색 결과 목록만으로 기사를 만들지 여부,
+    # 목록에 이 필드(title, url, snippet, published_at)가 모두 있으면 상세 페이지를 생략
+    listing_only: bool = False
+    listing_fields: list[str] = Field(default_factory=list)
+    # 키워드 묶음 검색: 여러 키워드를 OR 검색어 하나로 묶을 때 검색어 최대 길이 (0이면 묶지 않음).
+    # OR 검색을 지원하는 채널(naver_news)에만 적용된다
+    keyword_batch_max_length: int = 0
     browser: BrowserSettings = Field(default_factory=BrowserSettings)
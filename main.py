@@ -3,10 +3,7 @@ import asyncio
 import logging
 
 from config.logging import setup_logging
-from config.settings import CrawlerSettings
 from src.pipeline.channel_registry import get_available_channels
-from src.pipeline.orchestrator import CrawlOrchestrator
-from src.pipeline.result_writer import ResultWriter
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +15,8 @@ def parse_args() -> argparse.Namespace:
         "-k",
         "--keywords",
         nargs="+",
-        required=True,
-        help="검색 키워드",
+        default=None,
+        help="검색 키워드 (--serve, --schedule, --worker, --resume이 아니면 필수)",
     )
     parser.add_argument(
         "-c",
@@ -40,7 +37,153 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="출력 디렉토리",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="결과를 추가로 저장할 SQLite DB 경로 (FTS5 전문 검색 지원)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="daemon 모드: 클라이언트를 유지한 채 로컬 작업 API로 크롤링 요청을 받는다",
+    )
+    parser.add_argument("--host", default=None, help="daemon API 호스트 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=None, help="daemon API 포트 (기본: 8765)")
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="daemon API를 TCP 대신 Unix 소켓 경로로 연다",
+    )
+    parser.add_argument(
+        "--warm-browser",
+        action="store_true",
+        help="daemon 시작 시 브라우저를 미리 띄운다",
+    )
+    parser.add_argument(
+        "--schedule",
+        default=None,
+        metavar="SPEC",
+        help="주기 실행 모드: JSON 작업 명세의 키워드 그룹을 각자의 주기로 반복 크롤링한다",
+    )
+    parser.add_argument(
+        "--frontier",
+        default=None,
+        metavar="URL",
+        help="분산 모드 공유 frontier (sqlite:///경로 또는 redis://호스트:포트/DB?namespace=이름). "
+        "-k와 함께 쓰면 코디네이터로 동작한다",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="분산 모드 워커: --frontier의 작업을 처리한다 (중지할 때까지 새 작업을 기다린다)",
+    )
+    parser.add_argument(
+        "--exit-when-drained",
+        action="store_true",
+        help="--worker가 frontier의 작업을 모두 처리하면 종료한다 (코디네이터가 먼저 등록한 경우)",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="RUN_ID",
+        help="중단된 실행을 journal에서 이어서 실행한다 (같은 결과 파일에 기록)",
+    )
+    parser.add_argument(
+        "--no-journal",
+        action="store_true",
+        help="진행 상황을 journal에 기록하지 않는다 (중단되면 --resume으로 이어서 실행할 수 없다)",
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="PATH",
+        help="요청/대기/파싱/저장 구간을 Chrome trace-event JSON으로 기록한다 (Perfetto로 열기)",
+    )
+    parser.add_argument(
+        "--trace-sample",
+        type=float,
+        default=1.0,
+        metavar="RATE",
+        help="trace에 기록할 작업 비율 (0~1, 기본: 1.0). 운영 환경에서는 낮게 설정",
+    )
+    parser.add_argument(
+        "--record",
+        default=None,
+        metavar="PATH",
+        help="모든 요청의 응답(HTML)과 응답 시간을 cassette 파일(gzip JSON Lines)로 기록한다",
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="PATH",
+        help="네트워크 대신 cassette에 기록된 응답으로 크롤링한다 (요청 간격 대기 없음)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="--replay 시 기록된 응답 시간만큼 기다려 원래 지연 시간 분포를 재현한다",
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=["annotate", "drop"],
+        default=None,
+        help="근접 중복 기사(통신사 기사 전재 등)에 군집 id를 표시하거나(annotate) 제외한다(drop)",
+    )
+    parser.add_argument(
+        "--fingerprint-db",
+        default=None,
+        metavar="PATH",
+        help="기사 URL별 본문 지문 DB. 이전 실행과 본문이 같은 기사는 내보내지 않는다",
+    )
+    parser.add_argument(
+        "--listing-only",
+        action="store_true",
+        help="기사 상세 페이지를 요청하지 않고 검색 결과 목록(제목, URL, 요약, 날짜)만 저장한다",
+    )
+    parser.add_argument(
+        "--listing-fields",
+        nargs="+",
+        choices=["title", "url", "snippet", "published_at"],
+        default=None,
+        metavar="FIELD",
+        help="검색 결과 목록에 이 필드가 모두 있으면 상세 페이지를 생략한다 "
+        "(title, url, snippet, published_at)",
+    )
+    parser.add_argument(
+        "--keyword-batch-length",
+        type=int,
+        default=None,
+        metavar="N",
+        help="OR 검색을 지원하는 채널(naver_news)에서 키워드를 길이 N 이하의 OR 검색어로 묶어 "
+        "검색 페이지 요청을 줄인다",
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="채널 호스트의 DNS 조회, 연결, 브라우저 컨텍스트를 미리 준비하지 않는다",
+    )
+    args = parser.parse_args()
+    if args.keyword_batch_length is not None and args.keyword_batch_length < 1:
+        parser.error("--keyword-batch-length는 1 이상이어야 합니다")
+    if args.listing_only and args.listing_fields:
+        parser.error("--listing-only와 --listing-fields는 함께 쓸 수 없습니다")
+    if args.record and args.replay:
+        parser.error("--record와 --replay는 함께 쓸 수 없습니다")
+    if args.replay_latency and not args.replay:
+        parser.error("--replay-latency에는 --replay가 필요합니다")
+    if not 0.0 <= args.trace_sample <= 1.0:
+        parser.error("--trace-sample은 0과 1 사이여야 합니다")
+    if args.resume and args.no_journal:
+        parser.error("--resume과 --no-journal은 함께 쓸 수 없습니다")
+    if args.resume and args.keywords:
+        parser.error("--resume은 -k/--keywords와 함께 쓸 수 없습니다 (저장된 키워드를 사용)")
+    if args.worker and not args.frontier:
+        parser.error("--worker에는 --frontier가 필요합니다")
+    if args.exit_when_drained and not args.worker:
+        parser.error("--exit-when-drained에는 --worker가 필요합니다")
+    if not (args.serve or args.schedule or args.worker or args.resume) and not args.keywords:
+        parser.error("-k/--keywords는 필수입니다 (--serve, --schedule, --worker, --resume 제외)")
+    return args
 
 
 async def main() -> None:
@@ -48,27 +191,156 @@ async def main() -> None:
     args = parse_args()
     setup_logging()
 
+    if not args.trace:
+        await run(args)
+        return
+
+    from src.core.tracing import TRACER
+
+    TRACER.start(sample_rate=args.trace_sample)
+    try:
+        await run(args)
+    finally:
+        # 중단되거나 daemon을 종료해도 그때까지의 구간을 남긴다
+        TRACER.stop()
+        print(f"trace 파일: {TRACER.write(args.trace)}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """CLI 인자에 따라 실행 모드를 선택해 실행한다."""
+    # 무거운 의존성(pydantic, httpx 등)은 CLI 파싱 이후에 import한다.
+    # playwright는 동적 채널이 선택된 경우에만 오케스트레이터가 import한다.
+    from config.settings import CrawlerSettings
+    from src.pipeline.orchestrator import CrawlOrchestrator
+    from src.pipeline.result_writer import ResultWriter
+
     settings = CrawlerSettings()
 
     # CLI 인자로 설정 오버라이드
     overrides: dict = {}
     if args.max_pages is not None:
         overrides["max_pages"] = args.max_pages
+    if args.record:
+        overrides["record_cassette"] = args.record
+    if args.replay:
+        overrides["replay_cassette"] = args.replay
+        overrides["replay_latency"] = args.replay_latency
+        # 재생은 실제 사이트에 요청하지 않으므로 요청 간격(예의상 대기)을 두지 않는다
+        overrides["request_delay"] = 0.0
+    if args.dedup:
+        overrides["dedup_mode"] = args.dedup
+    if args.fingerprint_db:
+        overrides["fingerprint_db"] = args.fingerprint_db
+    if args.listing_only:
+        overrides["listing_only"] = True
+    if args.listing_fields:
+        overrides["listing_fields"] = args.listing_fields
+    if args.keyword_batch_length:
+        overrides["keyword_batch_max_length"] = args.keyword_batch_length
+    if args.no_warmup:
+        overrides["warmup_connections"] = 0
+    if args.no_journal:
+        overrides["journal"] = False
     if overrides:
         settings = settings.model_copy(update=overrides)
 
-    orchestrator = CrawlOrchestrator(settings)
-    results = await orchestrator.run(args.keywords, args.channels)
+    if args.serve:
+        from src.service.daemon import run_daemon
+
+        await run_daemon(
+            settings,
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            warm_browser=args.warm_browser,
+        )
+        return
 
     output_dir = args.output_dir or settings.output_dir
-    writer = ResultWriter(output_dir)
-    filepath = writer.write(results)
+
+    if args.schedule:
+        from src.service.periodic import PeriodicRunner, ScheduleSpec
+
+        spec = ScheduleSpec.from_file(args.schedule)
+        store = None
+        if args.db:
+            from src.pipeline.sqlite_store import SqliteStore
+
+            store = SqliteStore(args.db)
+        try:
+            async with CrawlOrchestrator(settings) as orchestrator:
+                runner = PeriodicRunner(orchestrator, spec, ResultWriter(output_dir), store)
+                await runner.run()
+        finally:
+            if store:
+                store.close()
+        return
+
+    if args.frontier:
+        from src.distributed.frontier import open_frontier
+
+        frontier = open_frontier(args.frontier)
+        try:
+            if args.worker:
+                from src.distributed.worker import FrontierWorker
+
+                worker = FrontierWorker(frontier, settings)
+                await worker.run(exit_when_drained=args.exit_when_drained)
+                return
+
+            from src.distributed.coordinator import Coordinator
+
+            results = await Coordinator(frontier, settings).run(args.keywords, args.channels)
+        finally:
+            await frontier.close()
+        filepath = ResultWriter(output_dir).write(results)
+    elif not settings.journal and not args.resume:
+        results = await CrawlOrchestrator(settings).run(args.keywords, args.channels)
+        filepath = ResultWriter(output_dir).write(results)
+    else:
+        from src.pipeline.journal import RunJournal
+
+        # 진행 상황을 journal에 기록하여 중단되면 --resume으로 이어서 실행한다
+        journal_dir = f"{output_dir}/journal"
+        if args.resume:
+            journal = RunJournal.load(journal_dir, args.resume)
+            if journal.state.finished:
+                print(f"이미 완료된 실행입니다. 결과 파일: {journal.state.output_path}")
+                return
+        else:
+            channels = args.channels or get_available_channels()
+            journal = RunJournal.create(journal_dir, args.keywords, channels, settings.max_pages)
+        print(f"실행 ID: {journal.run_id} (중단 시 --resume {journal.run_id})")
+
+        state = journal.state
+        orchestrator = CrawlOrchestrator(settings)
+        try:
+            results = await orchestrator.run(
+                state.keywords, state.channels, max_pages=state.max_pages, journal=journal
+            )
+        finally:
+            journal.close()
+
+        filepath = ResultWriter(output_dir).write(results, filename=f"crawl_{journal.run_id}.json")
+        journal.finish(filepath)
+
+    if args.db:
+        from src.pipeline.sqlite_store import SqliteStore
+
+        with SqliteStore(args.db) as store:
+            store.write(results)
+
+    # 단계별 요청/파싱 시간 등 지표 요약을 결과 파일 옆에 저장한다
+    from src.core.metrics import REGISTRY
+
+    metrics_path = REGISTRY.write_json(filepath.with_name(f"{filepath.stem}.metrics.json"))
 
     # 결과 요약 출력
     total_articles = sum(len(r.articles) for r in results)
     total_errors = sum(len(r.errors) for r in results)
     print(f"\n크롤링 완료! 기사 {total_articles}건, 에러 {total_errors}건")
     print(f"결과 파일: {filepath}")
+    print(f"지표 요약: {metrics_path}")
 
 
 if __name__ == "__main__":
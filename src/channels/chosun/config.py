@@ -1,15 +1,28 @@
 # 조선일보 크롤러 설정
 
+from src.shared.url_canonicalizer import UrlRules
+
 CHANNEL_NAME = "chosun"
 BASE_URL = "https://www.chosun.com"
 SEARCH_URL_TEMPLATE = (
     "https://www.chosun.com/nsearch/?query={keyword}&page={page}&siteid=www&sort=1"
 )
 
+# 실행 시작 시 연결을 미리 준비할 호스트 (검색 페이지와 기사 페이지가 같은 호스트)
+WARMUP_URLS = (BASE_URL,)
+
+# 기사는 경로로 구분하므로 쿼리 파라미터는 모두 지운다
+URL_RULES = UrlRules(
+    host_aliases={"chosun.com": "www.chosun.com", "m.chosun.com": "www.chosun.com"},
+    keep_params=frozenset(),
+    force_https=True,
+)
+
 # 검색 결과 페이지 선택자 (search-feed 내부만 선택)
 ARTICLE_LIST_SELECTOR = "div.search-feed div.story-card"
 ARTICLE_LINK_SELECTOR = "a.story-card__headline, a[href*='/article/']"
 ARTICLE_TITLE_SELECTOR = "a.story-card__headline, div.story-card__headline"
+ARTICLE_SNIPPET_SELECTOR = ".story-card__deck"
 
 # 기사 상세 페이지 선택자
 ARTICLE_CONTENT_SELECTOR = "section.article-body"
@@ -2,8 +2,8 @@
 
 import json
 import logging
+import re
 from datetime import datetime
-from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
@@ -12,13 +12,16 @@ from src.channels.chosun.config import (
     ARTICLE_DATE_SELECTOR,
     ARTICLE_LINK_SELECTOR,
     ARTICLE_LIST_SELECTOR,
+    ARTICLE_SNIPPET_SELECTOR,
     ARTICLE_TITLE_SELECTOR,
     BASE_URL,
     CHANNEL_NAME,
+    URL_RULES,
 )
 from src.core.exceptions import ParseError
 from src.core.models import Article, SearchResult
 from src.shared.text_cleaner import clean_text, extract_text_from_html
+from src.shared.url_canonicalizer import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,7 @@ def _extract_next_data(html: str) -> dict | None:
 def _parse_search_results_from_next_data(data: dict) -> list[SearchResult]:
     """__NEXT_DATA__ JSON에서 검색 결과 추출"""
     results: list[SearchResult] = []
+    seen_urls: set[str] = set()
 
     try:
         page_props = data.get("props", {}).get("pageProps", {})
@@ -52,19 +56,28 @@ def _parse_search_results_from_next_data(data: dict) -> list[SearchResult]:
             title = item.get("title", "").strip()
             url = item.get("url", "") or item.get("link", "")
             snippet = item.get("description", "") or item.get("snippet", "")
+            date_str = (
+                item.get("display_date", "")
+                or item.get("publishedAt", "")
+                or item.get("published_at", "")
+                or item.get("date", "")
+            )
 
             if not title or not url:
                 continue
 
-            # 상대 경로인 경우 절대 경로로 변환
-            if url.startswith("/"):
-                url = urljoin(BASE_URL, url)
+            # 상대 경로는 절대 경로로 바꾸고 정규화한 URL로 중복 제거
+            url = canonicalize_url(url, URL_RULES, base=BASE_URL)
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
 
             results.append(
                 SearchResult(
                     title=clean_text(title),
                     url=url,
                     snippet=clean_text(snippet),
+                    published_at=_parse_date(date_str) if date_str else None,
                 )
             )
     except (KeyError, TypeError, AttributeError) as e:
@@ -73,6 +86,25 @@ def _parse_search_results_from_next_data(data: dict) -> list[SearchResult]:
     return results
 
 
+# BeautifulSoup 없이 __NEXT_DATA__ JSON만 꺼낸다 (전체 건수만 필요할 때)
+_NEXT_DATA_SCRIPT = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+
+def parse_total_count(html: str) -> int | None:
+    """__NEXT_DATA__ 검색 결과의 전체 건수 (없으면 None)"""
+    match = _NEXT_DATA_SCRIPT.search(html)
+    if not match:
+        return None
+    try:
+        search_result = json.loads(match.group(1))["props"]["pageProps"]["searchResult"]
+        total = search_result.get("total") or search_result.get("totalCount")
+        return int(total) if total is not None else None
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
 def _parse_search_results_from_html(soup: BeautifulSoup) -> list[SearchResult]:
     """CSS 선택자 기반 검색 결과 파싱 (폴백)"""
     results: list[SearchResult] = []
@@ -90,7 +122,7 @@ def _parse_search_results_from_html(soup: BeautifulSoup) -> list[SearchResult]:
         if not href:
             continue
 
-        url = urljoin(BASE_URL, str(href))
+        url = canonicalize_url(str(href), URL_RULES, base=BASE_URL)
 
         # URL 중복 제거
         if url in seen_urls:
@@ -102,7 +134,9 @@ def _parse_search_results_from_html(soup: BeautifulSoup) -> list[SearchResult]:
         if not title:
             continue
 
-        results.append(SearchResult(title=title, url=url))
+        snippet_el = article.select_one(ARTICLE_SNIPPET_SELECTOR)
+        snippet = clean_text(snippet_el.get_text()) if snippet_el else ""
+        results.append(SearchResult(title=title, url=url, snippet=snippet))
 
     return results
 
@@ -131,6 +165,7 @@ def _parse_date(date_str: str) -> datetime | None:
     """날짜 문자열을 datetime으로 변환"""
     date_str = date_str.strip()
     formats = [
+        "%Y-%m-%dT%H:%M:%S.%f%z",
         "%Y-%m-%dT%H:%M:%S%z",
         "%Y-%m-%dT%H:%M:%S",
         "%Y-%m-%d %H:%M:%S",
@@ -1,5 +1,7 @@
 # 한겨레 채널 설정 상수
 
+from src.shared.url_canonicalizer import UrlRules
+
 CHANNEL_NAME = "hani"
 BASE_URL = "https://www.hani.co.kr"
 SEARCH_BASE_URL = "https://search.hani.co.kr"
@@ -8,6 +10,16 @@ SEARCH_URL_TEMPLATE = (
     "command=query&keyword={keyword}&media=news&sort=d&pageseq={page}"
 )
 
+# 실행 시작 시 연결을 미리 준비할 호스트 (검색 페이지, 기사 페이지)
+WARMUP_URLS = (SEARCH_BASE_URL, BASE_URL)
+
+# 기사는 /arti/.../{번호}.html 경로로 구분하므로 쿼리(_fr=sr1 등)는 모두 지운다
+URL_RULES = UrlRules(
+    host_aliases={"hani.co.kr": "www.hani.co.kr", "m.hani.co.kr": "www.hani.co.kr"},
+    keep_params=frozenset(),
+    force_https=True,
+)
+
 # 검색 결과는 JS 렌더링 → DynamicFetchStrategy 필요
 SEARCH_WAIT_SELECTOR = "div.search-inner"
 ARTICLE_LINK_PATTERN = "/arti/"
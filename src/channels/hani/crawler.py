@@ -2,20 +2,17 @@
 
 from urllib.parse import quote
 
-from config.settings import CrawlerSettings
-from src.channels.hani.config import CHANNEL_NAME, SEARCH_URL_TEMPLATE
-from src.channels.hani.parser import parse_article, parse_search_results
+from src.channels.hani.config import CHANNEL_NAME, SEARCH_URL_TEMPLATE, URL_RULES, WARMUP_URLS
+from src.channels.hani.parser import parse_article, parse_search_results, parse_total_count
 from src.core.base_crawler import BaseCrawler
-from src.core.fetch_strategy import FetchStrategy
-from src.core.models import Article, CrawlResult, SearchResult
+from src.core.models import Article, SearchResult
 
 
 class HaniCrawler(BaseCrawler):
     """한겨레 뉴스 크롤러 (DynamicFetchStrategy 사용 - 검색 페이지 JS 렌더링)"""
 
-    def __init__(self, fetch_strategy: FetchStrategy, settings: CrawlerSettings) -> None:
-        super().__init__(fetch_strategy, settings)
-        self._current_keyword: str = ""
+    url_rules = URL_RULES
+    warmup_urls = WARMUP_URLS
 
     @property
     def channel_name(self) -> str:
@@ -27,9 +24,8 @@ class HaniCrawler(BaseCrawler):
     def parse_article_list(self, html: str) -> list[SearchResult]:
         return parse_search_results(html)
 
-    def parse_article_detail(self, html: str, search_result: SearchResult) -> Article:
-        return parse_article(html, search_result, self._current_keyword)
+    def parse_total_count(self, html: str) -> int | None:
+        return parse_total_count(html)
 
-    async def crawl(self, keyword: str, max_pages: int | None = None) -> CrawlResult:
-        self._current_keyword = keyword
-        return await super().crawl(keyword, max_pages)
+    def parse_article_detail(self, html: str, search_result: SearchResult, keyword: str) -> Article:
+        return parse_article(html, search_result, keyword)
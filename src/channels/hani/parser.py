@@ -2,7 +2,6 @@
 
 import logging
 from datetime import datetime
-from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
@@ -11,10 +10,12 @@ from src.channels.hani.config import (
     ARTICLE_DATE_SELECTOR,
     ARTICLE_LINK_PATTERN,
     BASE_URL,
+    URL_RULES,
 )
 from src.core.exceptions import ParseError
 from src.core.models import Article, SearchResult
-from src.shared.text_cleaner import extract_text_from_html
+from src.shared.text_cleaner import extract_text_from_html, find_total_count
+from src.shared.url_canonicalizer import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +32,8 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if ARTICLE_LINK_PATTERN not in href:
             continue
 
-        # 절대 URL 보장
-        url = urljoin(BASE_URL, href) if not href.startswith("http") else href
+        # 절대 URL로 바꾸고 추적 파라미터 등을 정규화
+        url = canonicalize_url(href, URL_RULES, base=BASE_URL)
 
         # 중복 제거
         if url in seen_urls:
@@ -48,6 +49,11 @@ def parse_search_results(html: str) -> list[SearchResult]:
     return results
 
 
+def parse_total_count(html: str) -> int | None:
+    """검색 결과 페이지의 "총 N건" 표시에서 전체 검색 결과 수를 읽는다."""
+    return find_total_count(html)
+
+
 def _parse_date(soup: BeautifulSoup) -> datetime | None:
     """기사 날짜를 파싱한다. 실패 시 None 반환"""
     date_el = soup.select_one(ARTICLE_DATE_SELECTOR)
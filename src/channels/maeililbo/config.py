@@ -1,11 +1,26 @@
+from src.shared.url_canonicalizer import UrlRules
+
 CHANNEL_NAME = "maeililbo"
 BASE_URL = "https://www.m-i.kr"
 SEARCH_URL_TEMPLATE = "https://www.m-i.kr/news/articleList.html?sc_word={keyword}&page={page}"
 
+# 실행 시작 시 연결을 미리 준비할 호스트 (검색 페이지와 기사 페이지가 같은 호스트)
+WARMUP_URLS = (BASE_URL,)
+
+# 기사는 articleView.html?idxno={번호}로 구분한다
+URL_RULES = UrlRules(
+    host_aliases={"m-i.kr": "www.m-i.kr", "m.m-i.kr": "www.m-i.kr"},
+    keep_params=frozenset({"idxno"}),
+    force_https=True,
+)
+
 # 검색 결과 목록 셀렉터
 ARTICLE_LIST_SELECTOR = "li.clearfix"
 ARTICLE_LINK_SELECTOR = "div.auto-titles a[href*='articleView']"
 ARTICLE_TITLE_SELECTOR = "div.auto-titles a"
+ARTICLE_SNIPPET_SELECTOR = "p.lead, p.auto-sums"
+# 목록의 "기자명 | 2024.01.15 10:30" 표시
+ARTICLE_LIST_DATE_SELECTOR = "span.byline em, div.auto-dated"
 
 # 기사 상세 페이지 셀렉터
 ARTICLE_CONTENT_SELECTOR = "div#article-view-content-div"
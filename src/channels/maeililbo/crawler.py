@@ -1,19 +1,20 @@
 from urllib.parse import quote
 
-from config.settings import CrawlerSettings
-from src.channels.maeililbo.config import CHANNEL_NAME, SEARCH_URL_TEMPLATE
-from src.channels.maeililbo.parser import parse_article, parse_search_results
+from src.channels.maeililbo.config import CHANNEL_NAME, SEARCH_URL_TEMPLATE, URL_RULES, WARMUP_URLS
+from src.channels.maeililbo.parser import (
+    parse_article,
+    parse_search_results,
+    parse_total_count,
+)
 from src.core.base_crawler import BaseCrawler
-from src.core.fetch_strategy import FetchStrategy
-from src.core.models import Article, CrawlResult, SearchResult
+from src.core.models import Article, SearchResult
 
 
 class MaeililboCrawler(BaseCrawler):
     """매일일보 크롤러 (StaticFetchStrategy 사용)"""
 
-    def __init__(self, fetch_strategy: FetchStrategy, settings: CrawlerSettings) -> None:
-        super().__init__(fetch_strategy, settings)
-        self._current_keyword: str = ""
+    url_rules = URL_RULES
+    warmup_urls = WARMUP_URLS
 
     @property
     def channel_name(self) -> str:
@@ -26,10 +27,8 @@ class MaeililboCrawler(BaseCrawler):
     def parse_article_list(self, html: str) -> list[SearchResult]:
         return parse_search_results(html)
 
-    def parse_article_detail(self, html: str, search_result: SearchResult) -> Article:
-        return parse_article(html, search_result, keyword=self._current_keyword)
+    def parse_total_count(self, html: str) -> int | None:
+        return parse_total_count(html)
 
-    async def crawl(self, keyword: str, max_pages: int | None = None) -> CrawlResult:
-        """키워드를 인스턴스에 저장한 후 크롤링을 실행한다."""
-        self._current_keyword = keyword
-        return await super().crawl(keyword, max_pages)
+    def parse_article_detail(self, html: str, search_result: SearchResult, keyword: str) -> Article:
+        return parse_article(html, search_result, keyword=keyword)
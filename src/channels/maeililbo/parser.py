@@ -1,20 +1,24 @@
 import logging
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from src.channels.maeililbo.config import (
     ARTICLE_CONTENT_SELECTOR,
     ARTICLE_DATE_SELECTOR,
     ARTICLE_LINK_SELECTOR,
+    ARTICLE_LIST_DATE_SELECTOR,
     ARTICLE_LIST_SELECTOR,
+    ARTICLE_SNIPPET_SELECTOR,
     ARTICLE_TITLE_SELECTOR,
     BASE_URL,
     CHANNEL_NAME,
+    URL_RULES,
 )
 from src.core.exceptions import ParseError
 from src.core.models import Article, SearchResult
-from src.shared.text_cleaner import extract_text_from_html
+from src.shared.text_cleaner import extract_text_from_html, find_total_count
+from src.shared.url_canonicalizer import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,7 @@ def parse_search_results(html: str) -> list[SearchResult]:
     soup = BeautifulSoup(html, "lxml")
     items = soup.select(ARTICLE_LIST_SELECTOR)
     results: list[SearchResult] = []
+    seen_urls: set[str] = set()
 
     for item in items:
         link_tag = item.select_one(ARTICLE_LINK_SELECTOR)
@@ -34,8 +39,11 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if not href:
             continue
 
-        # 상대 URL 처리
-        url = href if href.startswith("http") else f"{BASE_URL}{href}"
+        # 상대 URL 처리와 정규화 (정규화한 URL로 중복 제거)
+        url = canonicalize_url(str(href), URL_RULES, base=BASE_URL)
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
 
         # 제목 추출
         title_tag = item.select_one(ARTICLE_TITLE_SELECTOR)
@@ -44,11 +52,41 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if not title:
             continue
 
-        results.append(SearchResult(title=title, url=url))
+        snippet_tag = item.select_one(ARTICLE_SNIPPET_SELECTOR)
+        results.append(
+            SearchResult(
+                title=title,
+                url=url,
+                snippet=snippet_tag.get_text(strip=True) if snippet_tag else "",
+                published_at=_parse_list_date(item),
+            )
+        )
 
     return results
 
 
+def parse_total_count(html: str) -> int | None:
+    """검색 결과 페이지의 "총 N건" 표시에서 전체 검색 결과 수를 읽는다."""
+    return find_total_count(html)
+
+
+def _parse_date_text(date_str: str) -> datetime | None:
+    for fmt in ("%Y.%m.%d %H:%M", "%Y.%m.%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_list_date(item: Tag) -> datetime | None:
+    """검색 결과 항목의 발행일 (기자명 등 날짜가 아닌 항목은 건너뛴다)"""
+    for el in item.select(ARTICLE_LIST_DATE_SELECTOR):
+        if published_at := _parse_date_text(el.get_text(strip=True)):
+            return published_at
+    return None
+
+
 def _parse_date(soup: BeautifulSoup) -> datetime | None:
     """기사 상세 페이지에서 발행일을 파싱한다."""
     date_items = soup.select(ARTICLE_DATE_SELECTOR)
@@ -57,12 +95,8 @@ def _parse_date(soup: BeautifulSoup) -> datetime | None:
         text = item.get_text(strip=True)
         # "승인 2024.01.15 10:30" 같은 형식 처리
         if "승인" in text:
-            date_str = text.replace("승인", "").strip()
-            for fmt in ("%Y.%m.%d %H:%M", "%Y.%m.%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
+            if published_at := _parse_date_text(text.replace("승인", "").strip()):
+                return published_at
 
     return None
 
@@ -1,13 +1,27 @@
 # 매일경제 채널 설정 상수
 
+from src.shared.url_canonicalizer import UrlRules
+
 CHANNEL_NAME = "mk"
 BASE_URL = "https://www.mk.co.kr"
 SEARCH_URL_TEMPLATE = "https://www.mk.co.kr/search?word={keyword}&page={page}"
 
+# 실행 시작 시 연결을 미리 준비할 호스트 (검색 페이지와 기사 페이지가 같은 호스트)
+WARMUP_URLS = (BASE_URL,)
+
+# 기사는 /news/{분야}/{번호} 경로로 구분하므로 쿼리는 모두 지운다
+URL_RULES = UrlRules(
+    host_aliases={"mk.co.kr": "www.mk.co.kr", "m.mk.co.kr": "www.mk.co.kr"},
+    keep_params=frozenset(),
+    force_https=True,
+)
+
 # 검색 결과 페이지 CSS 선택자
 ARTICLE_LIST_SELECTOR = "li.news_node"
 ARTICLE_LINK_SELECTOR = "a[href*='/news/']"
 ARTICLE_TITLE_SELECTOR = "a[href*='/news/']"
+ARTICLE_SNIPPET_SELECTOR = "p.news_desc"
+ARTICLE_LIST_DATE_SELECTOR = "p.time_info, span.time_info"
 
 # 기사 상세 페이지 CSS 선택자
 ARTICLE_CONTENT_SELECTOR = "div.news_cnt_detail_wrap"
@@ -1,12 +1,12 @@
 from datetime import datetime
-from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
 from src.channels.mk import config
 from src.core.exceptions import ParseError
 from src.core.models import Article, SearchResult
-from src.shared.text_cleaner import clean_text, extract_text_from_html
+from src.shared.text_cleaner import clean_text, extract_text_from_html, find_total_count
+from src.shared.url_canonicalizer import canonicalize_url
 
 
 def parse_search_results(html: str) -> list[SearchResult]:
@@ -14,6 +14,7 @@ def parse_search_results(html: str) -> list[SearchResult]:
     soup = BeautifulSoup(html, "lxml")
     items = soup.select(config.ARTICLE_LIST_SELECTOR)
     results: list[SearchResult] = []
+    seen_urls: set[str] = set()
 
     for item in items:
         link_tag = item.select_one(config.ARTICLE_LINK_SELECTOR)
@@ -24,8 +25,11 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if not href:
             continue
 
-        # 상대 경로인 경우 절대 URL로 변환
-        url = urljoin(config.BASE_URL, str(href))
+        # 상대 경로는 절대 URL로 바꾸고 정규화한 URL로 중복 제거
+        url = canonicalize_url(str(href), config.URL_RULES, base=config.BASE_URL)
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
 
         title_tag = item.select_one(config.ARTICLE_TITLE_SELECTOR)
         title = clean_text(title_tag.get_text()) if title_tag else ""
@@ -33,28 +37,51 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if not title:
             continue
 
-        results.append(SearchResult(title=title, url=url))
+        snippet_tag = item.select_one(config.ARTICLE_SNIPPET_SELECTOR)
+        date_tag = item.select_one(config.ARTICLE_LIST_DATE_SELECTOR)
+        results.append(
+            SearchResult(
+                title=title,
+                url=url,
+                snippet=clean_text(snippet_tag.get_text()) if snippet_tag else "",
+                published_at=_parse_date_text(date_tag.get_text()) if date_tag else None,
+            )
+        )
 
     return results
 
 
+def parse_total_count(html: str) -> int | None:
+    """검색 결과 페이지의 "총 N건" 표시에서 전체 검색 결과 수를 읽는다."""
+    return find_total_count(html)
+
+
+def _parse_date_text(date_text: str) -> datetime | None:
+    date_text = clean_text(date_text)
+    # "입력 : 2026.02.16 18:02" 같은 접두사 제거
+    if ":" in date_text and not date_text[0].isdigit():
+        date_text = date_text.split(":", 1)[-1].strip()
+    for fmt in (
+        "%Y.%m.%d %H:%M:%S",
+        "%Y.%m.%d %H:%M",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d",
+        "%Y.%m.%d",
+    ):
+        try:
+            return datetime.strptime(date_text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def _parse_date(soup: BeautifulSoup) -> datetime | None:
     """기사 발행일 파싱 (실패 시 None 반환)"""
     try:
         date_el = soup.select_one(config.ARTICLE_DATE_SELECTOR)
         if not date_el:
             return None
-
-        date_text = clean_text(date_el.get_text())
-        # "입력 : 2026.02.16 18:02" 같은 접두사 제거
-        if ":" in date_text and not date_text[0].isdigit():
-            date_text = date_text.split(":", 1)[-1].strip()
-        for fmt in ("%Y.%m.%d %H:%M:%S", "%Y.%m.%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
-                continue
-        return None
+        return _parse_date_text(date_el.get_text())
     except Exception:
         return None
 
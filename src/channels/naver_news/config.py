@@ -1,15 +1,33 @@
 # 네이버 뉴스 채널 설정 상수
 
+import re
+
+from src.shared.url_canonicalizer import UrlRules
+
 CHANNEL_NAME = "naver_news"
 BASE_URL = "https://news.naver.com"
 SEARCH_URL_TEMPLATE = (
     "https://search.naver.com/search.naver?where=news&query={keyword}&start={start}&sort=1"
 )
 
+# 실행 시작 시 연결을 미리 준비할 호스트 (검색 페이지, 기사 페이지)
+WARMUP_URLS = ("https://search.naver.com", "https://n.news.naver.com")
+
+# 기사는 언론사 번호/기사 번호로 구분한다. 모바일 주소와 /article/ 경로는 /mnews/article/로,
+# 분야 파라미터(sid 등)는 지운다 (구 형식 read.naver?oid=&aid=는 두 파라미터만 남긴다)
+URL_RULES = UrlRules(
+    host_aliases={"m.news.naver.com": "n.news.naver.com"},
+    keep_params=frozenset({"oid", "aid"}),
+    path_rewrites=((re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)/?$"), r"/mnews/article/\1/\2"),),
+    force_https=True,
+)
+
 # 검색 결과 페이지 CSS 선택자
 # 2026년 기준 SDS 컴포넌트 구조로 변경됨
 NAVER_NEWS_LINK_SELECTOR = "a[href*='n.news.naver.com']"
 NEWS_CONTAINER_DEPTH = 4
+# 요약: 이전 구조의 요약 선택자 (SDS 구조에서는 제목과 같은 원문 링크의 두 번째 텍스트)
+NEWS_SNIPPET_SELECTOR = "div.news_dsc, a.api_txt_lines.dsc_txt_wrap"
 
 # 기사 상세 페이지 CSS 선택자 (n.news.naver.com)
 ARTICLE_CONTENT_SELECTOR = "article#dic_area"
@@ -1,4 +1,5 @@
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
 
 from bs4 import BeautifulSoup, Tag
 
@@ -6,6 +7,7 @@ from src.channels.naver_news import config
 from src.core.exceptions import ParseError
 from src.core.models import Article, SearchResult
 from src.shared.text_cleaner import clean_text, extract_text_from_html
+from src.shared.url_canonicalizer import canonicalize_url
 
 
 def _find_news_container(element: Tag, depth: int = 4) -> Tag | None:
@@ -34,6 +36,34 @@ def _find_title_in_container(container: Tag) -> tuple[str, str] | None:
     return None
 
 
+def _find_snippet_in_container(container: Tag, title: str, href: str) -> str:
+    """제목과 같은 원문으로 연결되는 다른 링크의 텍스트를 요약으로 사용한다."""
+    for a_tag in container.select("a[href]"):
+        if str(a_tag.get("href", "")) == href:
+            text = clean_text(a_tag.get_text())
+            if text and text != title:
+                return text
+    snippet_el = container.select_one(config.NEWS_SNIPPET_SELECTOR)
+    return clean_text(snippet_el.get_text()) if snippet_el else ""
+
+
+_RELATIVE_DATE = re.compile(r"^(\d+)(분|시간|일|주) 전$")
+_RELATIVE_UNITS = {"분": "minutes", "시간": "hours", "일": "days", "주": "weeks"}
+
+
+def _parse_list_date(container: Tag, now: datetime | None = None) -> datetime | None:
+    """검색 결과의 발행일 표시("3시간 전", "2024.01.15.")를 datetime으로 바꾼다."""
+    for text in container.stripped_strings:
+        if match := _RELATIVE_DATE.match(text):
+            delta = timedelta(**{_RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+            return (now or datetime.now()) - delta
+        try:
+            return datetime.strptime(text, "%Y.%m.%d.")
+        except ValueError:
+            continue
+    return None
+
+
 def parse_search_results(html: str) -> list[SearchResult]:
     """네이버 뉴스 검색 결과 목록 파싱
 
@@ -46,8 +76,11 @@ def parse_search_results(html: str) -> list[SearchResult]:
     seen_urls: set[str] = set()
 
     for link in naver_links:
-        naver_url = str(link.get("href", ""))
-        if not naver_url or naver_url in seen_urls:
+        href = str(link.get("href", ""))
+        if not href:
+            continue
+        naver_url = canonicalize_url(href, config.URL_RULES)
+        if naver_url in seen_urls:
             continue
 
         container = _find_news_container(link, config.NEWS_CONTAINER_DEPTH)
@@ -58,9 +91,16 @@ def parse_search_results(html: str) -> list[SearchResult]:
         if title_info is None:
             continue
 
-        title, _ = title_info
+        title, original_url = title_info
         seen_urls.add(naver_url)
-        results.append(SearchResult(title=title, url=naver_url))
+        results.append(
+            SearchResult(
+                title=title,
+                url=naver_url,
+                snippet=_find_snippet_in_container(container, title, original_url),
+                published_at=_parse_list_date(container),
+            )
+        )
 
     return results
 
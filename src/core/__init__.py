@@ -1,12 +1,13 @@
 from src.core.base_crawler import BaseCrawler
 from src.core.exceptions import CrawlerError, FetchError, ParseError
 from src.core.fetch_strategy import DynamicFetchStrategy, FetchStrategy, StaticFetchStrategy
-from src.core.models import Article, CrawlResult, SearchResult
+from src.core.models import Article, CrawlEvent, CrawlResult, SearchResult
 from src.core.retry import retry
 
 __all__ = [
     "Article",
     "BaseCrawler",
+    "CrawlEvent",
     "CrawlResult",
     "CrawlerError",
     "DynamicFetchStrategy",
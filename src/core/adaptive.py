@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from src.core.exceptions import FetchError
+from src.core.fetch_strategy import FetchStrategy
+from src.core.tracing import TRACER
+
+if TYPE_CHECKING:
+    from config.settings import CrawlerSettings
+
+logger = logging.getLogger(__name__)
+
+# 호스트 과부하 신호로 보는 HTTP 상태 코드
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# 지연 시간 기준선(EWMA) 갱신 비율
+_LATENCY_ALPHA = 0.1
+
+
+def is_overload(exc: FetchError) -> bool:
+    """타임아웃/연결 오류(응답 없음)나 429/5xx 과부하 응답인지 확인한다."""
+    return exc.status_code is None or exc.status_code in OVERLOAD_STATUS_CODES
+
+
+class AimdLimiter:
+    """호스트 하나의 동시 요청 수를 AIMD로 조절하는 limiter
+
+    - 정상 응답이면 상한을 `1 / 상한`씩 올린다 (상한만큼 성공할 때마다 +1). 슬롯을 점유할 때
+      상한까지 차 있던(포화) 요청만 올린다. 한가할 때의 성공은 상한을 더 써도 되는지
+      알려주지 않으므로, 부하 없이 상한만 커졌다가 몰릴 때 한꺼번에 요청하지 않게 한다.
+    - 과부하 신호(타임아웃, 429/5xx, 지연 시간 급증)가 오면 상한에 `backoff_ratio`를 곱한다.
+      같은 혼잡으로 연달아 실패한 요청 때문에 여러 번 줄지 않도록, 줄인 뒤 기준 지연
+      시간이 지나기 전의 과부하 신호는 무시한다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 3.0,
+    ) -> None:
+        self.host = host
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._baseline: float | None = None
+        self._last_decrease = float("-inf")
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return max(int(self._limit), self._min_limit)
+
+    async def acquire(self) -> bool:
+        """동시 요청 수가 상한 아래로 내려갈 때까지 기다린 뒤 슬롯을 점유한다.
+
+        점유한 뒤 동시 요청 수가 상한에 닿았으면(포화) True를 반환한다.
+        """
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # 깨어난 직후 취소되었으면 다음 대기자에게 기회를 넘긴다
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        return self.in_flight >= self.limit
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float, saturated: bool) -> None:
+        """정상 응답을 반영한다. `saturated`는 이 요청의 `acquire()` 반환값이다."""
+        baseline = self._baseline
+        # 사이트가 계속 느려진 경우에도 기준선이 따라가도록 급증한 값도 반영한다
+        self._baseline = (
+            latency if baseline is None else baseline + _LATENCY_ALPHA * (latency - baseline)
+        )
+        if baseline is not None and latency > baseline * self._latency_tolerance:
+            self._decrease(f"지연 시간 급증 {latency:.2f}초")
+            return
+        if not saturated:
+            return
+        previous = self.limit
+        self._limit = min(self._limit + 1 / self._limit, float(self._max_limit))
+        if self.limit != previous:
+            logger.debug("[%s] 동시 요청 상한 증가: %d → %d", self.host, previous, self.limit)
+            self._wake()
+
+    def on_overload(self, reason: str) -> None:
+        self._decrease(reason)
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline or 1.0):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(self._limit * self._backoff_ratio, float(self._min_limit))
+        logger.info(
+            "[%s] 동시 요청 상한 감소: %d → %d (%s)", self.host, previous, self.limit, reason
+        )
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        for waiter in self._waiters:
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class AdaptiveConcurrency:
+    """호스트별 AIMD limiter를 만들고 보관한다 (오케스트레이터 세션당 하나)"""
+
+    def __init__(self, settings: "CrawlerSettings") -> None:
+        self._settings = settings
+        self._limiters: dict[str, AimdLimiter] = {}
+
+    def for_url(self, url: str) -> AimdLimiter:
+        host = urlsplit(url).hostname or ""
+        if host not in self._limiters:
+            s = self._settings
+            self._limiters[host] = AimdLimiter(
+                host,
+                initial_limit=s.adaptive_initial_limit,
+                min_limit=s.adaptive_min_limit,
+                max_limit=s.adaptive_max_limit,
+                backoff_ratio=s.adaptive_backoff_ratio,
+                latency_tolerance=s.adaptive_latency_tolerance,
+            )
+        return self._limiters[host]
+
+    def limits(self) -> dict[str, int]:
+        """호스트별 현재 동시 요청 상한"""
+        return {host: limiter.limit for host, limiter in self._limiters.items()}
+
+
+class AdaptiveFetchStrategy(FetchStrategy):
+    """호스트별 동시 요청 수를 AIMD로 제한하는 fetch 전략 래퍼
+
+    요청 한 번(재시도 포함 시 시도 한 번)마다 호스트 슬롯을 점유하고, 응답 지연 시간과
+    과부하 신호로 해당 호스트의 상한을 조절한다.
+    """
+
+    def __init__(self, inner: FetchStrategy, concurrency: AdaptiveConcurrency) -> None:
+        self._inner = inner
+        self._concurrency = concurrency
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up(urls, connections)
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        limiter = self._concurrency.for_url(url)
+        if limiter.in_flight >= limiter.limit:
+            with TRACER.span("host_slot_wait", "wait", host=limiter.host, limit=limiter.limit):
+                saturated = await limiter.acquire()
+        else:
+            saturated = await limiter.acquire()
+        started = time.monotonic()
+        try:
+            html = await self._inner.fetch(url, wait_selector=wait_selector)
+        except FetchError as e:
+            if is_overload(e):
+                limiter.on_overload(f"HTTP {e.status_code}" if e.status_code else "응답 없음")
+            raise
+        finally:
+            limiter.release()
+        limiter.on_success(time.monotonic() - started, saturated)
+        return html
@@ -1,21 +1,53 @@
 import asyncio
 import logging
+import math
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
-from config.settings import CrawlerSettings
 from src.core.exceptions import CrawlerError
 from src.core.fetch_strategy import FetchStrategy
-from src.core.models import Article, CrawlResult, SearchResult
+from src.core.metrics import (
+    DOWNLOADED_BYTES,
+    FETCH_SECONDS,
+    PARSE_SECONDS,
+    count_response_bytes,
+    request_labels,
+)
+from src.core.models import Article, CrawlEvent, CrawlResult, SearchResult
+from src.core.tracing import TRACER
+from src.shared.text_cleaner import content_fingerprint
+from src.shared.url_canonicalizer import DEFAULT_RULES, UrlRules, resolve_canonical_url
+
+if TYPE_CHECKING:
+    from config.settings import CrawlerSettings
 
 logger = logging.getLogger(__name__)
 
+# 검색 결과 목록(SearchResult)만으로 채울 수 있는 필드
+LISTING_FIELDS = ("title", "url", "snippet", "published_at")
+
 
 class BaseCrawler(ABC):
     """크롤러 기본 클래스 (Template Method 패턴)"""
 
-    def __init__(self, fetch_strategy: FetchStrategy, settings: CrawlerSettings) -> None:
+    # DynamicFetchStrategy 사용 시 렌더링 완료를 판단할 대기 선택자
+    search_wait_selector: str | None = None
+    detail_wait_selector: str | None = None
+    # 기사 URL 정규화 규칙 (채널 config의 URL_RULES)
+    url_rules: UrlRules = DEFAULT_RULES
+    # 여러 키워드를 한 번에 검색할 때 쓰는 OR 연산자 (None이면 채널이 지원하지 않음)
+    keyword_or_operator: str | None = None
+    # 실행 시작 시 연결을 미리 준비할 호스트 URL (채널 config의 WARMUP_URLS)
+    warmup_urls: tuple[str, ...] = ()
+
+    def __init__(self, fetch_strategy: FetchStrategy, settings: "CrawlerSettings") -> None:
         self._fetch_strategy = fetch_strategy
         self._settings = settings
+        # crawl_iter의 다음 요청 가능 시각 (time.monotonic 기준)
+        self._next_request_at = 0.0
 
     @property
     @abstractmethod
@@ -31,46 +63,237 @@ class BaseCrawler(ABC):
         """검색 결과 목록 파싱"""
 
     @abstractmethod
-    def parse_article_detail(self, html: str, search_result: SearchResult) -> Article:
+    def parse_article_detail(self, html: str, search_result: SearchResult, keyword: str) -> Article:
         """기사 상세 페이지 파싱"""
 
-    async def crawl(self, keyword: str, max_pages: int | None = None) -> CrawlResult:
-        """전체 크롤링 흐름 실행"""
-        pages = max_pages or self._settings.max_pages
-        result = CrawlResult(channel=self.channel_name, keyword=keyword)
+    def batch_keywords(
+        self, keywords: list[str], max_length: int
+    ) -> list[tuple[str, tuple[str, ...]]]:
+        """키워드를 OR 검색어 길이가 `max_length` 이하가 되도록 묶어 (검색어, 묶음) 목록을 반환한다.
 
-        for page in range(1, pages + 1):
-            url = self.build_search_url(keyword, page)
-            logger.info("[%s] 검색 페이지 %d 요청: %s", self.channel_name, page, url)
-
-            try:
-                html = await self._fetch_strategy.fetch(url)
-                search_results = self.parse_article_list(html)
-            except CrawlerError as e:
-                error_msg = f"페이지 {page} 검색 실패: {e}"
-                logger.warning(error_msg)
-                result.errors.append(error_msg)
+        공백이 있는 키워드는 따옴표로 감싸 구(phrase)로 검색한다. 키워드 하나짜리 묶음의
+        검색어는 키워드 그대로이며, 채널이 OR 검색을 지원하지 않으면 모두 하나짜리 묶음이다.
+        """
+        operator = self.keyword_or_operator
+        if not operator or max_length <= 0:
+            return [(keyword, (keyword,)) for keyword in keywords]
+        groups: list[list[str]] = []
+        length = 0
+        for keyword in keywords:
+            term_length = len(keyword) + (2 if " " in keyword else 0)
+            if groups and length + len(operator) + term_length <= max_length:
+                groups[-1].append(keyword)
+                length += len(operator) + term_length
+            else:
+                groups.append([keyword])
+                length = term_length
+        batches = []
+        for group in groups:
+            if len(group) == 1:
+                batches.append((group[0], (group[0],)))
                 continue
+            terms = [f'"{keyword}"' if " " in keyword else keyword for keyword in group]
+            batches.append((operator.join(terms), tuple(group)))
+        return batches
+
+    def parse_total_count(self, html: str) -> int | None:
+        """검색 결과 1페이지에 표시된 전체 검색 결과 수 (채널이 표시하지 않으면 None)"""
+        return None
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """`warmup_urls` 호스트에 대한 연결(DNS, TCP, TLS 또는 브라우저 컨텍스트)을 미리 연다."""
+        if not self.warmup_urls:
+            return
+        with TRACER.span("warm_up", "fetch", channel=self.channel_name):
+            await self._fetch_strategy.warm_up(list(self.warmup_urls), connections)
+
+    async def fetch_search_page(self, keyword: str, page: int) -> list[SearchResult]:
+        """검색 페이지 하나를 가져와 검색 결과 목록을 반환한다."""
+        search_results, _ = await self.fetch_search_listing(keyword, page)
+        return search_results
+
+    async def fetch_search_listing(
+        self, keyword: str, page: int
+    ) -> tuple[list[SearchResult], int | None]:
+        """검색 페이지 하나를 가져와 (검색 결과 목록, 검색 가능한 페이지 수)를 반환한다.
+
+        페이지 수는 1페이지에서 전체 검색 결과 수와 1페이지의 결과 수로 계산하며,
+        채널이 전체 결과 수를 표시하지 않거나 1페이지가 아니면 None이다.
+        """
+        url = self.build_search_url(keyword, page)
+        logger.info("[%s] 검색 페이지 %d 요청: %s", self.channel_name, page, url)
+        html = await self._fetch(url, "search", self.search_wait_selector)
+        labels = self._metric_labels("search")
+        with TRACER.span("parse", "parse", url=url, **labels), PARSE_SECONDS.time(**labels):
+            search_results = self.parse_article_list(html)
+            total = self.parse_total_count(html) if page == 1 else None
+        if total is None:
+            return search_results, None
+        if not search_results:
+            return search_results, 1
+        return search_results, math.ceil(total / len(search_results))
+
+    async def fetch_article(self, search_result: SearchResult, keyword: str) -> Article:
+        """기사 상세 페이지 하나를 가져와 Article을 반환한다."""
+        html = await self._fetch(search_result.url, "detail", self.detail_wait_selector)
+        labels = self._metric_labels("detail")
+        with (
+            TRACER.span("parse", "parse", url=search_result.url, **labels),
+            PARSE_SECONDS.time(**labels),
+        ):
+            article = self.parse_article_detail(html, search_result, keyword)
+            article.content_hash = content_fingerprint(article.title, article.content)
+        # 페이지가 선언한 대표 URL(rel=canonical, og:url)을 기사 URL로 쓴다
+        article.url = resolve_canonical_url(article.url, html, self.url_rules)
+        if article.url != search_result.url:
+            article.metadata["listing_url"] = search_result.url
+        return article
+
+    def listing_article(self, search_result: SearchResult, keyword: str) -> Article | None:
+        """상세 페이지를 생략해도 되면 검색 결과 항목만으로 만든 Article을 반환한다.
+
+        `listing_only` 설정이면 항상, `listing_fields` 설정이면 그 필드가 목록에 모두 있을 때
+        생략한다. 본문 대신 요약(snippet)을 담고 `metadata["listing_only"]`를 표시한다.
+        """
+        fields = self._settings.listing_fields
+        if not self._settings.listing_only and not (
+            fields
+            and set(fields) <= set(LISTING_FIELDS)
+            and all(getattr(search_result, field) for field in fields)
+        ):
+            return None
+        article = Article(
+            title=search_result.title,
+            url=search_result.url,
+            content=search_result.snippet,
+            published_at=search_result.published_at,
+            channel=self.channel_name,
+            keyword=keyword,
+            metadata={"listing_only": True},
+        )
+        article.content_hash = content_fingerprint(article.title, article.content)
+        return article
+
+    async def _fetch(self, url: str, stage: str, wait_selector: str | None) -> str:
+        """fetch 전략으로 페이지를 가져오며 요청 시간과 내려받은 크기를 기록한다.
 
-            for sr in search_results:
-                await asyncio.sleep(self._settings.request_delay)
+        크기는 HTTP 클라이언트가 읽은 본문 바이트 수를 쓰고, 알려주지 않는 전략(브라우저,
+        cassette 재생 등)이면 HTML을 UTF-8로 인코딩한 크기로 대신한다.
+        """
+        labels = self._metric_labels(stage)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with (
+                TRACER.span("fetch", "fetch", url=url, **labels),
+                request_labels(channel=labels["channel"], strategy=labels["strategy"]),
+                count_response_bytes() as received,
+            ):
+                html = await self._fetch_strategy.fetch(url, wait_selector=wait_selector)
+            outcome = "ok"
+        finally:
+            FETCH_SECONDS.observe(time.perf_counter() - started, outcome=outcome, **labels)
+        size = received.total if received.reported else len(html.encode())
+        DOWNLOADED_BYTES.inc(size, **labels)
+        return html
 
+    def _metric_labels(self, stage: str) -> dict[str, str]:
+        return {
+            "channel": self.channel_name,
+            "strategy": getattr(self._fetch_strategy, "name", "custom"),
+            "stage": stage,
+        }
+
+    async def crawl_iter(
+        self, keyword: str, max_pages: int | None = None
+    ) -> AsyncIterator[CrawlEvent]:
+        """크롤링 흐름을 실행하며 기사와 에러를 발생 즉시 yield한다.
+
+        1페이지에서 검색 가능한 페이지 수를 알아낸 뒤 나머지 검색 페이지는 요청 간격을
+        지키며 미리 요청해 두므로, 검색 결과 발견에 걸리는 왕복은 페이지 수와 관계없이
+        약 두 번이다.
+        """
+        # 같은 키워드로 생성되는 수많은 Article이 문자열 하나를 공유하도록 intern
+        keyword = sys.intern(keyword)
+        pages = max_pages or self._settings.max_pages
+        article_count = 0
+        error_count = 0
+
+        listings = {1: asyncio.create_task(self._paced_search_listing(keyword, 1))}
+        try:
+            for page in range(1, pages + 1):
+                if page not in listings:
+                    break
                 try:
-                    detail_html = await self._fetch_strategy.fetch(sr.url)
-                    article = self.parse_article_detail(detail_html, sr)
-                    result.articles.append(article)
-                    logger.info("[%s] 기사 수집 완료: %s", self.channel_name, sr.title)
+                    search_results, available = await listings.pop(page)
                 except CrawlerError as e:
-                    error_msg = f"기사 수집 실패 ({sr.url}): {e}"
+                    error_msg = f"페이지 {page} 검색 실패: {e}"
                     logger.warning(error_msg)
-                    result.errors.append(error_msg)
+                    error_count += 1
+                    yield CrawlEvent(self.channel_name, keyword, error=error_msg)
+                    search_results, available = [], None
 
-            await asyncio.sleep(self._settings.request_delay)
+                if page == 1:
+                    last_page = min(pages, available) if available else pages
+                    for next_page in range(2, last_page + 1):
+                        listings[next_page] = asyncio.create_task(
+                            self._paced_search_listing(keyword, next_page)
+                        )
+
+                for sr in search_results:
+                    if article := self.listing_article(sr, keyword):
+                        article_count += 1
+                        yield CrawlEvent(self.channel_name, keyword, article=article)
+                        continue
+
+                    await self._wait_turn()
+                    try:
+                        article = await self.fetch_article(sr, keyword)
+                    except CrawlerError as e:
+                        error_msg = f"기사 수집 실패 ({sr.url}): {e}"
+                        logger.warning(error_msg)
+                        error_count += 1
+                        yield CrawlEvent(self.channel_name, keyword, error=error_msg)
+                        continue
+
+                    logger.info("[%s] 기사 수집 완료: %s", self.channel_name, sr.title)
+                    article_count += 1
+                    yield CrawlEvent(self.channel_name, keyword, article=article)
+        finally:
+            for task in listings.values():
+                task.cancel()
+            await asyncio.gather(*listings.values(), return_exceptions=True)
 
         logger.info(
             "[%s] 크롤링 완료: 기사 %d건, 에러 %d건",
             self.channel_name,
-            len(result.articles),
-            len(result.errors),
+            article_count,
+            error_count,
         )
+
+    async def _paced_search_listing(
+        self, keyword: str, page: int
+    ) -> tuple[list[SearchResult], int | None]:
+        await self._wait_turn()
+        return await self.fetch_search_listing(keyword, page)
+
+    async def _wait_turn(self) -> None:
+        """다음 요청 시각을 `request_delay` 간격으로 예약하고 그때까지 기다린다.
+
+        동시에 진행 중인 요청(미리 요청하는 검색 페이지 등)이 있어도 요청 시작 간격은
+        `request_delay` 이상으로 유지된다.
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        self._next_request_at = slot + self._settings.request_delay
+        if slot > now:
+            with TRACER.span("sleep", "sleep", channel=self.channel_name, reason="request_delay"):
+                await asyncio.sleep(slot - now)
+
+    async def crawl(self, keyword: str, max_pages: int | None = None) -> CrawlResult:
+        """전체 크롤링 흐름 실행"""
+        result = CrawlResult(channel=self.channel_name, keyword=keyword)
+
+        async for event in self.crawl_iter(keyword, max_pages):
+            event.apply_to(result)
         return result
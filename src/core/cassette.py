@@ -0,0 +1,157 @@
+import asyncio
+import gzip
+import json
+import logging
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.core.exceptions import FetchError
+from src.core.fetch_strategy import FetchStrategy
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+@dataclass(slots=True)
+class CassetteEntry:
+    """요청 한 번의 기록: 응답 HTML 또는 실패 정보와 걸린 시간(초)"""
+
+    url: str
+    elapsed: float
+    html: str | None = None
+    error: str | None = None
+    status_code: int | None = None
+    retry_after: float | None = None
+
+    def to_json(self) -> str:
+        # 값이 없는 필드는 생략해 파일 크기를 줄인다
+        return json.dumps(
+            {k: v for k, v in asdict(self).items() if v is not None}, ensure_ascii=False
+        )
+
+
+class CassetteWriter:
+    """요청 기록을 gzip JSON Lines 파일에 순서대로 추가한다.
+
+    첫 줄은 헤더(`{"version": 1}`)이고 이후 한 줄에 요청 하나를 기록한다.
+    중간에 중단되어 파일 끝이 잘려도 `Cassette.load`는 읽을 수 있는 데까지 사용한다.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._file.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        self.count = 0
+
+    def append(self, entry: CassetteEntry) -> None:
+        self._file.write(entry.to_json() + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            logger.info("cassette 저장: %s (요청 %d건)", self.path, self.count)
+
+
+class Cassette:
+    """기록된 요청을 URL별로 모아 재생 순서대로 돌려준다.
+
+    같은 URL을 여러 번 기록했으면(재시도 등) 기록 순서대로 돌려주고, 다 쓰면 마지막
+    기록을 반복한다.
+    """
+
+    def __init__(self, entries: list[CassetteEntry]) -> None:
+        self._entries: dict[str, list[CassetteEntry]] = {}
+        for entry in entries:
+            self._entries.setdefault(entry.url, []).append(entry)
+        self._cursors: dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        entries: list[CassetteEntry] = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"지원하지 않는 cassette 형식입니다: {path}")
+            try:
+                for line in f:
+                    entries.append(CassetteEntry(**json.loads(line)))
+            except (EOFError, zlib.error, json.JSONDecodeError):
+                logger.warning(
+                    "cassette 끝이 잘려 있습니다: %s (%d건까지 사용)", path, len(entries)
+                )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def next(self, url: str) -> CassetteEntry | None:
+        entries = self._entries.get(url)
+        if not entries:
+            return None
+        cursor = self._cursors.get(url, 0)
+        self._cursors[url] = cursor + 1
+        return entries[min(cursor, len(entries) - 1)]
+
+
+class RecordingFetchStrategy(FetchStrategy):
+    """감싼 전략의 응답(실패 포함)과 걸린 시간을 cassette에 기록하는 fetch 전략 래퍼"""
+
+    def __init__(self, inner: FetchStrategy, writer: CassetteWriter) -> None:
+        self._inner = inner
+        self._writer = writer
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up(urls, connections)
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        started = time.perf_counter()
+        try:
+            html = await self._inner.fetch(url, wait_selector=wait_selector)
+        except FetchError as e:
+            self._writer.append(
+                CassetteEntry(
+                    url=url,
+                    elapsed=round(time.perf_counter() - started, 4),
+                    error=str(e),
+                    status_code=e.status_code,
+                    retry_after=e.retry_after,
+                )
+            )
+            raise
+        self._writer.append(
+            CassetteEntry(url=url, elapsed=round(time.perf_counter() - started, 4), html=html)
+        )
+        return html
+
+
+class ReplayFetchStrategy(FetchStrategy):
+    """cassette에 기록된 응답을 네트워크 없이 돌려주는 fetch 전략
+
+    `latency`가 True면 기록된 응답 시간만큼 기다려 원래 지연 시간 분포를 재현하고,
+    False면 바로 응답한다. 기록에 없는 URL은 404로 실패시킨다 (재시도하지 않는다).
+    `name`은 기록 당시 채널 전략 이름("static"/"dynamic")으로 지정해 지표 라벨을 맞춘다.
+    """
+
+    def __init__(self, cassette: Cassette, name: str = "custom", latency: bool = False) -> None:
+        self._cassette = cassette
+        self.name = name
+        self._latency = latency
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        entry = self._cassette.next(url)
+        if entry is None:
+            raise FetchError(f"cassette에 없는 URL: {url}", status_code=404)
+        if self._latency:
+            await asyncio.sleep(entry.elapsed)
+        if entry.error is not None:
+            raise FetchError(entry.error, entry.status_code, entry.retry_after)
+        return entry.html or ""
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+
+from src.core.fetch_strategy import FetchStrategy
+from src.core.metrics import (
+    COALESCED_REQUESTS,
+    ResponseBytes,
+    count_response_bytes,
+    record_response_bytes,
+)
+from src.core.tracing import TRACER
+from src.shared.url_canonicalizer import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# (전략 이름, 대표 URL, 대기 선택자)
+_Key = tuple[str, str, str | None]
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[tuple[str, ResponseBytes]]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class InFlightRequests:
+    """진행 중인 요청을 키별로 하나만 실행하고 결과를 함께 기다리게 하는 저장소
+    (single-flight, 오케스트레이터 세션당 하나)
+
+    요청은 별도 태스크에서 실행하므로 처음 요청한 호출자가 취소되어도 함께 기다리는
+    호출자는 영향을 받지 않는다. 기다리는 호출자가 모두 취소되면 요청도 취소한다.
+    결과는 요청이 끝나면 바로 버리므로 캐시가 아니다 (끝난 뒤의 요청은 다시 가져온다).
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[_Key, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def run(self, key: _Key, fetch: Callable[[], Awaitable[str]]) -> str:
+        flight = self._flights.get(key)
+        wait = nullcontext()
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(self._measured(fetch)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            COALESCED_REQUESTS.inc(strategy=key[0])
+            logger.debug("진행 중인 요청과 합침: %s", key[1])
+            wait = TRACER.span("coalesced_wait", "wait", url=key[1])
+        flight.waiters += 1
+        try:
+            with wait:
+                html, received = await asyncio.shield(flight.task)
+        finally:
+            self._leave(flight)
+        # 함께 기다린 호출자도 각자 받은 것으로 본문 크기를 알린다
+        if received.reported:
+            record_response_bytes(received.total)
+        return html
+
+    @staticmethod
+    async def _measured(fetch: Callable[[], Awaitable[str]]) -> tuple[str, ResponseBytes]:
+        with count_response_bytes() as received:
+            return await fetch(), received
+
+    @staticmethod
+    def _leave(flight: _Flight) -> None:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            flight.task.cancel()
+
+    def _forget(self, key: _Key, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # 기다리던 호출자가 모두 취소된 뒤 실패한 요청의 예외는 아무도 꺼내지 않는다
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+
+class CoalescingFetchStrategy(FetchStrategy):
+    """같은 페이지에 대한 동시 요청을 하나로 합치는 fetch 전략 래퍼
+
+    여러 키워드에서 나온 같은 기사나 겹치는 작업의 같은 검색 페이지를 동시에 요청하면
+    실제 요청(재시도 포함)은 한 번만 보내고 HTML을 함께 쓴다. 키는 전략 이름, 정규화한
+    URL, 대기 선택자이다. 브라우저 렌더링처럼 비싼 요청에서 효과가 크다.
+    """
+
+    def __init__(self, inner: FetchStrategy, inflight: InFlightRequests) -> None:
+        self._inner = inner
+        self._inflight = inflight
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up(urls, connections)
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        key = (self.name, canonicalize_url(url), wait_selector)
+        return await self._inflight.run(
+            key, lambda: self._inner.fetch(url, wait_selector=wait_selector)
+        )
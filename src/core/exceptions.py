@@ -3,7 +3,30 @@ class CrawlerError(Exception):
 
 
 class FetchError(CrawlerError):
-    """페이지 가져오기 실패"""
+    """페이지 가져오기 실패
+
+    HTTP 응답을 받은 경우 상태 코드와 Retry-After(초)를 함께 전달한다.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(FetchError):
+    """호스트의 circuit breaker가 열려 요청하지 않고 즉시 실패"""
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            f"circuit open: {host} ({retry_after:.0f}초 후 재개)", retry_after=retry_after
+        )
+        self.host = host
 
 
 class ParseError(CrawlerError):
@@ -1,42 +1,81 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from src.core.exceptions import FetchError
-from src.shared.browser_client import BrowserClient
-from src.shared.http_client import HttpClient
+from src.core.retry import parse_retry_after
+
+# 클라이언트 모듈은 httpx/playwright를 import하므로 타입 검사 시에만 가져온다
+if TYPE_CHECKING:
+    from src.shared.browser_client import BrowserClient
+    from src.shared.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
 
 
+def _response_info(exc: Exception) -> dict:
+    """클라이언트 예외에서 HTTP 상태 코드와 Retry-After를 꺼낸다."""
+    if isinstance(exc, FetchError):
+        return {"status_code": exc.status_code, "retry_after": exc.retry_after}
+    # httpx.HTTPStatusError (httpx를 import하지 않도록 속성으로 판별)
+    response = getattr(exc, "response", None)
+    if response is not None and hasattr(response, "status_code"):
+        return {
+            "status_code": response.status_code,
+            "retry_after": parse_retry_after(response.headers.get("retry-after")),
+        }
+    return {}
+
+
 class FetchStrategy(ABC):
     """페이지 가져오기 전략 인터페이스"""
 
+    # 지표 라벨에 쓰는 전략 이름 (래퍼는 감싼 전략의 이름을 그대로 쓴다)
+    name = "custom"
+
     @abstractmethod
     async def fetch(self, url: str, wait_selector: str | None = None) -> str:
         """URL에서 HTML을 가져온다"""
 
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        """첫 요청 전에 URL 호스트에 대한 연결을 미리 준비한다 (기본: 아무것도 하지 않음).
+
+        래퍼는 감싼 전략에 그대로 넘긴다.
+        """
+
 
 class StaticFetchStrategy(FetchStrategy):
     """httpx 기반 정적 페이지 가져오기"""
 
-    def __init__(self, http_client: HttpClient) -> None:
+    name = "static"
+
+    def __init__(self, http_client: "HttpClient") -> None:
         self._client = http_client
 
     async def fetch(self, url: str, wait_selector: str | None = None) -> str:
         try:
             return await self._client.get(url)
         except Exception as e:
-            raise FetchError(f"정적 페이지 가져오기 실패: {url}") from e
+            raise FetchError(f"정적 페이지 가져오기 실패: {url}", **_response_info(e)) from e
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._client.warm_up(urls, connections)
 
 
 class DynamicFetchStrategy(FetchStrategy):
     """playwright 기반 동적 페이지 가져오기"""
 
-    def __init__(self, browser_client: BrowserClient) -> None:
+    name = "dynamic"
+
+    def __init__(self, browser_client: "BrowserClient") -> None:
         self._client = browser_client
 
     async def fetch(self, url: str, wait_selector: str | None = None) -> str:
         try:
             return await self._client.get(url, wait_selector=wait_selector)
         except Exception as e:
-            raise FetchError(f"동적 페이지 가져오기 실패: {url}") from e
+            raise FetchError(f"동적 페이지 가져오기 실패: {url}", **_response_info(e)) from e
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        # 브라우저는 페이지마다 컨텍스트를 쓰므로 호스트별로 동시에 쓸 컨텍스트를 미리 만든다
+        await self._client.warm_up(urls, connections)
@@ -0,0 +1,327 @@
+import json
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+# 요청 지연 시간(초) 히스토그램 구간
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 파싱/큐 대기처럼 짧은 구간
+FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, value in sorted(self._values.items()):
+            yield self.name, self._labels(key), value
+
+    def summary(self) -> list[dict]:
+        return [
+            {"labels": self._labels(key), "value": value}
+            for key, value in sorted(self._values.items())
+        ]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class _HistogramValue:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        # 마지막 칸은 +Inf 구간
+        self.counts = [0] * (size + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """고정 구간 히스토그램 (Prometheus 누적 bucket 형식으로 출력)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+        self._values: dict[tuple[str, ...], _HistogramValue] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        hist = self._values.get(key)
+        if hist is None:
+            hist = self._values[key] = _HistogramValue(len(self.buckets))
+        hist.counts[bisect_left(self.buckets, value)] += 1
+        hist.sum += value
+        hist.count += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """블록 실행 시간을 기록한다 (예외가 나도 기록)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        hist = self._values.get(self._key(labels))
+        return hist.count if hist else 0
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, hist in sorted(self._values.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), hist.counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound is math.inf else _format_value(bound)
+                yield f"{self.name}_bucket", {**labels, "le": le}, cumulative
+            yield f"{self.name}_sum", labels, hist.sum
+            yield f"{self.name}_count", labels, hist.count
+
+    def summary(self) -> list[dict]:
+        return [
+            {
+                "labels": self._labels(key),
+                "count": hist.count,
+                "sum": round(hist.sum, 6),
+                "avg": round(hist.sum / hist.count, 6) if hist.count else 0.0,
+                "p50": self._quantile(hist, 0.5),
+                "p95": self._quantile(hist, 0.95),
+                "p99": self._quantile(hist, 0.99),
+            }
+            for key, hist in sorted(self._values.items())
+        ]
+
+    def _quantile(self, hist: _HistogramValue, q: float) -> float | None:
+        """분위수가 속한 구간의 상한 (+Inf 구간이면 None)"""
+        target = q * hist.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, hist.counts, strict=False):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return None
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class MetricsRegistry:
+    """프로세스 단위 지표 저장소
+
+    Prometheus 텍스트 형식(daemon `/metrics`)과 JSON 요약(CLI 실행 결과 옆 파일)으로 내보낸다.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            metric.name: {"type": metric.type_name, "help": metric.help, "values": values}
+            for metric in self._metrics.values()
+            if (values := metric.summary())
+        }
+
+    def write_json(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.summary(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 현재 요청을 보낸 크롤러의 라벨 (전략 래퍼, 공유 클라이언트의 지표에 붙인다)
+_request_labels: ContextVar[dict[str, str] | None] = ContextVar("request_labels", default=None)
+
+
+@contextmanager
+def request_labels(**labels: str) -> Iterator[None]:
+    """블록 안에서 보내는 요청의 지표 라벨(채널, fetch 전략)을 정한다."""
+    token = _request_labels.set(labels)
+    try:
+        yield
+    finally:
+        _request_labels.reset(token)
+
+
+def current_request_labels(*names: str) -> dict[str, str]:
+    """`request_labels`로 정한 라벨 중 `names` (정하지 않았으면 빈 문자열)"""
+    labels = _request_labels.get() or {}
+    return {name: labels.get(name, "") for name in names}
+
+
+class ResponseBytes:
+    """`count_response_bytes` 블록 안에서 fetch 전략이 알린 응답 본문 크기"""
+
+    __slots__ = ("total", "reported")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.reported = False
+
+
+# 현재 요청에서 받은 응답 본문 크기 (HTTP 클라이언트가 읽은 바이트 수를 알린다)
+_response_bytes: ContextVar[ResponseBytes | None] = ContextVar("response_bytes", default=None)
+
+
+@contextmanager
+def count_response_bytes() -> Iterator[ResponseBytes]:
+    """블록 안에서 보내는 요청(재시도 포함)이 받은 본문 크기를 모은다."""
+    received = ResponseBytes()
+    token = _response_bytes.set(received)
+    try:
+        yield received
+    finally:
+        _response_bytes.reset(token)
+
+
+def record_response_bytes(size: int) -> None:
+    """읽은 응답 본문 크기를 현재 `count_response_bytes` 블록에 알린다 (블록 밖이면 무시)."""
+    received = _response_bytes.get()
+    if received is not None:
+        received.total += size
+        received.reported = True
+
+
+REGISTRY = MetricsRegistry()
+
+FETCH_SECONDS = REGISTRY.histogram(
+    "crawler_fetch_seconds",
+    "페이지 요청 시간 (재시도 포함)",
+    ("channel", "strategy", "stage", "outcome"),
+)
+PARSE_SECONDS = REGISTRY.histogram(
+    "crawler_parse_seconds",
+    "HTML 파싱 시간",
+    ("channel", "strategy", "stage"),
+    buckets=FAST_BUCKETS,
+)
+DOWNLOADED_BYTES = REGISTRY.counter(
+    "crawler_downloaded_bytes_total",
+    "내려받은 HTML 크기 (응답 본문 바이트, 전략이 알리지 않으면 UTF-8 인코딩 크기)",
+    ("channel", "strategy", "stage"),
+)
+FETCH_RETRIES = REGISTRY.counter(
+    "crawler_fetch_retries_total",
+    "요청 재시도 횟수 (재시도하게 만든 HTTP 상태 코드, 응답이 없으면 none)",
+    ("channel", "strategy", "status"),
+)
+BROWSER_RENDER_SECONDS = REGISTRY.histogram(
+    "crawler_browser_render_seconds",
+    "브라우저 페이지 이동(domcontentloaded)까지 걸린 시간",
+    ("channel", "strategy", "host"),
+)
+BROWSER_WAIT_SECONDS = REGISTRY.histogram(
+    "crawler_browser_wait_seconds",
+    "렌더링 완료(대기 선택자) 대기 시간",
+    ("channel", "strategy", "host"),
+)
+OVERSIZE_PAGES = REGISTRY.counter(
+    "crawler_oversize_pages_total",
+    "본문 크기 상한을 넘어 앞부분만 사용한 응답 수",
+    ("host",),
+)
+COALESCED_REQUESTS = REGISTRY.counter(
+    "crawler_coalesced_requests_total",
+    "진행 중인 같은 요청에 합쳐져 보내지 않은 요청 수",
+    ("strategy",),
+)
+BATCHED_SEARCH_SAVED = REGISTRY.counter(
+    "crawler_batched_search_saved_total",
+    "키워드 묶음 검색으로 줄인 검색 페이지 요청 수 (키워드마다 검색할 때 대비)",
+    ("channel",),
+)
+QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "crawler_queue_wait_seconds",
+    "작업이 스케줄러 큐에서 대기한 시간",
+    ("channel", "kind"),
+    buckets=FAST_BUCKETS + (10.0, 30.0, 60.0),
+)
+TIME_TO_FIRST_ARTICLE = REGISTRY.histogram(
+    "crawler_time_to_first_article_seconds",
+    "실행 시작(크롤러 생성 전)부터 첫 기사를 내보내기까지 걸린 시간",
+    ("warmup",),
+)
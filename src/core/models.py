@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -14,14 +15,34 @@ class Article(BaseModel):
     keyword: str
     crawled_at: datetime = Field(default_factory=datetime.now)
     metadata: dict = Field(default_factory=dict)
+    # 제목+본문 지문 (`content_fingerprint`). 크롤러가 상세 페이지를 파싱할 때 채운다
+    content_hash: str = ""
 
+    @property
+    def url_keys(self) -> tuple[str, ...]:
+        """이 기사를 가리키는 URL (대표 URL과, 다르면 검색 결과 목록의 URL)
 
-class SearchResult(BaseModel):
-    """검색 결과 항목"""
+        상세 페이지가 선언한 대표 URL(`rel=canonical`)이 목록 URL과 다르면
+        `metadata["listing_url"]`에 목록 URL이 남는다. 이미 수집했는지 목록 URL로
+        판정하는 곳(재개, 주기 실행)은 두 URL을 모두 기록한다.
+        """
+        listing_url = self.metadata.get("listing_url")
+        return (self.url, listing_url) if listing_url else (self.url,)
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """검색 결과 항목
+
+    검색 페이지 파싱 루프에서 대량으로 생성되고 출력에는 포함되지 않으므로
+    pydantic 검증 없이 가벼운 slots dataclass로 둔다.
+    """
 
     title: str
     url: str
     snippet: str = ""
+    # 검색 결과 목록에 표시된 발행일 (채널이 제공하는 경우)
+    published_at: datetime | None = None
 
 
 class CrawlResult(BaseModel):
@@ -31,3 +52,42 @@ class CrawlResult(BaseModel):
     keyword: str
     articles: list[Article] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CrawlEvent:
+    """크롤링 도중 발생한 기사 수집 또는 에러 이벤트
+
+    스트리밍 API(`crawl_iter`, `run_iter`)가 발생 즉시 전달하는 단위이다.
+    """
+
+    channel: str
+    keyword: str
+    article: Article | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화 가능한 dict로 변환한다 (스트리밍 응답용)."""
+        data: dict = {"channel": self.channel, "keyword": self.keyword}
+        if self.article is not None:
+            data["type"] = "article"
+            data["article"] = self.article.model_dump(mode="json")
+        else:
+            data["type"] = "error"
+            data["error"] = self.error
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CrawlEvent":
+        """`to_dict()`로 직렬화된 이벤트를 복원한다."""
+        if data["type"] == "article":
+            article = Article.model_validate(data["article"])
+            return cls(data["channel"], data["keyword"], article=article)
+        return cls(data["channel"], data["keyword"], error=data["error"])
+
+    def apply_to(self, result: CrawlResult) -> None:
+        """이벤트를 CrawlResult에 누적한다."""
+        if self.article is not None:
+            result.articles.append(self.article)
+        if self.error is not None:
+            result.errors.append(self.error)
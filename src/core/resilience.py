@@ -0,0 +1,185 @@
+import logging
+import time
+from collections import deque
+from enum import StrEnum
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.core.fetch_strategy import FetchStrategy
+from src.core.metrics import FETCH_RETRIES, current_request_labels
+from src.core.retry import is_retryable, retry
+
+if TYPE_CHECKING:
+    from config.settings import CrawlerSettings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """호스트 하나의 circuit breaker
+
+    - closed: 최근 `window`건 중 `min_requests`건 이상이고 실패 비율이 `error_threshold`
+      이상이면 open으로 전환한다.
+    - open: `open_seconds`(Retry-After가 더 길면 그 시간) 동안 요청하지 않고 즉시 실패한다.
+    - half-open: open 시간이 지나면 요청 1건만 통과시켜 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        window: int = 20,
+        min_requests: int = 5,
+        error_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+    ) -> None:
+        self.host = host
+        self._min_requests = min_requests
+        self._error_threshold = error_threshold
+        self._open_seconds = open_seconds
+        # 최근 요청 결과 (True = 실패)
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._open_until = 0.0
+        self._state = CircuitState.CLOSED
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and time.monotonic() >= self._open_until:
+            self._state = CircuitState.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_request(self) -> None:
+        """요청해도 되는지 확인하고, 안 되면 CircuitOpenError를 발생시킨다."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        remaining = max(self._open_until - time.monotonic(), 0.0)
+        # half-open 확인 요청이 진행 중이면 결과가 나올 때까지 잠시 뒤로 미룬다
+        raise CircuitOpenError(self.host, remaining or 1.0)
+
+    def record_success(self) -> None:
+        if self._state is CircuitState.HALF_OPEN:
+            logger.info("circuit closed: %s (확인 요청 성공)", self.host)
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+        self._probing = False
+        self._outcomes.append(False)
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        self._probing = False
+        self._outcomes.append(True)
+        if self._state is CircuitState.HALF_OPEN:
+            self._open(retry_after)
+            return
+        failures = sum(self._outcomes)
+        if (
+            len(self._outcomes) >= self._min_requests
+            and failures / len(self._outcomes) >= self._error_threshold
+        ):
+            self._open(retry_after)
+
+    def release(self) -> None:
+        """결과 없이 끝난 요청(취소 등)의 half-open 확인 슬롯을 반납한다."""
+        self._probing = False
+
+    def _open(self, retry_after: float | None) -> None:
+        duration = max(self._open_seconds, retry_after or 0.0)
+        self._state = CircuitState.OPEN
+        self._open_until = time.monotonic() + duration
+        self._outcomes.clear()
+        logger.warning("circuit open: %s (%.0f초 동안 요청 중단)", self.host, duration)
+
+
+class CircuitBreakerRegistry:
+    """호스트별 circuit breaker를 만들고 보관한다 (오케스트레이터 세션당 하나)"""
+
+    def __init__(self, settings: "CrawlerSettings") -> None:
+        self._settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).hostname or ""
+        if host not in self._breakers:
+            s = self._settings
+            self._breakers[host] = CircuitBreaker(
+                host,
+                window=s.circuit_window,
+                min_requests=s.circuit_min_requests,
+                error_threshold=s.circuit_error_threshold,
+                open_seconds=s.circuit_open_seconds,
+            )
+        return self._breakers[host]
+
+    def states(self) -> dict[str, CircuitState]:
+        return {host: breaker.state for host, breaker in self._breakers.items()}
+
+
+class ResilientFetchStrategy(FetchStrategy):
+    """재시도와 호스트별 circuit breaker를 적용하는 fetch 전략 래퍼
+
+    연결 오류, 타임아웃, 429/5xx만 지수 백오프(jitter 포함)로 재시도하고 breaker에
+    실패로 기록한다. 404 같은 4xx는 호스트가 정상 응답한 것이므로 바로 실패시킨다.
+    """
+
+    def __init__(
+        self,
+        inner: FetchStrategy,
+        breakers: CircuitBreakerRegistry,
+        settings: "CrawlerSettings",
+    ) -> None:
+        self._inner = inner
+        self._breakers = breakers
+        self._fetch_with_retry = retry(
+            max_retries=settings.fetch_max_retries,
+            base_delay=settings.fetch_retry_base_delay,
+            max_delay=settings.fetch_retry_max_delay,
+            jitter=settings.fetch_retry_jitter,
+            should_retry=is_retryable,
+            on_retry=self._count_retry,
+        )(self._attempt)
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up(urls, connections)
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        return await self._fetch_with_retry(url, wait_selector)
+
+    def _count_retry(self, exc: Exception) -> None:
+        status = getattr(exc, "status_code", None)
+        FETCH_RETRIES.inc(
+            **current_request_labels("channel"),
+            strategy=self.name,
+            status=str(status) if status else "none",
+        )
+
+    async def _attempt(self, url: str, wait_selector: str | None) -> str:
+        breaker = self._breakers.for_url(url)
+        breaker.before_request()
+        try:
+            html = await self._inner.fetch(url, wait_selector=wait_selector)
+        except FetchError as e:
+            if is_retryable(e):
+                breaker.record_failure(e.retry_after)
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return html
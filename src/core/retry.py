@@ -1,21 +1,69 @@
 import asyncio
 import functools
 import logging
+import random
 from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
-from src.core.exceptions import FetchError
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.core.tracing import TRACER
 
 logger = logging.getLogger(__name__)
 
+# 잠시 후 다시 요청하면 성공할 수 있는 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환한다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def is_retryable(exc: Exception) -> bool:
+    """재시도할 가치가 있는 실패인지 분류한다.
+
+    - 응답을 받지 못한 실패(연결 오류, 타임아웃)와 429/5xx 등은 재시도한다.
+    - 404 같은 나머지 4xx와 circuit open은 다시 요청해도 같은 결과이므로 재시도하지 않는다.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, FetchError):
+        return exc.status_code is None or exc.status_code in RETRYABLE_STATUS_CODES
+    return False
+
 
 def retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
     backoff_factor: float = 2.0,
     retry_on: tuple[type[Exception], ...] = (FetchError,),
+    max_delay: float | None = None,
+    jitter: float = 0.0,
+    should_retry: Callable[[Exception], bool] | None = None,
+    on_retry: Callable[[Exception], None] | None = None,
 ) -> Callable:
-    """지수 백오프 재시도 async 데코레이터"""
+    """지수 백오프 재시도 async 데코레이터
+
+    - `jitter`: 대기 시간을 ±비율만큼 무작위로 흔들어 동시에 실패한 요청이 한꺼번에
+      재시도하지 않게 한다.
+    - 예외에 `retry_after`(초)가 있으면 백오프보다 짧게 기다리지 않는다.
+      `max_delay`보다 길면 더 기다리지 않고 예외를 그대로 발생시킨다.
+    - `should_retry`가 False를 반환하는 예외는 재시도하지 않는다.
+    - `on_retry`는 재시도하기 직전에 실패 예외와 함께 호출된다 (지표 기록용).
+    """
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -27,8 +75,25 @@ def retry(
                     return await func(*args, **kwargs)
                 except retry_on as e:
                     last_exception = e
+                    if should_retry and not should_retry(e):
+                        raise
                     if attempt < max_retries:
                         delay = base_delay * (backoff_factor**attempt)
+                        if jitter:
+                            delay *= random.uniform(1 - jitter, 1 + jitter)
+                        retry_after = getattr(e, "retry_after", None)
+                        if retry_after is not None:
+                            if max_delay is not None and retry_after > max_delay:
+                                logger.warning(
+                                    "Retry-After %.0f초 > 최대 대기 %.0f초, 재시도 중단 (%s)",
+                                    retry_after,
+                                    max_delay,
+                                    e,
+                                )
+                                raise
+                            delay = max(delay, retry_after)
+                        if max_delay is not None:
+                            delay = min(delay, max_delay)
                         logger.warning(
                             "재시도 %d/%d (%s), %.1f초 후 재시도",
                             attempt + 1,
@@ -36,7 +101,10 @@ def retry(
                             e,
                             delay,
                         )
-                        await asyncio.sleep(delay)
+                        if on_retry:
+                            on_retry(e)
+                        with TRACER.span("sleep", "sleep", reason="retry_backoff", attempt=attempt):
+                            await asyncio.sleep(delay)
 
             raise last_exception  # type: ignore[misc]
 
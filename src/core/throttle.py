@@ -0,0 +1,30 @@
+from collections.abc import Awaitable, Callable
+
+from src.core.fetch_strategy import FetchStrategy
+
+# URL을 받아 그 호스트에 요청해도 될 때까지 기다리는 함수
+HostThrottle = Callable[[str], Awaitable[None]]
+
+
+class ThrottledFetchStrategy(FetchStrategy):
+    """요청 시도마다 호스트 요청 간격 대기 함수를 거치게 하는 fetch 전략 래퍼
+
+    재시도 래퍼 안쪽에 씌우므로 재시도 요청도 각각 대기한다 (분산 워커의 클러스터 전체
+    호스트별 요청 간격 등). 동시성 제어 바깥이므로 대기하는 동안 호스트 슬롯을 점유하지
+    않고, 대기 시간이 응답 지연 시간에 섞이지 않는다.
+    """
+
+    def __init__(self, inner: FetchStrategy, throttle: HostThrottle) -> None:
+        self._inner = inner
+        self._throttle = throttle
+
+    @property
+    def name(self) -> str:
+        return self._inner.name
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        await self._inner.warm_up(urls, connections)
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        await self._throttle(url)
+        return await self._inner.fetch(url, wait_selector=wait_selector)
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import os
+import random
+import time
+import weakref
+from contextlib import nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+# 현재 실행 흐름이 샘플링되었는지 (None이면 아직 결정되지 않은 최상위 구간)
+_sampled: ContextVar[bool | None] = ContextVar("trace_sampled", default=None)
+
+_NOOP = nullcontext()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start", "_sampled", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._token = None
+
+    def __enter__(self) -> "_Span":
+        sampled = _sampled.get()
+        if sampled is None:
+            # 최상위 구간에서 샘플링 여부를 정하고 하위 구간은 같은 결정을 따른다
+            sampled = random.random() < self._tracer.sample_rate
+            self._token = _sampled.set(sampled)
+        self._sampled = sampled
+        if sampled:
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._sampled:
+            self._tracer._record(self._name, self._cat, self._start, self._args)
+        if self._token is not None:
+            _sampled.reset(self._token)
+
+
+class Tracer:
+    """Chrome trace-event 형식(Perfetto, chrome://tracing)으로 구간을 기록하는 tracer
+
+    꺼져 있으면 `span()`은 공유 no-op 컨텍스트를 반환하므로 비용이 거의 없다.
+    샘플링은 최상위 구간 단위로 정하며, 하위 구간(요청, 파싱, 대기)은 같은 결정을 따른다.
+    asyncio 태스크마다 별도 트랙(tid)으로 기록하여 스케줄러 워커별 타임라인이 그려진다.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.max_events = 0
+        self.dropped = 0
+        self._events: list[tuple] = []
+        self._origin = 0
+        self._tids: weakref.WeakKeyDictionary[asyncio.Task, int] = weakref.WeakKeyDictionary()
+        self._thread_names: dict[int, str] = {}
+
+    def start(self, sample_rate: float = 1.0, max_events: int = 500_000) -> None:
+        """기록을 시작한다. `max_events`를 넘는 구간은 버리고 개수만 센다."""
+        self.clear()
+        self.enabled = True
+        self.sample_rate = sample_rate
+        self.max_events = max_events
+        self._origin = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._tids = weakref.WeakKeyDictionary()
+        self._thread_names.clear()
+        self.dropped = 0
+
+    def span(self, name: str, cat: str, **args: Any):
+        """구간 하나를 기록하는 컨텍스트 매니저 (args는 채널, 키워드, URL 등 태그)"""
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, name, cat, args)
+
+    @property
+    def events(self) -> list[dict]:
+        return [self._to_dict(event) for event in self._events]
+
+    def write(self, path: str | Path) -> Path:
+        """기록한 구간을 trace-event JSON 파일로 저장한다."""
+        pid = os.getpid()
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._thread_names.items()
+        ]
+        payload = {
+            "traceEvents": metadata + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"sample_rate": self.sample_rate, "dropped_events": self.dropped},
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    def _record(self, name: str, cat: str, start_ns: int, args: dict[str, Any]) -> None:
+        end_ns = time.perf_counter_ns()
+        if len(self._events) >= self.max_events:
+            self.dropped += 1
+            return
+        self._events.append((name, cat, start_ns, end_ns, self._tid(), args))
+
+    def _tid(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        tid = self._tids.get(task)
+        if tid is None:
+            tid = self._tids[task] = len(self._thread_names) + 1
+            self._thread_names[tid] = task.get_name()
+        return tid
+
+    def _to_dict(self, event: tuple) -> dict:
+        name, cat, start_ns, end_ns, tid, args = event
+        return {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - self._origin) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": tid,
+            "args": args,
+        }
+
+
+TRACER = Tracer()
@@ -0,0 +1,29 @@
+import importlib
+
+# 하위 모듈은 pydantic 등을 import하고 Redis 백엔드는 redis 패키지가 필요하므로
+# 실제 사용 시점에 로드한다
+_EXPORTS = {
+    "Coordinator": "src.distributed.coordinator",
+    "FrontierBackend": "src.distributed.frontier",
+    "FrontierTask": "src.distributed.frontier",
+    "FrontierWorker": "src.distributed.worker",
+    "RedisFrontier": "src.distributed.redis_frontier",
+    "SqliteFrontier": "src.distributed.sqlite_frontier",
+    "open_frontier": "src.distributed.frontier",
+}
+
+__all__ = [
+    "Coordinator",
+    "FrontierBackend",
+    "FrontierTask",
+    "FrontierWorker",
+    "RedisFrontier",
+    "SqliteFrontier",
+    "open_frontier",
+]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator
+
+from config.settings import CrawlerSettings
+from src.core.models import CrawlEvent, CrawlResult
+from src.distributed.frontier import FrontierBackend, FrontierTask
+from src.pipeline.channel_registry import get_available_channels
+
+logger = logging.getLogger(__name__)
+
+
+class Coordinator:
+    """검색 작업을 공유 frontier에 등록하고 워커들이 남긴 결과를 모으는 코디네이터"""
+
+    def __init__(self, frontier: FrontierBackend, settings: CrawlerSettings) -> None:
+        self._frontier = frontier
+        self._settings = settings
+
+    async def seed(
+        self,
+        keywords: list[str],
+        channels: list[str] | None = None,
+        max_pages: int | None = None,
+        run_id: str | None = None,
+    ) -> int:
+        """채널-키워드-페이지 조합의 검색 작업을 등록하고 등록된 수를 반환한다.
+
+        중복 제거는 실행(`run_id`) 단위이므로 같은 키워드로 다시 등록해도 새 실행으로
+        처리된다. `run_id`를 주지 않으면 새로 만든다 (같은 실행에 이어서 등록할 때만 지정).
+        """
+        run_id = run_id or uuid.uuid4().hex[:12]
+        pages = max_pages or self._settings.max_pages
+        tasks = [
+            FrontierTask.search(channel, keyword, page, run_id)
+            for channel in channels or get_available_channels()
+            for keyword in keywords
+            for page in range(1, pages + 1)
+        ]
+        seeded = await self._frontier.push(tasks)
+        if seeded == 0:
+            logger.warning(
+                "frontier에 등록된 작업이 없습니다 (실행 %s, 요청 %d건이 모두 중복)",
+                run_id,
+                len(tasks),
+            )
+        else:
+            logger.info(
+                "frontier 작업 등록: 실행 %s, 검색 %d건 (중복 %d건 제외)",
+                run_id,
+                seeded,
+                len(tasks) - seeded,
+            )
+        return seeded
+
+    async def events(self) -> AsyncIterator[CrawlEvent]:
+        """frontier가 비고 남은 결과를 모두 꺼낼 때까지 결과 이벤트를 yield한다."""
+        while True:
+            batch = await self._frontier.pop_results()
+            for data in batch:
+                yield CrawlEvent.from_dict(data)
+            if batch:
+                continue
+
+            # 작업 완료와 결과 기록은 한 트랜잭션이므로 비어 있으면 모든 결과가 기록된 상태이다
+            stats = await self._frontier.stats()
+            if stats.drained and stats.results == 0:
+                logger.info("frontier 처리 완료: 작업 %d건, 실패 %d건", stats.done, stats.failed)
+                return
+            await asyncio.sleep(self._settings.frontier_poll_interval)
+
+    async def run(
+        self,
+        keywords: list[str],
+        channels: list[str] | None = None,
+        max_pages: int | None = None,
+        run_id: str | None = None,
+    ) -> list[CrawlResult]:
+        """검색 작업을 등록하고 모든 작업이 끝날 때까지 결과를 채널-키워드별로 모은다."""
+        target_channels = channels or get_available_channels()
+        await self.seed(keywords, target_channels, max_pages, run_id)
+
+        results: dict[tuple[str, str], CrawlResult] = {
+            (channel, keyword): CrawlResult(channel=channel, keyword=keyword)
+            for channel in target_channels
+            for keyword in keywords
+        }
+        async for event in self.events():
+            key = (event.channel, event.keyword)
+            if key not in results:
+                results[key] = CrawlResult(channel=event.channel, keyword=event.keyword)
+            event.apply_to(results[key])
+        return list(results.values())
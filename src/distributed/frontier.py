@@ -0,0 +1,165 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from src.core.models import SearchResult
+from src.pipeline.scheduler import WorkKind
+
+
+@dataclass(slots=True)
+class FrontierTask:
+    """공유 frontier의 작업 단위 (검색 페이지 1개 또는 기사 URL 1개)"""
+
+    kind: WorkKind
+    channel: str
+    keyword: str
+    page: int = 0
+    url: str = ""
+    title: str = ""
+    snippet: str = ""
+    # 검색 결과 목록의 발행일 (ISO 8601, 없으면 빈 문자열)
+    published_at: str = ""
+    run_id: str = ""
+    id: str = ""
+    attempts: int = 0
+
+    @classmethod
+    def search(cls, channel: str, keyword: str, page: int, run_id: str = "") -> "FrontierTask":
+        return cls(WorkKind.SEARCH, channel, keyword, page=page, run_id=run_id)
+
+    @classmethod
+    def detail(
+        cls, channel: str, keyword: str, search_result: SearchResult, run_id: str = ""
+    ) -> "FrontierTask":
+        return cls(
+            WorkKind.DETAIL,
+            channel,
+            keyword,
+            url=search_result.url,
+            title=search_result.title,
+            snippet=search_result.snippet,
+            published_at=(
+                search_result.published_at.isoformat() if search_result.published_at else ""
+            ),
+            run_id=run_id,
+        )
+
+    @property
+    def dedup_key(self) -> str:
+        """실행(`run_id`) 안에서의 중복 제거 키
+
+        기사는 채널-키워드-URL, 검색 페이지는 채널-키워드-페이지 단위이다. 단일 프로세스
+        실행처럼 같은 기사가 여러 키워드에 걸리면 키워드마다 결과에 남는다.
+        """
+        if self.kind is WorkKind.DETAIL:
+            return f"{self.run_id}:article:{self.channel}:{self.keyword}:{self.url}"
+        return f"{self.run_id}:search:{self.channel}:{self.keyword}:{self.page}"
+
+    @property
+    def search_result(self) -> SearchResult:
+        return SearchResult(
+            title=self.title,
+            url=self.url,
+            snippet=self.snippet,
+            published_at=datetime.fromisoformat(self.published_at) if self.published_at else None,
+        )
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["kind"] = int(self.kind)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FrontierTask":
+        return cls(**{**data, "kind": WorkKind(data["kind"])})
+
+
+@dataclass(slots=True)
+class FrontierStats:
+    """frontier 상태 스냅샷"""
+
+    pending: int
+    leased: int
+    done: int
+    failed: int
+    results: int
+
+    @property
+    def drained(self) -> bool:
+        """대기 중이거나 처리 중인 작업이 없으면 True"""
+        return self.pending == 0 and self.leased == 0
+
+
+def error_event(task: FrontierTask, error: str) -> dict:
+    """재시도를 모두 실패한 작업의 에러 이벤트 (`CrawlEvent.to_dict()` 형식)"""
+    return {"channel": task.channel, "keyword": task.keyword, "type": "error", "error": error}
+
+
+class FrontierBackend(ABC):
+    """여러 워커 프로세스가 공유하는 작업 frontier (Strategy 패턴)
+
+    - `lease`로 꺼낸 작업은 `visibility_timeout` 안에 `complete`/`fail` 되지 않으면
+      다른 워커가 다시 가져갈 수 있다 (워커가 죽어도 작업이 사라지지 않는다).
+    - 같은 실행(`run_id`)에서 채널-키워드별 기사 URL은 한 번만 작업으로 등록된다 (`dedup_key`).
+    - `reserve_host`로 호스트별 요청 간격을 클러스터 전체에서 공유한다.
+    """
+
+    @abstractmethod
+    async def push(self, tasks: list[FrontierTask]) -> int:
+        """작업을 등록하고 등록된 수를 반환한다. 이미 등록된 작업(`dedup_key`)은 무시한다."""
+
+    @abstractmethod
+    async def lease(self, worker_id: str, visibility_timeout: float) -> FrontierTask | None:
+        """우선순위가 가장 높은 작업 하나를 임대한다 (기사 > 검색 페이지). 없으면 None."""
+
+    @abstractmethod
+    async def complete(
+        self,
+        task: FrontierTask,
+        worker_id: str,
+        events: list[dict],
+        discovered: list[FrontierTask],
+    ) -> bool:
+        """작업 완료를 기록한다. 결과 이벤트와 새로 발견한 작업을 한 트랜잭션으로 반영한다.
+
+        임대가 만료되어 다른 워커에게 넘어간 작업이면 아무것도 반영하지 않고 False를 반환한다.
+        """
+
+    @abstractmethod
+    async def fail(self, task: FrontierTask, worker_id: str, error: str, max_attempts: int) -> bool:
+        """작업 실패를 기록한다. 시도 횟수가 남아 있으면 다시 대기열에 넣고 True를 반환한다.
+
+        시도 횟수를 모두 쓰면 에러 이벤트를 결과에 남기고 False를 반환한다.
+        """
+
+    @abstractmethod
+    async def reserve_host(self, host: str, interval: float) -> float:
+        """호스트의 다음 요청 슬롯을 예약하고, 그 슬롯까지 기다려야 할 시간(초)을 반환한다."""
+
+    @abstractmethod
+    async def pop_results(self, limit: int = 100) -> list[dict]:
+        """쌓인 결과 이벤트(`CrawlEvent.to_dict()`)를 최대 limit개 꺼낸다."""
+
+    @abstractmethod
+    async def stats(self) -> FrontierStats:
+        """frontier 상태를 반환한다."""
+
+    async def close(self) -> None:
+        """연결을 닫는다."""
+
+
+def open_frontier(url: str) -> FrontierBackend:
+    """URL로 frontier 백엔드를 생성한다.
+
+    - `sqlite:///경로` : 단일 호스트 또는 공유 파일시스템용 SQLite 백엔드
+    - `redis://호스트:포트/DB?namespace=이름` : 운영용 Redis 호환 백엔드 (redis 패키지 필요)
+    """
+    if url.startswith("sqlite:///"):
+        from src.distributed.sqlite_frontier import SqliteFrontier
+
+        return SqliteFrontier(url.removeprefix("sqlite:///"))
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        from src.distributed.redis_frontier import RedisFrontier
+
+        return RedisFrontier.from_url(url)
+    raise ValueError(f"지원하지 않는 frontier URL: '{url}'")
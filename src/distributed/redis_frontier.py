@@ -0,0 +1,243 @@
+import json
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from src.distributed.frontier import FrontierBackend, FrontierStats, FrontierTask, error_event
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+# 대기열 점수: 종류 * _KIND_WEIGHT + 등록 순번 (기사 작업이 검색 작업보다 먼저 나간다)
+_KIND_WEIGHT = 10**13
+
+# 서버 시각(TIME)을 사용하므로 워커 간 시계 차이에 영향받지 않는다
+_SERVER_NOW = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+"""
+
+# KEYS: pending, leased, tasks, owners / ARGV: visibility_timeout, worker_id
+_LEASE = (
+    _SERVER_NOW
+    + """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('HDEL', KEYS[4], id)
+    local task = cjson.decode(redis.call('HGET', KEYS[3], id))
+    redis.call('ZADD', KEYS[1], task.priority, id)
+end
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return false
+end
+local id = popped[1]
+local task = cjson.decode(redis.call('HGET', KEYS[3], id))
+task.attempts = task.attempts + 1
+local raw = cjson.encode(task)
+redis.call('HSET', KEYS[3], id, raw)
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[1]), id)
+redis.call('HSET', KEYS[4], id, ARGV[2])
+return raw
+"""
+)
+
+# KEYS: seen, seq, tasks, pending / ARGV: 작업 JSON 목록 (id, priority 없이)
+_PUSH_BODY = (
+    """
+local function push_tasks(seen, seq, tasks, pending, items, offset)
+    local inserted = 0
+    for i = offset, #items do
+        local task = cjson.decode(items[i])
+        if redis.call('SADD', seen, task.dedup_key) == 1 then
+            local id = tostring(redis.call('INCR', seq))
+            task.id = id
+            task.priority = task.kind * %d + tonumber(id)
+            redis.call('HSET', tasks, id, cjson.encode(task))
+            redis.call('ZADD', pending, task.priority, id)
+            inserted = inserted + 1
+        end
+    end
+    return inserted
+end
+"""
+    % _KIND_WEIGHT
+)
+
+_PUSH = _PUSH_BODY + "return push_tasks(KEYS[1], KEYS[2], KEYS[3], KEYS[4], ARGV, 1)"
+
+# KEYS: leased, owners, tasks, results, stats, seen, seq, pending
+# ARGV: id, worker_id, 이벤트 수 n, 이벤트 JSON n개, 발견한 작업 JSON
+_COMPLETE = (
+    _PUSH_BODY
+    + """
+local id = ARGV[1]
+if redis.call('HGET', KEYS[2], id) ~= ARGV[2] or not redis.call('ZSCORE', KEYS[1], id) then
+    return 0
+end
+redis.call('ZREM', KEYS[1], id)
+redis.call('HDEL', KEYS[2], id)
+redis.call('HDEL', KEYS[3], id)
+redis.call('HINCRBY', KEYS[5], 'done', 1)
+local n = tonumber(ARGV[3])
+for i = 4, 3 + n do
+    redis.call('RPUSH', KEYS[4], ARGV[i])
+end
+push_tasks(KEYS[6], KEYS[7], KEYS[3], KEYS[8], ARGV, 4 + n)
+return 1
+"""
+)
+
+# KEYS: leased, owners, tasks, pending, results, stats / ARGV: id, worker_id, retry(0/1), 에러 JSON
+_FAIL = """
+local id = ARGV[1]
+if redis.call('HGET', KEYS[2], id) ~= ARGV[2] or not redis.call('ZSCORE', KEYS[1], id) then
+    return 0
+end
+redis.call('ZREM', KEYS[1], id)
+redis.call('HDEL', KEYS[2], id)
+if ARGV[3] == '1' then
+    local task = cjson.decode(redis.call('HGET', KEYS[3], id))
+    redis.call('ZADD', KEYS[4], task.priority, id)
+else
+    redis.call('HDEL', KEYS[3], id)
+    redis.call('HINCRBY', KEYS[6], 'failed', 1)
+    redis.call('RPUSH', KEYS[5], ARGV[4])
+end
+return 1
+"""
+
+# KEYS: host 키 / ARGV: interval → 기다려야 할 시간(초, 문자열)
+_RESERVE = (
+    _SERVER_NOW
+    + """
+local interval = tonumber(ARGV[1])
+local slot = math.max(now, tonumber(redis.call('GET', KEYS[1]) or '0'))
+local ttl = math.ceil((slot + interval - now) * 1000) + 60000
+redis.call('SET', KEYS[1], tostring(slot + interval), 'PX', ttl)
+return tostring(slot - now)
+"""
+)
+
+
+class RedisFrontier(FrontierBackend):
+    """Redis 호환 서버 기반 frontier (여러 노드의 워커가 공유하는 운영용 백엔드)
+
+    상태 변경은 모두 Lua 스크립트로 실행하여 원자적이며, 임대 만료와 호스트별 요청 간격은
+    Redis 서버 시각을 기준으로 계산한다. 키는 모두 `{namespace}:` 접두사를 사용한다.
+    """
+
+    def __init__(self, client: "Redis", namespace: str = "crawl") -> None:
+        self._redis = client
+        # 해시 태그로 모든 키를 같은 슬롯에 두어 Redis Cluster에서도 스크립트가 동작한다
+        self._keys = {
+            name: f"{{{namespace}}}:{name}"
+            for name in ("pending", "leased", "tasks", "owners", "seen", "seq", "results", "stats")
+        }
+        self._host_prefix = f"{namespace}:host:"
+        self._lease = client.register_script(_LEASE)
+        self._push = client.register_script(_PUSH)
+        self._complete = client.register_script(_COMPLETE)
+        self._fail = client.register_script(_FAIL)
+        self._reserve = client.register_script(_RESERVE)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisFrontier":
+        """`redis://호스트:포트/DB?namespace=이름` 형식의 URL로 생성한다."""
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError(
+                "Redis frontier를 사용하려면 redis 패키지가 필요합니다: "
+                "pip install -e '.[distributed]'"
+            ) from e
+
+        parts = urlsplit(url)
+        namespace = parse_qs(parts.query).get("namespace", ["crawl"])[0]
+        client = Redis.from_url(urlunsplit(parts._replace(query="")), decode_responses=True)
+        return cls(client, namespace)
+
+    def _k(self, *names: str) -> list[str]:
+        return [self._keys[name] for name in names]
+
+    @staticmethod
+    def _encode(task: FrontierTask) -> str:
+        return json.dumps({**task.to_dict(), "dedup_key": task.dedup_key}, ensure_ascii=False)
+
+    async def push(self, tasks: list[FrontierTask]) -> int:
+        if not tasks:
+            return 0
+        return await self._push(
+            keys=self._k("seen", "seq", "tasks", "pending"),
+            args=[self._encode(task) for task in tasks],
+        )
+
+    async def lease(self, worker_id: str, visibility_timeout: float) -> FrontierTask | None:
+        raw = await self._lease(
+            keys=self._k("pending", "leased", "tasks", "owners"),
+            args=[visibility_timeout, worker_id],
+        )
+        if not raw:
+            return None
+        data = json.loads(raw)
+        del data["priority"], data["dedup_key"]
+        return FrontierTask.from_dict(data)
+
+    async def complete(
+        self,
+        task: FrontierTask,
+        worker_id: str,
+        events: list[dict],
+        discovered: list[FrontierTask],
+    ) -> bool:
+        args = [task.id, worker_id, len(events)]
+        args += [json.dumps(event, ensure_ascii=False) for event in events]
+        args += [self._encode(t) for t in discovered]
+        ok = await self._complete(
+            keys=self._k("leased", "owners", "tasks", "results", "stats", "seen", "seq", "pending"),
+            args=args,
+        )
+        return bool(ok)
+
+    async def fail(self, task: FrontierTask, worker_id: str, error: str, max_attempts: int) -> bool:
+        retry = task.attempts < max_attempts
+        ok = await self._fail(
+            keys=self._k("leased", "owners", "tasks", "pending", "results", "stats"),
+            args=[
+                task.id,
+                worker_id,
+                "1" if retry else "0",
+                json.dumps(error_event(task, error), ensure_ascii=False),
+            ],
+        )
+        return bool(ok) and retry
+
+    async def reserve_host(self, host: str, interval: float) -> float:
+        wait = await self._reserve(keys=[self._host_prefix + host], args=[interval])
+        return float(wait)
+
+    async def pop_results(self, limit: int = 100) -> list[dict]:
+        key = self._keys["results"]
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(key, 0, limit - 1)
+            pipe.ltrim(key, limit, -1)
+            raw, _ = await pipe.execute()
+        return [json.loads(item) for item in raw]
+
+    async def stats(self) -> FrontierStats:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self._keys["pending"])
+            pipe.zcard(self._keys["leased"])
+            pipe.llen(self._keys["results"])
+            pipe.hgetall(self._keys["stats"])
+            pending, leased, results, counters = await pipe.execute()
+        return FrontierStats(
+            pending=pending,
+            leased=leased,
+            done=int(counters.get("done", 0)),
+            failed=int(counters.get("failed", 0)),
+            results=results,
+        )
+
+    async def close(self) -> None:
+        await self._redis.aclose()
@@ -0,0 +1,182 @@
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.distributed.frontier import FrontierBackend, FrontierStats, FrontierTask, error_event
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_queue ON tasks (state, kind, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks (state, lease_until);
+
+CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS hosts (host TEXT PRIMARY KEY, next_at REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL);
+"""
+
+
+class SqliteFrontier(FrontierBackend):
+    """SQLite 파일 기반 frontier (로컬 테스트, 한 호스트의 여러 워커 프로세스용)
+
+    모든 변경은 `BEGIN IMMEDIATE` 트랜잭션으로 실행하여 프로세스 간에도 원자적이다.
+    트랜잭션이 짧으므로 이벤트 루프에서 직접 실행한다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션. 예외가 나면 롤백한다."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.rollback()
+            raise
+        self._conn.commit()
+
+    def _insert_tasks(self, tasks: list[FrontierTask]) -> int:
+        inserted = 0
+        for task in tasks:
+            cursor = self._conn.execute(
+                "INSERT INTO seen (key) VALUES (?) ON CONFLICT DO NOTHING", (task.dedup_key,)
+            )
+            if cursor.rowcount:
+                self._conn.execute(
+                    "INSERT INTO tasks (kind, payload) VALUES (?, ?)",
+                    (int(task.kind), json.dumps(task.to_dict(), ensure_ascii=False)),
+                )
+                inserted += 1
+        return inserted
+
+    def _push_events(self, events: list[dict]) -> None:
+        self._conn.executemany(
+            "INSERT INTO results (payload) VALUES (?)",
+            [(json.dumps(event, ensure_ascii=False),) for event in events],
+        )
+
+    def _owns(self, task: FrontierTask, worker_id: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM tasks WHERE id = ? AND state = 'leased' AND worker = ?",
+            (int(task.id), worker_id),
+        ).fetchone()
+        return row is not None
+
+    async def push(self, tasks: list[FrontierTask]) -> int:
+        with self._transaction():
+            return self._insert_tasks(tasks)
+
+    async def lease(self, worker_id: str, visibility_timeout: float) -> FrontierTask | None:
+        now = time.time()
+        with self._transaction() as conn:
+            # 임대가 만료된 작업을 대기열로 되돌린다
+            conn.execute(
+                "UPDATE tasks SET state = 'pending', worker = NULL "
+                "WHERE state = 'leased' AND lease_until < ?",
+                (now,),
+            )
+            row = conn.execute(
+                "SELECT id, payload, attempts FROM tasks WHERE state = 'pending' "
+                "ORDER BY kind, id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            task_id, payload, attempts = row
+            conn.execute(
+                "UPDATE tasks SET state = 'leased', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (worker_id, now + visibility_timeout, task_id),
+            )
+
+        task = FrontierTask.from_dict(json.loads(payload))
+        task.id = str(task_id)
+        task.attempts = attempts + 1
+        return task
+
+    async def complete(
+        self,
+        task: FrontierTask,
+        worker_id: str,
+        events: list[dict],
+        discovered: list[FrontierTask],
+    ) -> bool:
+        with self._transaction() as conn:
+            if not self._owns(task, worker_id):
+                return False
+            conn.execute("UPDATE tasks SET state = 'done' WHERE id = ?", (int(task.id),))
+            self._push_events(events)
+            self._insert_tasks(discovered)
+        return True
+
+    async def fail(self, task: FrontierTask, worker_id: str, error: str, max_attempts: int) -> bool:
+        retry = task.attempts < max_attempts
+        with self._transaction() as conn:
+            if not self._owns(task, worker_id):
+                return False
+            if retry:
+                conn.execute(
+                    "UPDATE tasks SET state = 'pending', worker = NULL WHERE id = ?",
+                    (int(task.id),),
+                )
+            else:
+                conn.execute("UPDATE tasks SET state = 'failed' WHERE id = ?", (int(task.id),))
+                self._push_events([error_event(task, error)])
+        return retry
+
+    async def reserve_host(self, host: str, interval: float) -> float:
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT next_at FROM hosts WHERE host = ?", (host,)).fetchone()
+            slot = max(now, row[0]) if row else now
+            conn.execute(
+                "INSERT INTO hosts (host, next_at) VALUES (?, ?) "
+                "ON CONFLICT (host) DO UPDATE SET next_at = excluded.next_at",
+                (host, slot + interval),
+            )
+        return slot - now
+
+    async def pop_results(self, limit: int = 100) -> list[dict]:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, payload FROM results ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+            if rows:
+                conn.execute("DELETE FROM results WHERE id <= ?", (rows[-1][0],))
+        return [json.loads(payload) for _, payload in rows]
+
+    async def stats(self) -> FrontierStats:
+        now = time.time()
+        counts = dict(
+            self._conn.execute(
+                "SELECT CASE WHEN state = 'leased' AND lease_until < ? THEN 'pending' "
+                "ELSE state END AS s, COUNT(*) FROM tasks GROUP BY s",
+                (now,),
+            ).fetchall()
+        )
+        (results,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        return FrontierStats(
+            pending=counts.get("pending", 0),
+            leased=counts.get("leased", 0),
+            done=counts.get("done", 0),
+            failed=counts.get("failed", 0),
+            results=results,
+        )
+
+    async def close(self) -> None:
+        self._conn.close()
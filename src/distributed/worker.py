@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+from config.settings import CrawlerSettings
+from src.core.exceptions import CrawlerError
+from src.core.fetch_strategy import FetchStrategy
+from src.core.models import CrawlEvent
+from src.distributed.frontier import FrontierBackend, FrontierTask
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.pipeline.scheduler import WorkKind
+
+logger = logging.getLogger(__name__)
+
+
+class FrontierWorker:
+    """공유 frontier에서 작업을 임대해 기존 채널 크롤러로 실행하는 워커
+
+    크롤러는 워커가 여는 오케스트레이터 세션에서 가져오므로 채널 구현과 파서는 그대로
+    사용한다. 요청 시도(재시도 포함)마다 frontier에서 호스트별 요청 슬롯을 예약하여
+    여러 노드가 함께 요청해도 호스트별 요청 간격(`host_request_interval`)이 지켜진다.
+
+    `strategy_wrapper`는 `CrawlOrchestrator`의 같은 인자로 전달된다.
+    """
+
+    def __init__(
+        self,
+        frontier: FrontierBackend,
+        settings: CrawlerSettings,
+        worker_id: str | None = None,
+        strategy_wrapper: Callable[[FetchStrategy], FetchStrategy] | None = None,
+    ) -> None:
+        self._frontier = frontier
+        self._settings = settings
+        self._orchestrator = CrawlOrchestrator(
+            settings, strategy_wrapper, host_throttle=self._throttle
+        )
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.processed = 0
+
+    async def run(self, exit_when_drained: bool = True) -> int:
+        """작업 루프를 `worker_concurrency`개 실행하고 처리한 작업 수를 반환한다.
+
+        `exit_when_drained`가 True면 frontier가 비는 즉시 종료하고,
+        False면 새 작업을 기다리며 취소될 때까지 실행한다.
+        """
+        logger.info(
+            "워커 시작: %s (동시 작업 %d)", self.worker_id, self._settings.worker_concurrency
+        )
+        async with self._orchestrator, asyncio.TaskGroup() as tg:
+            for _ in range(self._settings.worker_concurrency):
+                tg.create_task(self._loop(exit_when_drained))
+        logger.info("워커 종료: %s (작업 %d건 처리)", self.worker_id, self.processed)
+        return self.processed
+
+    async def _loop(self, exit_when_drained: bool) -> None:
+        while True:
+            task = await self._frontier.lease(
+                self.worker_id, self._settings.frontier_visibility_timeout
+            )
+            if task is None:
+                if exit_when_drained and (await self._frontier.stats()).drained:
+                    return
+                await asyncio.sleep(self._settings.frontier_poll_interval)
+                continue
+            await self.process(task)
+
+    async def process(self, task: FrontierTask) -> None:
+        """임대한 작업 하나를 실행하고 결과를 frontier에 반영한다.
+
+        크롤러 생성 실패도 작업 실패로 기록하므로 한 채널의 문제로 워커가 멈추지 않는다.
+        """
+        if task.kind is WorkKind.SEARCH:
+            target = f"'{task.keyword}' 페이지 {task.page}"
+            error_prefix = f"페이지 {task.page} 검색 실패"
+        else:
+            target = task.url
+            error_prefix = f"기사 수집 실패 ({task.url})"
+
+        events: list[dict] = []
+        discovered: list[FrontierTask] = []
+        try:
+            crawler = await self._orchestrator.get_crawler(task.channel)
+            if task.kind is WorkKind.SEARCH:
+                for sr in await crawler.fetch_search_page(task.keyword, task.page):
+                    if article := crawler.listing_article(sr, task.keyword):
+                        event = CrawlEvent(task.channel, task.keyword, article=article)
+                        events.append(event.to_dict())
+                    else:
+                        discovered.append(
+                            FrontierTask.detail(task.channel, task.keyword, sr, task.run_id)
+                        )
+            else:
+                # 목록만으로 충분한 기사는 상세 페이지를 요청하지 않는다
+                sr = task.search_result
+                article = crawler.listing_article(sr, task.keyword)
+                if article is None:
+                    article = await crawler.fetch_article(sr, task.keyword)
+                events.append(CrawlEvent(task.channel, task.keyword, article=article).to_dict())
+        except Exception as e:
+            if not isinstance(e, CrawlerError):
+                logger.exception("[%s] '%s' 작업 처리 중 예외", task.channel, task.keyword)
+            error_msg = f"{error_prefix}: {e}"
+            retried = await self._frontier.fail(
+                task, self.worker_id, error_msg, self._settings.frontier_max_attempts
+            )
+            logger.warning("%s (%s)", error_msg, "재시도 예정" if retried else "시도 횟수 초과")
+            return
+
+        if await self._frontier.complete(task, self.worker_id, events, discovered):
+            self.processed += 1
+        else:
+            logger.warning("[%s] 임대가 만료되어 결과를 버립니다: %s", task.channel, target)
+
+    async def _throttle(self, url: str) -> None:
+        """클러스터 전체에서 공유하는 호스트별 요청 슬롯을 예약하고 그때까지 대기한다."""
+        host = urlsplit(url).hostname or ""
+        wait = await self._frontier.reserve_host(host, self._settings.host_request_interval)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -1,5 +1,17 @@
-from src.pipeline.channel_registry import get_available_channels
-from src.pipeline.orchestrator import CrawlOrchestrator
-from src.pipeline.result_writer import ResultWriter
+import importlib
 
-__all__ = ["CrawlOrchestrator", "ResultWriter", "get_available_channels"]
+# 하위 모듈은 httpx, pydantic 등을 import하므로 실제 사용 시점에 로드한다
+_EXPORTS = {
+    "CrawlOrchestrator": "src.pipeline.orchestrator",
+    "ResultWriter": "src.pipeline.result_writer",
+    "SqliteStore": "src.pipeline.sqlite_store",
+    "get_available_channels": "src.pipeline.channel_registry",
+}
+
+__all__ = ["CrawlOrchestrator", "ResultWriter", "SqliteStore", "get_available_channels"]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,15 @@
 import importlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from config.settings import CrawlerSettings
-from src.core.base_crawler import BaseCrawler
-from src.core.fetch_strategy import DynamicFetchStrategy, StaticFetchStrategy
-from src.shared.browser_client import BrowserClient
-from src.shared.http_client import HttpClient
+# CLI 파싱(--help, choices)은 CHANNEL_MAP만 필요하므로 무거운 의존성은
+# 타입 검사 시 또는 크롤러 생성 시점에만 import한다
+if TYPE_CHECKING:
+    from config.settings import CrawlerSettings
+    from src.core.base_crawler import BaseCrawler
+    from src.core.fetch_strategy import FetchStrategy
+    from src.shared.browser_client import BrowserClient
+    from src.shared.http_client import HttpClient
 
 # 채널 이름 → (모듈 경로, 크롤러 클래스명, fetch 전략 타입) 매핑
 # 전략 타입: "static" (httpx) 또는 "dynamic" (playwright)
@@ -22,6 +27,11 @@ def get_available_channels() -> list[str]:
     return list(CHANNEL_MAP.keys())
 
 
+def get_strategy_type(channel_name: str) -> str:
+    """채널의 fetch 전략 타입 ("static" 또는 "dynamic")"""
+    return CHANNEL_MAP[channel_name][2]
+
+
 def has_dynamic_channel(channels: list[str]) -> bool:
     """주어진 채널 중 dynamic 전략이 필요한 채널이 있는지 확인"""
     return any(CHANNEL_MAP[ch][2] == "dynamic" for ch in channels if ch in CHANNEL_MAP)
@@ -29,14 +39,21 @@ def has_dynamic_channel(channels: list[str]) -> bool:
 
 async def create_crawler(
     channel_name: str,
-    settings: CrawlerSettings,
-    http_client: HttpClient,
-    browser_client: BrowserClient | None = None,
-) -> BaseCrawler:
+    settings: "CrawlerSettings",
+    http_client: "HttpClient",
+    browser_client: "BrowserClient | None" = None,
+    strategy_wrapper: "Callable[[FetchStrategy], FetchStrategy] | None" = None,
+    fetch_strategy: "FetchStrategy | None" = None,
+) -> "BaseCrawler":
     """채널 이름으로 크롤러 인스턴스를 동적으로 생성한다.
 
     importlib를 사용해 동적 import하여 순환 참조를 방지한다.
+    `fetch_strategy`가 주어지면 채널 기본 전략(httpx/playwright) 대신 사용한다
+    (cassette 재생 등, 이 경우 브라우저 클라이언트가 필요 없다).
+    `strategy_wrapper`가 주어지면 fetch 전략을 감싸 재시도 등 공통 동작을 덧붙인다.
     """
+    from src.core.fetch_strategy import DynamicFetchStrategy, StaticFetchStrategy
+
     if channel_name not in CHANNEL_MAP:
         raise ValueError(f"알 수 없는 채널: '{channel_name}'")
 
@@ -44,11 +61,15 @@ async def create_crawler(
     module = importlib.import_module(module_path)
     crawler_cls = getattr(module, class_name)
 
-    if strategy_type == "static":
+    if fetch_strategy is not None:
+        strategy = fetch_strategy
+    elif strategy_type == "static":
         strategy = StaticFetchStrategy(http_client)
     else:
         if browser_client is None:
             raise ValueError(f"'{channel_name}' 채널은 브라우저 클라이언트가 필요합니다")
         strategy = DynamicFetchStrategy(browser_client)
 
+    if strategy_wrapper:
+        strategy = strategy_wrapper(strategy)
     return crawler_cls(strategy, settings)
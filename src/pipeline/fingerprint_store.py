@@ -0,0 +1,129 @@
+import logging
+import sqlite3
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+
+from src.core.models import Article
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    url TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_checked TEXT NOT NULL,
+    last_changed TEXT NOT NULL,
+    changes INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+# 지문이 바뀌었을 때만 변경 시각과 변경 횟수를 갱신한다
+_UPSERT_SQL = """
+INSERT INTO fingerprints (url, fingerprint, first_seen, last_checked, last_changed)
+VALUES (?1, ?2, ?3, ?3, ?3)
+ON CONFLICT (url) DO UPDATE SET
+    last_checked = excluded.last_checked,
+    last_changed = CASE WHEN fingerprint != excluded.fingerprint
+        THEN excluded.last_checked ELSE last_changed END,
+    changes = changes + (fingerprint != excluded.fingerprint),
+    fingerprint = excluded.fingerprint
+"""
+
+
+class ChangeKind(StrEnum):
+    NEW = "new"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+
+
+class FingerprintStore:
+    """기사 URL별 마지막 본문 지문(`Article.content_hash`)을 SQLite에 보관한다.
+
+    URL마다 처음/마지막 확인 시각, 마지막 변경 시각, 변경 횟수를 함께 기록하므로
+    자주 수정되는 기사를 골라 다시 방문하는 데 쓸 수 있다.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, url: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT fingerprint FROM fingerprints WHERE url = ?", (url,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def classify(self, article: Article) -> ChangeKind:
+        """저장된 지문과 비교한 기사의 변경 여부 (저장은 하지 않는다)"""
+        stored = self.get(article.url)
+        if stored is None:
+            return ChangeKind.NEW
+        return ChangeKind.UNCHANGED if stored == article.content_hash else ChangeKind.UPDATED
+
+    def record(self, articles: list[Article]) -> None:
+        """기사 지문을 한 트랜잭션으로 저장한다."""
+        now = datetime.now().isoformat()
+        with self._conn:
+            cursor = self._conn.executemany(
+                _UPSERT_SQL, [(a.url, a.content_hash, now) for a in articles if a.content_hash]
+            )
+        logger.debug("본문 지문 저장: %s (%d건)", self._db_path, cursor.rowcount)
+
+    def change_count(self, url: str) -> int:
+        """처음 수집한 뒤 본문이 바뀐 횟수 (모르는 URL이면 0)"""
+        row = self._conn.execute(
+            "SELECT changes FROM fingerprints WHERE url = ?", (url,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def most_volatile(self, limit: int = 100) -> list[tuple[str, int]]:
+        """변경 횟수가 많은 순서로 (URL, 변경 횟수) 목록을 반환한다 (재방문 우선순위용)."""
+        rows = self._conn.execute(
+            "SELECT url, changes FROM fingerprints WHERE changes > 0 "
+            "ORDER BY changes DESC, last_changed DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+
+class ChangeDetector:
+    """실행 한 번 동안 수집한 기사를 저장된 지문과 비교해 바뀐 기사만 통과시킨다.
+
+    새 기사와 본문이 바뀐 기사는 `Article.metadata["updated"]`(바뀐 기사면 True)를
+    표시해 통과시키고, 그대로인 기사는 걸러 낸다. 지문은 `commit()`을 호출해야
+    저장되므로, 실행이 중단되면 다음 실행(재개 포함)에서 같은 기사를 다시 판정한다.
+    """
+
+    def __init__(self, store: FingerprintStore) -> None:
+        self._store = store
+        self._checked: list[Article] = []
+        self.unchanged = 0
+
+    def process(self, article: Article) -> bool:
+        """기사를 내보내야 하면 True"""
+        kind = self._store.classify(article)
+        self._checked.append(article)
+        if kind is ChangeKind.UNCHANGED:
+            self.unchanged += 1
+            return False
+        article.metadata["updated"] = kind is ChangeKind.UPDATED
+        return True
+
+    def commit(self) -> None:
+        self._store.record(self._checked)
+        self._checked = []
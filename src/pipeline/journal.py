@@ -0,0 +1,282 @@
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+from src.core.models import CrawlEvent, SearchResult
+
+logger = logging.getLogger(__name__)
+
+# 이 개수만큼 기록할 때마다 fsync하여 프로세스뿐 아니라 호스트 장애에도 대비한다
+_FSYNC_EVERY = 100
+
+
+def _search_result(item: list) -> SearchResult:
+    # 목록 발행일이 추가되기 전 journal은 [제목, URL, 요약]만 기록했다
+    title, url, snippet, *rest = item
+    published_at = datetime.fromisoformat(rest[0]) if rest and rest[0] else None
+    return SearchResult(title, url, snippet, published_at)
+
+
+@dataclass(slots=True)
+class JournalState:
+    """journal을 재생하여 얻은 실행 진행 상태"""
+
+    keywords: list[str]
+    channels: list[str]
+    max_pages: int
+    # (채널, 키워드, 페이지) → 검색 결과 목록
+    searches: dict[tuple[str, str, int], list[SearchResult]] = field(default_factory=dict)
+    # 수집한 기사 (채널, 키워드, URL). 같은 기사도 키워드마다 따로 수집한다
+    fetched: set[tuple[str, str, str]] = field(default_factory=set)
+    # 재시도까지 실패하여 에러로 기록한 기사 (채널, 키워드, URL). 재개해도 다시 요청하지 않는다
+    failed: set[tuple[str, str, str]] = field(default_factory=set)
+    articles: list[CrawlEvent] = field(default_factory=list)
+    errors: list[CrawlEvent] = field(default_factory=list)
+    finished: bool = False
+    output_path: str | None = None
+
+    def pending_details(
+        self, channel: str, keyword: str, page: int, batch: tuple[str, ...] = ()
+    ) -> list[SearchResult]:
+        """완료된 검색 페이지에서 발견했지만 아직 수집하지 않은 기사
+
+        묶음 검색(`batch`)이면 묶은 키워드 중 하나로라도 기록된 기사는 완료로 본다
+        (상세 페이지 작업 하나가 묶음 전체를 맡는다).
+        """
+        keywords = batch or (keyword,)
+        return [
+            sr
+            for sr in self.searches.get((channel, keyword, page), [])
+            if not any(
+                (channel, k, sr.url) in self.fetched or (channel, k, sr.url) in self.failed
+                for k in keywords
+            )
+        ]
+
+    def add_article(self, event: CrawlEvent) -> None:
+        self.fetched.update((event.channel, event.keyword, url) for url in event.article.url_keys)
+        self.articles.append(event)
+
+    def add_errors(self, events: list[CrawlEvent], url: str | None) -> None:
+        if url:
+            self.failed.update((event.channel, event.keyword, url) for event in events)
+        self.errors.extend(events)
+
+
+class RunJournal:
+    """크롤링 진행 상황을 기록하는 append-only JSONL journal
+
+    완료된 검색 페이지(발견한 기사 목록 포함), 수집한 기사, 실패한 작업의 에러를 한 줄씩
+    기록한다. 실행이 중간에 종료되어도 `load()`로 진행 상태를 복원해 남은 작업만 이어서
+    실행하며, 실패한 작업은 다시 요청하지 않고 기록한 에러를 결과에 그대로 남긴다.
+    """
+
+    def __init__(self, path: Path, run_id: str) -> None:
+        self.path = path
+        self.run_id = run_id
+        self.state: JournalState | None = None
+        self._file: IO[str] | None = None
+        self._unsynced = 0
+
+    @classmethod
+    def create(
+        cls,
+        journal_dir: str,
+        keywords: list[str],
+        channels: list[str],
+        max_pages: int,
+        run_id: str | None = None,
+    ) -> "RunJournal":
+        """새 실행의 journal을 만든다. run_id 기본값은 실행 시각이다."""
+        run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = Path(journal_dir) / f"{run_id}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            raise FileExistsError(f"이미 존재하는 실행 ID입니다: {run_id}")
+
+        journal = cls(path, run_id)
+        journal.state = JournalState(keywords, channels, max_pages)
+        journal._append(
+            {
+                "type": "start",
+                "run_id": run_id,
+                "keywords": keywords,
+                "channels": channels,
+                "max_pages": max_pages,
+                "started_at": datetime.now().isoformat(),
+            }
+        )
+        return journal
+
+    @classmethod
+    def load(cls, journal_dir: str, run_id: str) -> "RunJournal":
+        """기존 실행의 journal을 재생하여 진행 상태를 복원한다."""
+        path = Path(journal_dir) / f"{run_id}.jsonl"
+        if not path.exists():
+            raise FileNotFoundError(f"실행 journal을 찾을 수 없습니다: {path}")
+
+        journal = cls(path, run_id)
+        valid_bytes = 0
+        with path.open("rb") as f:
+            for raw in f:
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 버린다
+                    logger.warning("journal 마지막 기록이 손상되어 무시합니다: %s", path)
+                    break
+                journal._apply(record)
+                valid_bytes += len(raw)
+
+        if path.stat().st_size != valid_bytes:
+            os.truncate(path, valid_bytes)
+        if journal.state is None:
+            raise ValueError(f"시작 기록이 없는 journal입니다: {path}")
+
+        state = journal.state
+        logger.info(
+            "journal 로드: %s (검색 페이지 %d건, 기사 %d건 완료, 에러 %d건)",
+            run_id,
+            len(state.searches),
+            len(state.articles),
+            len(state.errors),
+        )
+        return journal
+
+    def _apply(self, record: dict) -> None:
+        kind = record["type"]
+        if kind == "start":
+            self.state = JournalState(record["keywords"], record["channels"], record["max_pages"])
+            return
+
+        state = self.state
+        if kind == "search":
+            key = (record["channel"], record["keyword"], record["page"])
+            state.searches[key] = [_search_result(item) for item in record["results"]]
+        elif kind == "article":
+            state.add_article(CrawlEvent.from_dict(record["event"]))
+        elif kind == "error":
+            if not record.get("url"):
+                # 실패한 검색 페이지는 발견한 기사가 없는 완료 페이지로 본다
+                state.searches[(record["channel"], record["keyword"], record["page"])] = []
+            events = [CrawlEvent.from_dict(event) for event in record["events"]]
+            state.add_errors(events, record.get("url"))
+        elif kind == "finish":
+            state.finished = True
+            state.output_path = record["output_path"]
+
+    def is_search_done(self, channel: str, keyword: str, page: int) -> bool:
+        return (channel, keyword, page) in self.state.searches
+
+    def record_search(
+        self, channel: str, keyword: str, page: int, results: list[SearchResult]
+    ) -> None:
+        """완료된 검색 페이지와 발견한 기사 목록을 기록한다."""
+        self.state.searches[(channel, keyword, page)] = results
+        self._append(
+            {
+                "type": "search",
+                "channel": channel,
+                "keyword": keyword,
+                "page": page,
+                "results": [
+                    [
+                        sr.title,
+                        sr.url,
+                        sr.snippet,
+                        sr.published_at.isoformat() if sr.published_at else None,
+                    ]
+                    for sr in results
+                ],
+            }
+        )
+
+    def record_article(self, event: CrawlEvent) -> None:
+        """수집한 기사를 기록한다."""
+        self.state.add_article(event)
+        self._append({"type": "article", "event": event.to_dict()})
+
+    def record_error(
+        self,
+        channel: str,
+        keyword: str,
+        events: list[CrawlEvent],
+        page: int = 0,
+        url: str | None = None,
+    ) -> None:
+        """실패한 작업(검색 페이지 또는 기사 URL)과 그 에러 이벤트를 기록한다.
+
+        `keyword`는 검색어(묶음 검색이면 OR 검색어)이고, 이벤트는 작업의 키워드마다 하나씩이다.
+        기사 URL은 이벤트의 키워드별로 실패로 기록한다.
+        """
+        if not url:
+            self.state.searches[(channel, keyword, page)] = []
+        self.state.add_errors(events, url)
+        self._append(
+            {
+                "type": "error",
+                "channel": channel,
+                "keyword": keyword,
+                "page": page,
+                "url": url,
+                "events": [event.to_dict() for event in events],
+            }
+        )
+
+    def finish(self, output_path: Path) -> None:
+        """실행 완료를 기록하고 journal을 압축한다.
+
+        기사 본문은 출력 파일에 저장되었으므로 시작 기록과 완료 기록만 남긴다.
+        새 파일에 쓴 뒤 교체하므로 압축 도중 종료되어도 journal이 손상되지 않는다.
+        """
+        self.close()
+        state = self.state
+        records = [
+            {
+                "type": "start",
+                "run_id": self.run_id,
+                "keywords": state.keywords,
+                "channels": state.channels,
+                "max_pages": state.max_pages,
+            },
+            {
+                "type": "finish",
+                "output_path": str(output_path),
+                "articles": len(state.articles),
+                "errors": len(state.errors),
+                "finished_at": datetime.now().isoformat(),
+            },
+        ]
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.path)
+
+        state.finished = True
+        state.output_path = str(output_path)
+        logger.info("journal 압축 완료: %s", self.path)
+
+    def close(self) -> None:
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: dict) -> None:
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # 프로세스가 죽어도 기록이 남도록 매번 OS 버퍼로 내보낸다
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= _FSYNC_EVERY:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
@@ -1,33 +1,207 @@
 import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
 from config.settings import CrawlerSettings
-from src.core.models import CrawlResult
+from src.core.adaptive import AdaptiveConcurrency, AdaptiveFetchStrategy
+from src.core.base_crawler import BaseCrawler
+from src.core.cassette import Cassette, CassetteWriter, RecordingFetchStrategy, ReplayFetchStrategy
+from src.core.coalescing import CoalescingFetchStrategy, InFlightRequests
+from src.core.exceptions import CircuitOpenError, CrawlerError
+from src.core.fetch_strategy import FetchStrategy
+from src.core.metrics import BATCHED_SEARCH_SAVED, TIME_TO_FIRST_ARTICLE
+from src.core.models import Article, CrawlEvent, CrawlResult, SearchResult
+from src.core.resilience import CircuitBreakerRegistry, ResilientFetchStrategy
+from src.core.throttle import HostThrottle, ThrottledFetchStrategy
+from src.core.tracing import TRACER
 from src.pipeline.channel_registry import (
     create_crawler,
     get_available_channels,
+    get_strategy_type,
     has_dynamic_channel,
 )
-from src.shared.browser_client import BrowserClient
+from src.pipeline.dedup import DedupMode, DedupStage, NearDuplicateIndex
+from src.pipeline.fingerprint_store import ChangeDetector, FingerprintStore
+from src.pipeline.scheduler import ChannelSlots, WorkItem, WorkKind, WorkScheduler
 from src.shared.http_client import HttpClient
+from src.shared.text_cleaner import match_keywords
+
+if TYPE_CHECKING:
+    from src.pipeline.journal import RunJournal
+    from src.shared.browser_client import BrowserClient
 
 logger = logging.getLogger(__name__)
 
 
 class CrawlOrchestrator:
-    """모든 채널-키워드 조합을 병렬로 실행하는 오케스트레이터"""
+    """모든 채널-키워드 조합을 작업 스케줄러로 병렬 실행하는 오케스트레이터
+
+    `async with`로 세션을 열면 HTTP/브라우저 클라이언트와 채널 크롤러를 유지한 채
+    여러 번 실행할 수 있다 (daemon 모드). 세션 없이 실행하면 실행마다 클라이언트를
+    열고 닫는다.
+
+    `strategy_wrapper`는 채널 기본 fetch 전략 바로 바깥(동시성 제어, 재시도보다 안쪽)에
+    씌울 래퍼다 (부하 테스트에서 요청을 mock 사이트로 보내는 등). `host_throttle`은
+    재시도를 포함한 요청 시도마다 호스트 요청 간격을 기다리는 함수다 (분산 워커).
+    """
 
-    def __init__(self, settings: CrawlerSettings) -> None:
+    def __init__(
+        self,
+        settings: CrawlerSettings,
+        strategy_wrapper: Callable[[FetchStrategy], FetchStrategy] | None = None,
+        host_throttle: HostThrottle | None = None,
+    ) -> None:
         self._settings = settings
+        self._strategy_wrapper = strategy_wrapper
+        self._host_throttle = host_throttle
+        self._http_client: HttpClient | None = None
+        self._browser_client: "BrowserClient | None" = None
+        self._browser_lock = asyncio.Lock()
+        self._crawlers: dict[str, BaseCrawler] = {}
+        # 호스트별 circuit breaker는 세션 동안 모든 채널 크롤러가 공유한다
+        self._breakers = CircuitBreakerRegistry(settings)
+        self._concurrency = AdaptiveConcurrency(settings)
+        # 채널별 동시 실행 상한도 세션 단위다 (daemon 작업 여러 개가 함께 센다)
+        self._channel_slots = ChannelSlots(
+            self._channel_limit(), settings.channel_concurrency_overrides
+        )
+        # 같은 페이지에 대한 동시 요청도 채널과 관계없이 세션 단위로 합친다
+        self._inflight = InFlightRequests()
+        self._recorder: CassetteWriter | None = None
+        self._replay: Cassette | None = None
+        self._fingerprints: FingerprintStore | None = None
+        # 백그라운드에서 실행 중인 크롤러별 연결 미리 준비 작업
+        self._warmups: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        if self._settings.replay_cassette:
+            self._replay = Cassette.load(self._settings.replay_cassette)
+            logger.info(
+                "cassette 재생: %s (요청 %d건)", self._settings.replay_cassette, len(self._replay)
+            )
+        elif self._settings.record_cassette:
+            self._recorder = CassetteWriter(self._settings.record_cassette)
+        if self._settings.fingerprint_db:
+            self._fingerprints = FingerprintStore(self._settings.fingerprint_db)
+        self._http_client = HttpClient(
+            self._settings.user_agent,
+            self._settings.request_timeout,
+            dns_cache_ttl=self._settings.dns_cache_ttl,
+            max_page_bytes=self._settings.max_page_bytes,
+            max_page_bytes_overrides=self._settings.max_page_bytes_overrides,
+        )
+        await self._http_client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        for task in self._warmups:
+            task.cancel()
+        await asyncio.gather(*self._warmups, return_exceptions=True)
+        self._crawlers.clear()
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
+        if self._fingerprints:
+            self._fingerprints.close()
+            self._fingerprints = None
+        if self._browser_client:
+            await self._browser_client.__aexit__(None, None, None)
+            self._browser_client = None
+        if self._http_client:
+            await self._http_client.__aexit__(None, None, None)
+            self._http_client = None
+
+    async def start_browser(self) -> None:
+        """세션 동안 유지할 브라우저를 띄운다. 이미 떠 있으면 아무것도 하지 않는다."""
+        async with self._browser_lock:
+            if self._browser_client is not None:
+                return
+            # playwright는 동적 채널이 선택된 경우에만 import한다
+            from src.shared.browser_client import BrowserClient
+
+            browser_client = BrowserClient(
+                headless=self._settings.browser.headless,
+                context_max_uses=self._settings.browser.context_max_uses,
+            )
+            await browser_client.__aenter__()
+            self._browser_client = browser_client
 
     async def run(
         self,
         keywords: list[str],
         channels: list[str] | None = None,
+        max_pages: int | None = None,
+        skip_url: Callable[[str, str], bool] | None = None,
+        journal: "RunJournal | None" = None,
     ) -> list[CrawlResult]:
         """지정된 채널과 키워드 조합으로 크롤링을 병렬 실행한다."""
         target_channels = channels or get_available_channels()
-        needs_browser = has_dynamic_channel(target_channels)
+
+        # 채널-키워드 조합 순서대로 결과를 모은다
+        results: dict[tuple[str, str], CrawlResult] = {
+            (channel, keyword): CrawlResult(channel=channel, keyword=keyword)
+            for channel in target_channels
+            for keyword in keywords
+        }
+        events = self.run_iter(
+            keywords, target_channels, max_pages=max_pages, skip_url=skip_url, journal=journal
+        )
+        async for event in events:
+            event.apply_to(results[(event.channel, event.keyword)])
+
+        crawl_results = list(results.values())
+        logger.info(
+            "크롤링 완료: 총 %d건 결과",
+            len(crawl_results),
+        )
+        return crawl_results
+
+    async def run_iter(
+        self,
+        keywords: list[str],
+        channels: list[str] | None = None,
+        max_pages: int | None = None,
+        max_workers: int | None = None,
+        skip_url: Callable[[str, str], bool] | None = None,
+        journal: "RunJournal | None" = None,
+    ) -> AsyncIterator[CrawlEvent]:
+        """모든 채널-키워드 조합의 기사와 에러를 발생 순서대로 yield한다.
+
+        검색 페이지와 기사 상세 페이지를 각각 작업 단위로 `WorkScheduler`에 넣어
+        고정 크기 워커 풀과 채널별 동시 실행 상한 안에서 실행한다.
+        이벤트는 크기가 제한된 큐를 거치므로 소비자가 느리면 워커가 대기한다.
+        중간에 소비를 멈출 경우 `contextlib.aclosing`으로 감싸 남은 태스크를 정리한다.
+
+        `skip_url(키워드, URL)`이 True를 반환하는 기사는 상세 페이지를 요청하지 않는다
+        (주기 실행에서 이전 tick에 수집한 기사를 건너뛸 때 사용).
+
+        `journal`이 주어지면 완료한 검색 페이지, 수집한 기사, 실패한 작업의 에러를 기록하고,
+        이미 기록된 작업은 다시 실행하지 않는다. 이전에 기록한 기사와 에러는 가장 먼저
+        다시 yield한다.
+
+        `settings.dedup_mode`가 "off"가 아니면 실행마다 근접 중복 색인을 만들어 기사에
+        군집 id를 표시하고, "drop"이면 먼저 나온 기사와 거의 같은 기사는 yield하지 않는다.
+
+        `settings.fingerprint_db`가 지정되면 저장된 본문 지문과 같은 기사는 yield하지 않고,
+        나머지는 `metadata["updated"]`를 표시한다. 지문은 끝까지 실행된 경우에만 저장한다.
+        """
+        if self._http_client is None:
+            # 세션 밖에서 호출되면 이번 실행 동안만 유지되는 세션을 연다
+            async with CrawlOrchestrator(
+                self._settings, self._strategy_wrapper, self._host_throttle
+            ) as session:
+                async with aclosing(
+                    session.run_iter(keywords, channels, max_pages, max_workers, skip_url, journal)
+                ) as events:
+                    async for event in events:
+                        yield event
+            return
+
+        target_channels = channels or get_available_channels()
+        started = time.perf_counter()
 
         logger.info(
             "크롤링 시작: 채널=%s, 키워드=%s",
@@ -35,53 +209,425 @@ class CrawlOrchestrator:
             keywords,
         )
 
-        async with HttpClient(self._settings.user_agent, self._settings.request_timeout) as http_client:
-            browser_client: BrowserClient | None = None
-            try:
-                if needs_browser:
-                    browser_client = BrowserClient(headless=self._settings.browser.headless)
-                    await browser_client.__aenter__()
-
-                # 채널-키워드 조합별 크롤링 태스크 생성
-                tasks: list[asyncio.Task[CrawlResult]] = []
-                for channel in target_channels:
-                    for keyword in keywords:
-                        crawler = await create_crawler(
-                            channel, self._settings, http_client, browser_client
+        queue: asyncio.Queue[CrawlEvent | None] = asyncio.Queue(
+            maxsize=self._settings.stream_buffer_size
+        )
+        scheduler = WorkScheduler(
+            lambda item: self._handle(item, scheduler, queue, skip_url, journal),
+            workers=max_workers or self._settings.max_workers,
+            slots=self._channel_slots,
+        )
+
+        # 채널-키워드 조합별 검색 페이지 작업 생성 (크롤러는 채널당 하나)
+        # 1페이지만 먼저 넣고, 나머지는 1페이지에서 알아낸 페이지 수만큼 이어서 넣는다
+        pages = max_pages or self._settings.max_pages
+        # 크롤러를 동시에 만들어 동적 채널이 브라우저를 띄우는 동안 다른 채널은 연결을 준비한다
+        crawlers = await asyncio.gather(*(self.get_crawler(channel) for channel in target_channels))
+        for channel, crawler in zip(target_channels, crawlers, strict=True):
+            for query, batch in self._search_queries(crawler, keywords, pages):
+                if journal is None or not journal.is_search_done(channel, query, 1):
+                    scheduler.submit(
+                        WorkItem(
+                            WorkKind.SEARCH, crawler, query, page=1, last_page=pages, batch=batch
                         )
-                        tasks.append(asyncio.create_task(crawler.crawl(keyword)))
-
-                raw_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # 예외를 에러 결과로 변환
-                crawl_results: list[CrawlResult] = []
-                task_index = 0
-                for channel in target_channels:
-                    for keyword in keywords:
-                        result = raw_results[task_index]
-                        if isinstance(result, BaseException):
-                            logger.error(
-                                "[%s] '%s' 크롤링 실패: %s",
-                                channel,
-                                keyword,
-                                result,
-                            )
-                            crawl_results.append(
-                                CrawlResult(
-                                    channel=channel,
-                                    keyword=keyword,
-                                    errors=[str(result)],
-                                )
-                            )
-                        else:
-                            crawl_results.append(result)
-                        task_index += 1
-
-                logger.info(
-                    "크롤링 완료: 총 %d건 결과",
-                    len(crawl_results),
+                    )
+                    continue
+                # 재개한 실행에서 1페이지가 이미 끝났으면 페이지 수를 모르므로 모두 넣는다
+                for page in range(1, pages + 1):
+                    self._submit_search(scheduler, crawler, query, page, journal, batch)
+
+        changes = ChangeDetector(self._fingerprints) if self._fingerprints else None
+        dedup = self._dedup_stage()
+
+        def accept(event: CrawlEvent) -> bool:
+            if event.article is None:
+                return True
+            if changes is not None and not changes.process(event.article):
+                return False
+            return dedup is None or dedup.process(event.article)
+
+        runner = asyncio.create_task(self._run_scheduler(scheduler, queue))
+        try:
+            if journal:
+                # 이전 실행의 기사와 에러를 먼저 내보낸다 (실패한 작업은 다시 요청하지 않는다)
+                for event in [*journal.state.articles, *journal.state.errors]:
+                    if accept(event):
+                        yield event
+            first_article = True
+            while (event := await queue.get()) is not None:
+                if accept(event):
+                    if first_article and event.article is not None:
+                        first_article = False
+                        self._report_first_article(time.perf_counter() - started)
+                    yield event
+            if changes is not None:
+                changes.commit()
+        finally:
+            if changes is not None and changes.unchanged:
+                logger.info("본문이 바뀌지 않은 기사 %d건 제외", changes.unchanged)
+            if dedup is not None and dedup.dropped:
+                logger.info("근접 중복 기사 %d건 제외", dedup.dropped)
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+    async def get_crawler(self, channel: str) -> BaseCrawler:
+        """세션 동안 채널별 크롤러를 재사용한다. 동적 채널이면 브라우저를 먼저 띄운다.
+
+        cassette 재생 중에는 네트워크와 브라우저 없이 기록된 응답을 사용한다.
+        """
+        if channel not in self._crawlers:
+            replay = None
+            if self._replay is not None:
+                replay = ReplayFetchStrategy(
+                    self._replay, get_strategy_type(channel), self._settings.replay_latency
                 )
-                return crawl_results
-            finally:
-                if browser_client:
-                    await browser_client.__aexit__(None, None, None)
+            elif has_dynamic_channel([channel]):
+                await self.start_browser()
+            self._crawlers[channel] = await create_crawler(
+                channel,
+                self._settings,
+                self._http_client,
+                self._browser_client,
+                strategy_wrapper=self._wrap_strategy,
+                fetch_strategy=replay,
+            )
+            if replay is None:
+                self._start_warm_up(self._crawlers[channel])
+        return self._crawlers[channel]
+
+    def _start_warm_up(self, crawler: BaseCrawler) -> None:
+        """크롤러 호스트의 연결을 백그라운드에서 미리 준비한다.
+
+        기다리지 않으므로 다른 크롤러 생성과 작업 계획이 그동안 진행된다. 준비가 끝나기
+        전에 첫 요청이 나가도 DNS 조회는 진행 중인 조회를 함께 기다린다.
+        """
+        connections = self._settings.warmup_connections
+        if connections <= 0:
+            return
+        task = asyncio.create_task(self._warm_up(crawler, connections))
+        self._warmups.add(task)
+        task.add_done_callback(self._warmups.discard)
+
+    @staticmethod
+    async def _warm_up(crawler: BaseCrawler, connections: int) -> None:
+        started = time.perf_counter()
+        try:
+            await crawler.warm_up(connections)
+        except Exception as e:
+            logger.warning("[%s] 연결 미리 준비 실패: %s", crawler.channel_name, e)
+            return
+        logger.debug(
+            "[%s] 연결 미리 준비 완료 (%.2f초)", crawler.channel_name, time.perf_counter() - started
+        )
+
+    def _report_first_article(self, elapsed: float) -> None:
+        """실행 시작부터 첫 기사까지 걸린 시간(TTFA)을 기록한다."""
+        warmup = "on" if self._settings.warmup_connections > 0 and self._replay is None else "off"
+        TIME_TO_FIRST_ARTICLE.observe(elapsed, warmup=warmup)
+        logger.info("첫 기사까지 %.2f초 (연결 미리 준비: %s)", elapsed, warmup)
+
+    def _search_queries(
+        self, crawler: BaseCrawler, keywords: list[str], pages: int
+    ) -> list[tuple[str, tuple[str, ...]]]:
+        """채널에 보낼 (검색어, 키워드 묶음) 목록. 묶음은 키워드가 둘 이상일 때만 채운다."""
+        max_length = self._settings.keyword_batch_max_length
+        batches = crawler.batch_keywords(keywords, max_length)
+        if len(batches) < len(keywords):
+            logger.info(
+                "[%s] 키워드 %d개를 묶음 검색 %d개로 실행: 검색 페이지 요청 최대 %d건 → %d건",
+                crawler.channel_name,
+                len(keywords),
+                len(batches),
+                len(keywords) * pages,
+                len(batches) * pages,
+            )
+        return [(query, batch if len(batch) > 1 else ()) for query, batch in batches]
+
+    @staticmethod
+    def _submit_search(
+        scheduler: WorkScheduler,
+        crawler: BaseCrawler,
+        keyword: str,
+        page: int,
+        journal: "RunJournal | None",
+        batch: tuple[str, ...] = (),
+    ) -> None:
+        """검색 페이지 작업을 넣는다. 저널에 완료된 페이지면 미수집 기사만 다시 넣는다."""
+        if journal is None or not journal.is_search_done(crawler.channel_name, keyword, page):
+            scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, keyword, page=page, batch=batch))
+            return
+        for sr in journal.state.pending_details(crawler.channel_name, keyword, page, batch):
+            scheduler.submit(
+                WorkItem(WorkKind.DETAIL, crawler, keyword, search_result=sr, batch=batch)
+            )
+
+    def _dedup_stage(self) -> DedupStage | None:
+        mode = DedupMode(self._settings.dedup_mode)
+        if mode is DedupMode.OFF:
+            return None
+        return DedupStage(mode, NearDuplicateIndex(self._settings.dedup_max_distance))
+
+    def host_limits(self) -> dict[str, int]:
+        """호스트별 현재 동시 요청 상한 (적응형 동시성 제어를 끄면 빈 사전)"""
+        return self._concurrency.limits()
+
+    def _channel_limit(self) -> int:
+        """스케줄러의 채널별 기본 동시 실행 상한
+
+        적응형 동시성 제어를 켜면 호스트별 AIMD limiter가 동시 요청 수를 정하도록
+        limiter의 최대 상한까지 허용한다. 채널 상한이 더 작으면 limiter가 포화에 닿지
+        못해 상한이 `channel_concurrency` 위로 오르지 않는다.
+        """
+        limit = self._settings.channel_concurrency
+        if self._settings.adaptive_concurrency:
+            return max(limit, self._settings.adaptive_max_limit)
+        return limit
+
+    def _wrap_strategy(self, strategy: FetchStrategy) -> FetchStrategy:
+        """채널 fetch 전략에 호스트별 동시성 제어, 재시도, circuit breaker를 적용한다.
+
+        동시성 제어가 안쪽에 있으므로 재시도 대기 중에는 호스트 슬롯을 점유하지 않는다.
+        호스트 요청 간격 대기는 동시성 제어와 재시도 사이에서 시도마다 거친다.
+        기록 중이면 가장 안쪽에서 실제 요청 시도(재시도 포함) 하나하나를 기록한다.
+        요청 합치기는 가장 바깥에 있으므로 같은 페이지를 동시에 요청하면 재시도까지
+        한 번만 실행하고 결과(또는 실패)를 함께 받는다.
+        """
+        if self._strategy_wrapper is not None:
+            strategy = self._strategy_wrapper(strategy)
+        if self._recorder is not None:
+            strategy = RecordingFetchStrategy(strategy, self._recorder)
+        if self._settings.adaptive_concurrency:
+            strategy = AdaptiveFetchStrategy(strategy, self._concurrency)
+        if self._host_throttle is not None:
+            strategy = ThrottledFetchStrategy(strategy, self._host_throttle)
+        strategy = ResilientFetchStrategy(strategy, self._breakers, self._settings)
+        if self._settings.coalesce_requests:
+            strategy = CoalescingFetchStrategy(strategy, self._inflight)
+        return strategy
+
+    async def _run_scheduler(
+        self,
+        scheduler: WorkScheduler,
+        queue: asyncio.Queue[CrawlEvent | None],
+    ) -> None:
+        """모든 작업이 끝나면 종료 표시(None)를 큐에 넣는다."""
+        interval = self._settings.scheduler_report_interval
+        await scheduler.run(report_interval=interval or None)
+        if limits := self.host_limits():
+            logger.info("호스트별 동시 요청 상한: %s", limits)
+        await queue.put(None)
+
+    async def _handle(
+        self,
+        item: WorkItem,
+        scheduler: WorkScheduler,
+        queue: asyncio.Queue[CrawlEvent | None],
+        skip_url: Callable[[str, str], bool] | None = None,
+        journal: "RunJournal | None" = None,
+    ) -> None:
+        """작업 단위 하나를 trace 최상위 구간으로 감싸 실행한다 (샘플링 단위)."""
+        if item.kind is WorkKind.SEARCH:
+            target = {"page": item.page}
+        else:
+            target = {"url": item.search_result.url}
+        with TRACER.span(
+            item.kind.name.lower(), "work", channel=item.channel, keyword=item.keyword, **target
+        ):
+            await self._execute(item, scheduler, queue, skip_url, journal)
+
+    async def _emit(
+        self,
+        crawler: BaseCrawler,
+        keyword: str,
+        article: Article,
+        queue: asyncio.Queue[CrawlEvent | None],
+        journal: "RunJournal | None",
+    ) -> None:
+        event = CrawlEvent(crawler.channel_name, keyword, article=article)
+        if journal:
+            journal.record_article(event)
+        await queue.put(event)
+
+    async def _emit_matched(
+        self,
+        item: WorkItem,
+        article: Article,
+        queue: asyncio.Queue[CrawlEvent | None],
+        journal: "RunJournal | None",
+    ) -> None:
+        """묶음 검색으로 찾은 기사를 제목, 요약, 본문에 나오는 키워드마다 내보낸다."""
+        sr = item.search_result
+        text = f"{article.title}\n{sr.snippet}\n{article.content}"
+        matched = match_keywords(item.batch, text)
+        if not matched:
+            logger.debug("[%s] 묶음 키워드가 본문에 없는 기사 제외: %s", item.channel, sr.url)
+            return
+        for i, keyword in enumerate(matched):
+            copy = article if i == 0 else article.model_copy(deep=True)
+            copy.keyword = keyword
+            await self._emit(item.crawler, keyword, copy, queue, journal)
+
+    async def _error(
+        self,
+        item: WorkItem,
+        error: str,
+        queue: asyncio.Queue[CrawlEvent | None],
+        journal: "RunJournal | None",
+    ) -> None:
+        events = [CrawlEvent(item.channel, keyword, error=error) for keyword in item.keywords]
+        if journal:
+            if item.kind is WorkKind.SEARCH:
+                journal.record_error(item.channel, item.keyword, events, page=item.page)
+            else:
+                journal.record_error(item.channel, item.keyword, events, url=item.search_result.url)
+        for event in events:
+            await queue.put(event)
+
+    def _fan_out(
+        self,
+        item: WorkItem,
+        available: int | None,
+        scheduler: WorkScheduler,
+        journal: "RunJournal | None",
+    ) -> None:
+        """1페이지 작업이 끝나면 2페이지부터 검색 가능한 페이지까지 작업을 한꺼번에 넣는다."""
+        if item.kind is not WorkKind.SEARCH or item.last_page <= 1:
+            return
+        last_page = min(item.last_page, available) if available else item.last_page
+        if last_page < item.last_page:
+            logger.debug(
+                "[%s] '%s' 검색 결과는 %d페이지까지만 요청",
+                item.channel,
+                item.keyword,
+                last_page,
+            )
+        for page in range(2, last_page + 1):
+            self._submit_search(scheduler, item.crawler, item.keyword, page, journal, item.batch)
+        item.last_page = 0
+
+    async def _dispatch_results(
+        self,
+        item: WorkItem,
+        search_results: list[SearchResult],
+        scheduler: WorkScheduler,
+        queue: asyncio.Queue[CrawlEvent | None],
+        skip_url: Callable[[str, str], bool] | None,
+        journal: "RunJournal | None",
+    ) -> None:
+        """검색 결과를 키워드에 배정해 기사로 내보내거나 상세 페이지 작업을 넣는다.
+
+        묶음 검색이면 제목과 요약에 나오는 키워드에 배정하고, 나오는 키워드가 없으면
+        묶음 전체를 후보로 상세 페이지를 가져와 본문으로 다시 찾는다.
+        """
+        crawler = item.crawler
+        skipped = 0
+        for sr in search_results:
+            candidates = item.keywords
+            matched = True
+            if item.batch:
+                candidates = tuple(match_keywords(item.batch, f"{sr.title}\n{sr.snippet}"))
+                matched = bool(candidates)
+                candidates = candidates or item.batch
+            if skip_url:
+                candidates = tuple(k for k in candidates if not skip_url(k, sr.url))
+                if not candidates:
+                    skipped += 1
+                    continue
+            if article := crawler.listing_article(sr, candidates[0]):
+                # 목록만으로 충분하면 상세 페이지 작업을 만들지 않는다
+                # (본문이 없으므로 목록에 키워드가 없는 묶음 검색 결과는 배정하지 않는다)
+                if not matched:
+                    logger.debug(
+                        "[%s] 묶음 키워드가 목록에 없는 기사 제외: %s", item.channel, sr.url
+                    )
+                    continue
+                await self._emit(crawler, candidates[0], article, queue, journal)
+                for keyword in candidates[1:]:
+                    article = crawler.listing_article(sr, keyword)
+                    await self._emit(crawler, keyword, article, queue, journal)
+                continue
+            scheduler.submit(
+                WorkItem(
+                    WorkKind.DETAIL,
+                    crawler,
+                    candidates[0],
+                    search_result=sr,
+                    batch=candidates if item.batch else (),
+                )
+            )
+        if skipped:
+            logger.debug(
+                "[%s] 페이지 %d: 이미 수집한 기사 %d건 건너뜀", item.channel, item.page, skipped
+            )
+
+    async def _execute(
+        self,
+        item: WorkItem,
+        scheduler: WorkScheduler,
+        queue: asyncio.Queue[CrawlEvent | None],
+        skip_url: Callable[[str, str], bool] | None = None,
+        journal: "RunJournal | None" = None,
+    ) -> None:
+        """작업 단위 하나를 실행하고 결과 이벤트를 큐에 넣는다.
+
+        요청 후 `request_delay`만큼 채널 슬롯을 점유한 채 대기하여
+        채널별 요청 속도를 제한한다. 호스트의 circuit이 열려 있으면 채널 배정을
+        멈추고 작업을 다시 넣는다 (`circuit_max_deferrals`회를 넘으면 에러로 기록).
+        """
+        crawler = item.crawler
+        keyword = item.keyword
+        try:
+            if item.kind is WorkKind.SEARCH:
+                search_results, available = await crawler.fetch_search_listing(keyword, item.page)
+                if journal:
+                    journal.record_search(crawler.channel_name, keyword, item.page, search_results)
+                self._fan_out(item, available, scheduler, journal)
+                if item.batch:
+                    BATCHED_SEARCH_SAVED.inc(len(item.batch) - 1, channel=crawler.channel_name)
+                await self._dispatch_results(
+                    item, search_results, scheduler, queue, skip_url, journal
+                )
+            else:
+                sr = item.search_result
+                # 재개한 실행의 미수집 기사는 목록만으로 충분할 수 있다
+                # (요청하지 않으므로 요청 간격도 두지 않는다)
+                listing = crawler.listing_article(sr, keyword)
+                article = listing or await crawler.fetch_article(sr, keyword)
+                if not listing:
+                    logger.info("[%s] 기사 수집 완료: %s", crawler.channel_name, sr.title)
+                if item.batch:
+                    await self._emit_matched(item, article, queue, journal)
+                else:
+                    await self._emit(crawler, keyword, article, queue, journal)
+                if listing:
+                    return
+        except CrawlerError as e:
+            if (
+                isinstance(e, CircuitOpenError)
+                and item.deferrals < self._settings.circuit_max_deferrals
+            ):
+                # 요청하지 않았으므로 채널 배정을 멈췄다가 같은 작업을 다시 실행한다
+                item.deferrals += 1
+                scheduler.pause(crawler.channel_name, e.retry_after)
+                scheduler.submit(item)
+                return
+            # 1페이지가 실패하면 페이지 수를 모르므로 나머지 페이지를 모두 넣는다
+            self._fan_out(item, None, scheduler, journal)
+            if item.kind is WorkKind.SEARCH:
+                error_msg = f"페이지 {item.page} 검색 실패: {e}"
+            else:
+                error_msg = f"기사 수집 실패 ({item.search_result.url}): {e}"
+            logger.warning(error_msg)
+            await self._error(item, error_msg, queue, journal)
+        except Exception as e:
+            self._fan_out(item, None, scheduler, journal)
+            logger.error(
+                "[%s] '%s' 크롤링 실패: %s",
+                crawler.channel_name,
+                keyword,
+                e,
+            )
+            await self._error(item, str(e), queue, journal)
+
+        with TRACER.span("sleep", "sleep", channel=crawler.channel_name, reason="request_delay"):
+            await asyncio.sleep(self._settings.request_delay)
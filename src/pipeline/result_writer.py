@@ -4,6 +4,7 @@ from datetime import datetime
 from pathlib import Path
 
 from src.core.models import CrawlResult
+from src.core.tracing import TRACER
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +16,32 @@ class ResultWriter:
         self._output_dir = Path(output_dir)
         self._output_dir.mkdir(parents=True, exist_ok=True)
 
-    def write(self, results: list[CrawlResult]) -> Path:
-        """결과를 JSON 파일로 저장하고 파일 경로를 반환한다."""
+    def write(
+        self,
+        results: list[CrawlResult],
+        prefix: str = "crawl",
+        filename: str | None = None,
+    ) -> Path:
+        """결과를 JSON 파일로 저장하고 파일 경로를 반환한다.
+
+        `prefix`는 파일명 접두사이다 (주기 실행에서 그룹별 파일을 구분할 때 사용).
+        `filename`을 지정하면 그 이름으로 저장한다 (재개한 실행이 같은 파일에 쓸 때 사용).
+        """
         total_articles = sum(len(r.articles) for r in results)
-
-        output = {
-            "crawled_at": datetime.now().isoformat(),
-            "total_channels": len({r.channel for r in results}),
-            "total_articles": total_articles,
-            "results": [r.model_dump(mode="json") for r in results],
-        }
-
-        filename = f"crawl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = filename or f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         filepath = self._output_dir / filename
-        filepath.write_text(
-            json.dumps(output, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+
+        with TRACER.span("write", "io", path=str(filepath), articles=total_articles):
+            output = {
+                "crawled_at": datetime.now().isoformat(),
+                "total_channels": len({r.channel for r in results}),
+                "total_articles": total_articles,
+                "results": [r.model_dump(mode="json") for r in results],
+            }
+            filepath.write_text(
+                json.dumps(output, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
 
         logger.info("결과 저장 완료: %s (기사 %d건)", filepath, total_articles)
         return filepath
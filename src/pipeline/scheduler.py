@@ -0,0 +1,281 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from src.core.base_crawler import BaseCrawler
+from src.core.metrics import QUEUE_WAIT_SECONDS
+from src.core.models import SearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class WorkKind(IntEnum):
+    """작업 단위 종류 (값이 작을수록 우선순위가 높다)"""
+
+    # 이미 발견한 기사를 먼저 끝내야 대기 중인 작업 수가 늘어나지 않는다
+    DETAIL = 0
+    SEARCH = 1
+
+
+@dataclass(slots=True)
+class WorkItem:
+    """스케줄러가 워커에 배정하는 작업 단위 (검색 페이지 1개 또는 기사 1개)"""
+
+    kind: WorkKind
+    crawler: BaseCrawler
+    keyword: str
+    page: int = 0
+    # 1페이지 작업이면 검색 가능한 페이지 수를 알아낸 뒤 이어서 넣을 마지막 페이지
+    last_page: int = 0
+    search_result: SearchResult | None = None
+    # 키워드 묶음 검색: 검색 작업이면 OR 검색어(keyword)로 묶은 키워드,
+    # 상세 작업이면 기사를 배정할 후보 키워드 (본문에 나오는 키워드에만 배정한다)
+    batch: tuple[str, ...] = ()
+    enqueued_at: float = 0.0
+    # circuit open으로 뒤로 미룬 횟수
+    deferrals: int = 0
+
+    @property
+    def channel(self) -> str:
+        return self.crawler.channel_name
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        """이 작업의 결과를 배정할 키워드"""
+        return self.batch or (self.keyword,)
+
+
+@dataclass(slots=True)
+class SchedulerStats:
+    """스케줄러 상태 스냅샷"""
+
+    workers: int
+    queue_depth: int
+    in_flight: int
+    completed: int
+    busy_seconds: float
+    elapsed_seconds: float
+    queue_wait_seconds: float
+    queue_depth_by_channel: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def utilization(self) -> float:
+        """전체 워커 시간 중 작업을 처리한 시간의 비율"""
+        capacity = self.workers * self.elapsed_seconds
+        return self.busy_seconds / capacity if capacity else 0.0
+
+    @property
+    def avg_queue_wait(self) -> float:
+        return self.queue_wait_seconds / self.completed if self.completed else 0.0
+
+
+WorkHandler = Callable[[WorkItem], Awaitable[None]]
+
+
+class ChannelSlots:
+    """채널별 동시 실행 수와 상한 (여러 스케줄러가 공유할 수 있다)
+
+    daemon 모드처럼 한 오케스트레이터 세션에서 여러 실행이 동시에 돌 때도 채널별 상한이
+    실행마다가 아니라 세션 전체에 적용되도록 스케줄러들이 같은 인스턴스를 쓴다.
+    슬롯이 풀리면 구독한 모든 스케줄러를 깨운다.
+    """
+
+    def __init__(self, limit: int, limits: dict[str, int] | None = None) -> None:
+        self._limit = limit
+        self._limits = limits or {}
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._listeners: set[asyncio.Event] = set()
+
+    def capacity(self, channel: str) -> int:
+        return self._limits.get(channel, self._limit)
+
+    def available(self, channel: str) -> bool:
+        return self._in_flight[channel] < self.capacity(channel)
+
+    def acquire(self, channel: str) -> None:
+        self._in_flight[channel] += 1
+
+    def release(self, channel: str) -> None:
+        self._in_flight[channel] -= 1
+        for event in self._listeners:
+            event.set()
+
+    def subscribe(self, event: asyncio.Event) -> None:
+        self._listeners.add(event)
+
+    def unsubscribe(self, event: asyncio.Event) -> None:
+        self._listeners.discard(event)
+
+
+class WorkScheduler:
+    """고정 크기 워커 풀로 작업 단위를 실행하는 스케줄러
+
+    - 워커 수가 전체 동시 실행 수의 상한이다.
+    - 채널별 동시 실행 수 상한(`slots`)을 넘는 작업은 다른 채널 작업에 자리를 양보한다.
+      `slots`를 공유하는 다른 스케줄러의 실행 중인 작업도 함께 센다.
+    - 같은 종류의 작업은 채널-키워드 스트림 간 라운드 로빈 순서로 배정된다.
+    - `pause()`로 멈춘 채널의 작업은 재개 시각까지 배정하지 않는다.
+    """
+
+    def __init__(
+        self,
+        handler: WorkHandler,
+        workers: int,
+        slots: ChannelSlots,
+    ) -> None:
+        self._handler = handler
+        self._workers = workers
+        self._slots = slots
+
+        # 채널별 우선순위 큐: (종류, 스트림 내 순번, 전역 순번, 작업)
+        self._queues: dict[str, list[tuple[int, int, int, WorkItem]]] = defaultdict(list)
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._stream_rounds: dict[tuple[str, str, WorkKind], int] = defaultdict(int)
+        self._paused_until: dict[str, float] = {}
+        self._seq = itertools.count()
+        # 큐나 실행 상태가 바뀔 때마다 set되어 대기 중인 워커와 run()을 깨운다
+        self._changed = asyncio.Event()
+
+        self._pending = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+        self._started_at: float | None = None
+
+    def submit(self, item: WorkItem) -> None:
+        """작업을 큐에 추가한다. 워커 내부(핸들러)에서 호출해도 안전하다."""
+        stream = (item.channel, item.keyword, item.kind)
+        round_no = self._stream_rounds[stream]
+        self._stream_rounds[stream] = round_no + 1
+        item.enqueued_at = time.monotonic()
+
+        heapq.heappush(self._queues[item.channel], (item.kind, round_no, next(self._seq), item))
+        self._pending += 1
+        self._changed.set()
+
+    def pause(self, channel: str, seconds: float) -> None:
+        """채널 작업 배정을 `seconds`초 동안 멈춘다 (이미 더 길게 멈춰 있으면 유지)."""
+        until = time.monotonic() + seconds
+        if until > self._paused_until.get(channel, 0.0):
+            self._paused_until[channel] = until
+            logger.info("[%s] 작업 배정 %.0f초 중단", channel, seconds)
+        self._changed.set()
+
+    def stats(self) -> SchedulerStats:
+        """현재 큐 깊이와 워커 사용률을 반환한다."""
+        now = time.monotonic()
+        return SchedulerStats(
+            workers=self._workers,
+            queue_depth=sum(len(q) for q in self._queues.values()),
+            in_flight=sum(self._in_flight.values()),
+            completed=self._completed,
+            busy_seconds=self._busy_seconds,
+            elapsed_seconds=now - self._started_at if self._started_at else 0.0,
+            queue_wait_seconds=self._queue_wait_seconds,
+            queue_depth_by_channel={ch: len(q) for ch, q in self._queues.items() if q},
+        )
+
+    async def run(self, report_interval: float | None = None) -> SchedulerStats:
+        """큐가 빌 때까지 워커를 실행하고 최종 통계를 반환한다."""
+        self._started_at = time.monotonic()
+        workers = [
+            asyncio.create_task(self._worker(), name=f"worker-{i}") for i in range(self._workers)
+        ]
+        reporter = asyncio.create_task(self._report(report_interval)) if report_interval else None
+        # 다른 스케줄러가 채널 슬롯을 풀 때도 깨어나 작업을 다시 확인한다
+        self._slots.subscribe(self._changed)
+        try:
+            while self._pending:
+                self._changed.clear()
+                await self._changed.wait()
+        finally:
+            self._slots.unsubscribe(self._changed)
+            for task in workers:
+                task.cancel()
+            if reporter:
+                reporter.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        stats = self.stats()
+        logger.info(
+            "스케줄러 종료: 작업 %d건, 워커 %d개, 사용률 %.0f%%, 평균 대기 %.2f초",
+            stats.completed,
+            stats.workers,
+            stats.utilization * 100,
+            stats.avg_queue_wait,
+        )
+        return stats
+
+    def _pop_next(self) -> WorkItem | None:
+        """동시 실행 상한에 여유가 있는 채널 중 우선순위가 가장 높은 작업을 꺼낸다."""
+        best_channel: str | None = None
+        now = time.monotonic()
+        for channel, queue in self._queues.items():
+            if not queue or not self._slots.available(channel):
+                continue
+            if self._paused_until.get(channel, 0.0) > now:
+                continue
+            if best_channel is None or queue[0] < self._queues[best_channel][0]:
+                best_channel = channel
+
+        if best_channel is None:
+            return None
+        _, _, _, item = heapq.heappop(self._queues[best_channel])
+        self._in_flight[best_channel] += 1
+        self._slots.acquire(best_channel)
+        return item
+
+    def _next_resume_in(self) -> float | None:
+        """작업이 남은 멈춘 채널 중 가장 먼저 재개되기까지 남은 시간"""
+        now = time.monotonic()
+        waits = [
+            until - now
+            for channel, until in self._paused_until.items()
+            if until > now and self._queues[channel]
+        ]
+        return min(waits) if waits else None
+
+    async def _worker(self) -> None:
+        while True:
+            while (item := self._pop_next()) is None:
+                self._changed.clear()
+                # 멈춘 채널이 재개될 시각에도 깨어나 작업을 다시 확인한다
+                try:
+                    await asyncio.wait_for(self._changed.wait(), self._next_resume_in())
+                except TimeoutError:
+                    pass
+
+            started = time.monotonic()
+            waited = started - item.enqueued_at
+            self._queue_wait_seconds += waited
+            QUEUE_WAIT_SECONDS.observe(waited, channel=item.channel, kind=item.kind.name.lower())
+            try:
+                await self._handler(item)
+            except Exception:
+                logger.exception("[%s] 작업 처리 중 예외: %s", item.channel, item.kind.name)
+            finally:
+                self._busy_seconds += time.monotonic() - started
+                self._completed += 1
+                self._pending -= 1
+                self._in_flight[item.channel] -= 1
+                self._slots.release(item.channel)
+                self._changed.set()
+
+    async def _report(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            stats = self.stats()
+            logger.info(
+                "스케줄러 상태: 대기 %d건 %s, 실행 중 %d건, 완료 %d건, 사용률 %.0f%%",
+                stats.queue_depth,
+                stats.queue_depth_by_channel,
+                stats.in_flight,
+                stats.completed,
+                stats.utilization * 100,
+            )
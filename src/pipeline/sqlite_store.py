@@ -0,0 +1,223 @@
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from src.core.models import Article, CrawlResult
+from src.core.tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    published_at TEXT,
+    channel TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    crawled_at TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date
+    ON articles (COALESCE(published_at, crawled_at));
+CREATE INDEX IF NOT EXISTS idx_articles_channel ON articles (channel);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content, content='articles', content_rowid='id', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO articles_fts (rowid, title, content)
+    VALUES (new.id, new.title, new.content);
+END;
+"""
+
+_INSERT_SQL = """
+INSERT INTO articles
+    (url, title, content, published_at, channel, keyword, crawled_at, metadata)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (url) DO NOTHING
+"""
+
+_ARTICLE_COLUMNS = (
+    "a.title, a.url, a.content, a.published_at, a.channel, a.keyword, a.crawled_at, a.metadata"
+)
+
+# 기사 날짜 기준: 발행일이 없으면 수집 시각 사용
+_DATE_EXPR = "COALESCE(a.published_at, a.crawled_at)"
+
+
+def _to_match_query(query: str, prefix: bool) -> str:
+    """검색어를 FTS5 MATCH 식으로 변환한다.
+
+    한국어는 조사가 붙어 토큰화되므로("반도체가") 기본적으로 각 단어를
+    접두사 검색으로 바꾼다. 따옴표는 FTS5 문법에 맞게 이스케이프한다.
+    글자나 숫자가 없는 단어(문장 부호)는 토큰이 없어 아무것도 찾지 못하므로 뺀다.
+    검색할 단어가 없으면 빈 문자열을 반환한다.
+    """
+    terms = [term.replace('"', '""') for term in query.split() if any(ch.isalnum() for ch in term)]
+    suffix = "*" if prefix else ""
+    return " ".join(f'"{term}"{suffix}' for term in terms)
+
+
+def _row_to_article(row: sqlite3.Row) -> Article:
+    published_at = row["published_at"]
+    return Article(
+        title=row["title"],
+        url=row["url"],
+        content=row["content"],
+        published_at=datetime.fromisoformat(published_at) if published_at else None,
+        channel=row["channel"],
+        keyword=row["keyword"],
+        crawled_at=datetime.fromisoformat(row["crawled_at"]),
+        metadata=json.loads(row["metadata"]),
+    )
+
+
+class SqliteStore:
+    """크롤링 결과를 SQLite에 저장하고 FTS5 전문 검색을 제공한다.
+
+    URL에 UNIQUE 제약이 있어 같은 기사는 한 번만 저장된다.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 500) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def write(self, results: list[CrawlResult]) -> int:
+        """결과의 모든 기사를 저장하고 새로 추가된 기사 수를 반환한다."""
+        with TRACER.span("db_write", "io", path=str(self._db_path)):
+            inserted = self.insert_articles(a for r in results for a in r.articles)
+        logger.info("SQLite 저장 완료: %s (신규 기사 %d건)", self._db_path, inserted)
+        return inserted
+
+    def insert_articles(self, articles: Iterable[Article]) -> int:
+        """기사를 batch_size 단위 트랜잭션으로 일괄 저장한다. 중복 URL은 무시한다."""
+        inserted = 0
+        batch: list[tuple] = []
+
+        for article in articles:
+            batch.append(
+                (
+                    article.url,
+                    article.title,
+                    article.content,
+                    article.published_at.isoformat() if article.published_at else None,
+                    article.channel,
+                    article.keyword,
+                    article.crawled_at.isoformat(),
+                    json.dumps(article.metadata, ensure_ascii=False),
+                )
+            )
+            if len(batch) >= self._batch_size:
+                inserted += self._flush(batch)
+                batch = []
+
+        if batch:
+            inserted += self._flush(batch)
+        return inserted
+
+    def _flush(self, batch: list[tuple]) -> int:
+        with self._conn:
+            # executemany는 하나의 prepared statement를 재사용한다.
+            # rowcount에는 FTS 트리거 변경분이 포함되지 않는다.
+            cursor = self._conn.executemany(_INSERT_SQL, batch)
+        return cursor.rowcount
+
+    def search(
+        self,
+        query: str,
+        channel: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 50,
+        prefix: bool = True,
+    ) -> list[Article]:
+        """제목·본문 전문 검색 결과를 관련도(bm25) 순으로 반환한다.
+
+        검색어가 비었거나 문장 부호뿐이면 조회하지 않고 빈 목록을 반환한다.
+        """
+        match = _to_match_query(query, prefix)
+        if not match:
+            return []
+        where, params = self._build_filters(match, channel, since, until)
+        sql = (
+            f"SELECT {_ARTICLE_COLUMNS} FROM articles_fts "
+            "JOIN articles a ON a.id = articles_fts.rowid "
+            f"WHERE {where} ORDER BY articles_fts.rank LIMIT ?"
+        )
+        rows = self._conn.execute(sql, [*params, limit]).fetchall()
+        return [_row_to_article(row) for row in rows]
+
+    def count_by_day(
+        self,
+        query: str,
+        channel: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        prefix: bool = True,
+    ) -> list[tuple[str, int]]:
+        """검색어가 언급된 기사 수를 날짜별로 집계한다 (트렌드 조회용).
+
+        검색어가 비었거나 문장 부호뿐이면 빈 목록을 반환한다.
+        """
+        match = _to_match_query(query, prefix)
+        if not match:
+            return []
+        where, params = self._build_filters(match, channel, since, until)
+        sql = (
+            f"SELECT substr({_DATE_EXPR}, 1, 10) AS day, COUNT(*) AS cnt FROM articles_fts "
+            "JOIN articles a ON a.id = articles_fts.rowid "
+            f"WHERE {where} GROUP BY day ORDER BY day"
+        )
+        rows = self._conn.execute(sql, params).fetchall()
+        return [(row["day"], row["cnt"]) for row in rows]
+
+    def _build_filters(
+        self,
+        match: str,
+        channel: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[str, list]:
+        clauses = ["articles_fts MATCH ?"]
+        params: list = [match]
+        if channel:
+            clauses.append("a.channel = ?")
+            params.append(channel)
+        if since:
+            clauses.append(f"{_DATE_EXPR} >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append(f"{_DATE_EXPR} < ?")
+            params.append(until.isoformat())
+        return " AND ".join(clauses), params
@@ -0,0 +1,30 @@
+import importlib
+
+# 하위 모듈은 httpx, pydantic 등을 import하므로 실제 사용 시점에 로드한다
+_EXPORTS = {
+    "CrawlJob": "src.service.jobs",
+    "JobApiServer": "src.service.server",
+    "JobManager": "src.service.jobs",
+    "JobRequest": "src.service.jobs",
+    "JobState": "src.service.jobs",
+    "PeriodicRunner": "src.service.periodic",
+    "ScheduleSpec": "src.service.periodic",
+    "run_daemon": "src.service.daemon",
+}
+
+__all__ = [
+    "CrawlJob",
+    "JobApiServer",
+    "JobManager",
+    "JobRequest",
+    "JobState",
+    "PeriodicRunner",
+    "ScheduleSpec",
+    "run_daemon",
+]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,44 @@
+import asyncio
+import contextlib
+import logging
+import signal
+
+from config.settings import CrawlerSettings
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.service.jobs import JobManager
+from src.service.server import JobApiServer
+
+logger = logging.getLogger(__name__)
+
+
+async def run_daemon(
+    settings: CrawlerSettings,
+    host: str | None = None,
+    port: int | None = None,
+    socket_path: str | None = None,
+    warm_browser: bool = False,
+) -> None:
+    """클라이언트와 크롤러를 유지한 채 작업 API를 실행한다. SIGINT/SIGTERM으로 종료한다."""
+    async with CrawlOrchestrator(settings) as orchestrator:
+        if warm_browser:
+            # 동적 채널 작업의 첫 요청이 브라우저 기동을 기다리지 않도록 미리 띄운다
+            await orchestrator.start_browser()
+
+        manager = JobManager(orchestrator, settings)
+        server = await JobApiServer(manager).start(
+            host=host or settings.daemon_host,
+            port=port or settings.daemon_port,
+            socket_path=socket_path,
+        )
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, stop.set)
+
+        async with server:
+            await stop.wait()
+            logger.info("daemon 종료 중: 실행 중인 작업을 취소합니다")
+            server.close()
+            await manager.shutdown()
@@ -0,0 +1,218 @@
+import asyncio
+import itertools
+import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, field_validator
+
+from config.settings import CrawlerSettings
+from src.core.models import CrawlEvent, CrawlResult
+from src.pipeline.channel_registry import get_available_channels
+from src.pipeline.orchestrator import CrawlOrchestrator
+
+logger = logging.getLogger(__name__)
+
+
+class JobState(StrEnum):
+    """크롤링 작업 상태"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+FINISHED_STATES = {JobState.COMPLETED, JobState.CANCELLED, JobState.FAILED}
+
+
+class JobRequest(BaseModel):
+    """크롤링 작업 요청 (작업별 리소스 제한 포함)"""
+
+    keywords: list[str] = Field(min_length=1)
+    channels: list[str] | None = None
+    max_pages: int | None = Field(default=None, ge=1)
+    # 작업 하나가 사용할 수 있는 워커 수 (서버 설정 max_workers를 넘을 수 없다)
+    max_workers: int | None = Field(default=None, ge=1)
+    # 수집 기사 수가 이 값에 도달하면 작업을 완료 처리한다
+    max_articles: int | None = Field(default=None, ge=1)
+    # 작업 제한 시간 (초)
+    timeout: float | None = Field(default=None, gt=0)
+
+    @field_validator("channels")
+    @classmethod
+    def _check_channels(cls, channels: list[str] | None) -> list[str] | None:
+        if channels:
+            unknown = set(channels) - set(get_available_channels())
+            if unknown:
+                raise ValueError(f"알 수 없는 채널: {sorted(unknown)}")
+        return channels
+
+
+class CrawlJob:
+    """실행 중이거나 완료된 크롤링 작업"""
+
+    def __init__(self, job_id: str, request: JobRequest) -> None:
+        self.id = job_id
+        self.request = request
+        self.state = JobState.QUEUED
+        self.error: str | None = None
+        self.created_at = datetime.now()
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.events: list[CrawlEvent] = []
+        # 이벤트마다 다시 세지 않도록 add_event에서 센다
+        self.article_count = 0
+        self.task: asyncio.Task[None] | None = None
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def add_event(self, event: CrawlEvent) -> None:
+        self.events.append(event)
+        if event.article is not None:
+            self.article_count += 1
+        self._changed.set()
+
+    def finish(self, state: JobState, error: str | None = None) -> None:
+        self.state = state
+        self.error = error
+        self.finished_at = datetime.now()
+        self._changed.set()
+
+    def status(self) -> dict:
+        """작업 상태 요약"""
+        return {
+            "id": self.id,
+            "state": self.state.value,
+            "request": self.request.model_dump(),
+            "articles": self.article_count,
+            "errors": len(self.events) - self.article_count,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def results(self) -> list[CrawlResult]:
+        """지금까지 수집된 이벤트를 채널-키워드별 CrawlResult로 모은다."""
+        results: dict[tuple[str, str], CrawlResult] = {}
+        for event in self.events:
+            key = (event.channel, event.keyword)
+            if key not in results:
+                results[key] = CrawlResult(channel=event.channel, keyword=event.keyword)
+            event.apply_to(results[key])
+        return list(results.values())
+
+    async def stream(self) -> AsyncIterator[CrawlEvent]:
+        """이미 수집된 이벤트부터 작업 종료 시까지의 이벤트를 차례로 yield한다."""
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self.finished:
+                return
+            self._changed.clear()
+            await self._changed.wait()
+
+
+class JobManager:
+    """warm 상태의 오케스트레이터로 크롤링 작업을 동시에 실행하고 관리한다."""
+
+    def __init__(self, orchestrator: CrawlOrchestrator, settings: CrawlerSettings) -> None:
+        self._orchestrator = orchestrator
+        self._settings = settings
+        self._jobs: dict[str, CrawlJob] = {}
+        self._ids = itertools.count(1)
+        self._slots = asyncio.Semaphore(settings.daemon_max_jobs)
+
+    def submit(self, request: JobRequest) -> CrawlJob:
+        """작업을 등록하고 실행 태스크를 시작한다."""
+        job = CrawlJob(f"job-{next(self._ids)}", request)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job))
+        self._evict_finished()
+        logger.info("작업 등록: %s (키워드=%s)", job.id, request.keywords)
+        return job
+
+    def get(self, job_id: str) -> CrawlJob | None:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[CrawlJob]:
+        return list(self._jobs.values())
+
+    def host_limits(self) -> dict[str, int]:
+        """오케스트레이터가 호스트별로 조절 중인 동시 요청 상한"""
+        return self._orchestrator.host_limits()
+
+    def cancel(self, job_id: str) -> bool:
+        """작업을 취소한다. 이미 끝난 작업이면 False를 반환한다."""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished or job.task is None:
+            return False
+        job.task.cancel()
+        return True
+
+    async def shutdown(self) -> None:
+        """실행 중인 모든 작업을 취소하고 종료를 기다린다."""
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.finished]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: CrawlJob) -> None:
+        request = job.request
+        timeout = request.timeout or self._settings.daemon_job_timeout
+        max_workers = min(
+            request.max_workers or self._settings.max_workers, self._settings.max_workers
+        )
+
+        try:
+            async with self._slots:
+                job.state = JobState.RUNNING
+                job.started_at = datetime.now()
+                async with asyncio.timeout(timeout):
+                    await self._collect(job, max_workers)
+        except asyncio.CancelledError:
+            job.finish(JobState.CANCELLED)
+            logger.info("작업 취소: %s", job.id)
+            return
+        except TimeoutError:
+            job.finish(JobState.FAILED, f"제한 시간 초과 ({timeout}초)")
+            logger.warning("작업 시간 초과: %s", job.id)
+            return
+        except Exception as e:
+            job.finish(JobState.FAILED, str(e))
+            logger.exception("작업 실패: %s", job.id)
+            return
+
+        job.finish(JobState.COMPLETED)
+        logger.info("작업 완료: %s (기사 %d건)", job.id, job.article_count)
+
+    async def _collect(self, job: CrawlJob, max_workers: int) -> None:
+        request = job.request
+        events = self._orchestrator.run_iter(
+            request.keywords,
+            request.channels,
+            max_pages=request.max_pages,
+            max_workers=max_workers,
+        )
+        async with aclosing(events):
+            async for event in events:
+                job.add_event(event)
+                if request.max_articles and job.article_count >= request.max_articles:
+                    logger.info("작업 기사 수 제한 도달: %s", job.id)
+                    break
+
+    def _evict_finished(self) -> None:
+        """보관 개수를 넘으면 가장 오래된 완료 작업부터 삭제한다."""
+        finished = [job for job in self._jobs.values() if job.finished]
+        overflow = len(self._jobs) - self._settings.daemon_job_history
+        for job in finished[: max(overflow, 0)]:
+            del self._jobs[job.id]
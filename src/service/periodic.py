@@ -0,0 +1,183 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.core.models import CrawlResult
+from src.pipeline.channel_registry import get_available_channels
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.pipeline.result_writer import ResultWriter
+from src.pipeline.sqlite_store import SqliteStore
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleGroup(BaseModel):
+    """같은 주기로 함께 실행할 키워드 그룹"""
+
+    name: str = Field(pattern=r"^[\w-]+$")
+    keywords: list[str] = Field(min_length=1)
+    channels: list[str] | None = None
+    # 실행 주기 (초)
+    interval: float = Field(gt=0)
+    max_pages: int | None = Field(default=None, ge=1)
+    # 주기 대비 무작위 흔들림 비율 (0.1이면 주기의 ±10%)
+    jitter: float = Field(default=0.1, ge=0, lt=1)
+
+    @field_validator("channels")
+    @classmethod
+    def _check_channels(cls, channels: list[str] | None) -> list[str] | None:
+        if channels:
+            unknown = set(channels) - set(get_available_channels())
+            if unknown:
+                raise ValueError(f"알 수 없는 채널: {sorted(unknown)}")
+        return channels
+
+
+class ScheduleSpec(BaseModel):
+    """주기 실행 작업 명세 (`--schedule`로 지정하는 JSON 파일)"""
+
+    groups: list[ScheduleGroup] = Field(min_length=1)
+    # tick 간 유지되는 수집 완료 URL 상태 파일
+    state_path: str = "./output/schedule_state.json"
+    # 수집 완료 URL을 기억하는 기간 (초). 지나면 상태에서 삭제된다
+    seen_ttl: float = Field(default=7 * 24 * 3600, gt=0)
+
+    @field_validator("groups")
+    @classmethod
+    def _check_unique_names(cls, groups: list[ScheduleGroup]) -> list[ScheduleGroup]:
+        names = [group.name for group in groups]
+        if len(names) != len(set(names)):
+            raise ValueError(f"그룹 이름이 중복됩니다: {names}")
+        return groups
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScheduleSpec":
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+class SeenUrlState:
+    """키워드별로 이미 수집한 기사 URL과 수집 시각 (tick 간, 재시작 간 유지)
+
+    같은 키워드를 여러 그룹이 공유해도 한 번 수집한 기사는 다시 요청하지 않는다.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self._path = Path(path)
+        self._ttl = ttl
+        self._seen: dict[str, dict[str, float]] = {}
+        if self._path.exists():
+            self._seen = json.loads(self._path.read_text(encoding="utf-8"))
+            logger.info("주기 실행 상태 로드: %s", self._path)
+
+    def is_seen(self, keyword: str, url: str) -> bool:
+        return url in self._seen.get(keyword, ())
+
+    def mark(self, results: list[CrawlResult]) -> int:
+        """수집된 기사 URL을 기록하고 새로 기록된 수를 반환한다."""
+        now = time.time()
+        added = 0
+        for result in results:
+            seen = self._seen.setdefault(result.keyword, {})
+            for article in result.articles:
+                if article.url not in seen:
+                    added += 1
+                for url in article.url_keys:
+                    seen[url] = now
+        return added
+
+    def prune(self) -> None:
+        """TTL이 지난 URL을 삭제한다."""
+        cutoff = time.time() - self._ttl
+        for keyword in list(self._seen):
+            seen = {url: ts for url, ts in self._seen[keyword].items() if ts >= cutoff}
+            if seen:
+                self._seen[keyword] = seen
+            else:
+                del self._seen[keyword]
+
+    def save(self) -> None:
+        """임시 파일에 쓴 뒤 교체하여 저장 도중 종료되어도 이전 상태를 보존한다."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self._seen, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self._path)
+
+
+class PeriodicRunner:
+    """하나의 오케스트레이터 세션에서 키워드 그룹을 각자의 주기로 반복 실행한다.
+
+    - 그룹마다 독립된 루프에서 실행하므로 같은 그룹의 tick은 겹치지 않는다.
+      tick이 주기보다 오래 걸리면 다음 tick은 끝난 직후 시작된다.
+    - 시작 시각과 주기에 jitter를 더해 그룹들의 실행 시점이 맞물리지 않게 한다.
+    - 이전 tick까지 수집한 기사는 상세 페이지를 요청하지 않는다.
+    """
+
+    def __init__(
+        self,
+        orchestrator: CrawlOrchestrator,
+        spec: ScheduleSpec,
+        writer: ResultWriter,
+        store: SqliteStore | None = None,
+    ) -> None:
+        self._orchestrator = orchestrator
+        self._spec = spec
+        self._writer = writer
+        self._store = store
+        self._state = SeenUrlState(spec.state_path, spec.seen_ttl)
+
+    async def run(self, max_ticks: int | None = None) -> None:
+        """모든 그룹 루프를 실행한다. `max_ticks`가 없으면 취소될 때까지 반복한다."""
+        logger.info("주기 실행 시작: 그룹 %s", [group.name for group in self._spec.groups])
+        async with asyncio.TaskGroup() as tg:
+            for group in self._spec.groups:
+                tg.create_task(self._group_loop(group, max_ticks))
+
+    async def run_tick(self, group: ScheduleGroup) -> list[CrawlResult]:
+        """그룹을 한 번 실행하고 새로 수집한 결과를 저장한다."""
+        results = await self._orchestrator.run(
+            group.keywords,
+            group.channels,
+            max_pages=group.max_pages,
+            skip_url=self._state.is_seen,
+        )
+        added = self._state.mark(results)
+        self._state.prune()
+        self._state.save()
+
+        if added:
+            self._writer.write(results, prefix=f"crawl_{group.name}")
+            if self._store:
+                self._store.write(results)
+        logger.info("[%s] tick 완료: 새 기사 %d건", group.name, added)
+        return results
+
+    async def _group_loop(self, group: ScheduleGroup, max_ticks: int | None) -> None:
+        # 시작 시점을 분산시켜 여러 그룹이 동시에 요청을 몰지 않도록 한다
+        await asyncio.sleep(random.uniform(0, group.interval * group.jitter))
+
+        tick = 0
+        while max_ticks is None or tick < max_ticks:
+            started = time.monotonic()
+            try:
+                await self.run_tick(group)
+            except Exception:
+                logger.exception("[%s] tick 실행 실패", group.name)
+            tick += 1
+            if max_ticks is not None and tick >= max_ticks:
+                break
+
+            elapsed = time.monotonic() - started
+            interval = group.interval * random.uniform(1 - group.jitter, 1 + group.jitter)
+            if elapsed > interval:
+                logger.warning(
+                    "[%s] tick 실행 시간(%.1f초)이 주기(%.1f초)를 넘었습니다",
+                    group.name,
+                    elapsed,
+                    interval,
+                )
+            await asyncio.sleep(max(interval - elapsed, 0))
@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+from contextlib import aclosing
+
+from pydantic import ValidationError
+
+from src.core.metrics import REGISTRY
+from src.service.jobs import CrawlJob, JobManager, JobRequest
+
+logger = logging.getLogger(__name__)
+
+# 요청 본문 최대 크기 (작업 요청 JSON만 받는다)
+MAX_BODY_BYTES = 64 * 1024
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+}
+
+
+class HttpError(Exception):
+    """API 요청 처리 중 클라이언트에 돌려줄 HTTP 에러"""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class JobApiServer:
+    """JobManager를 노출하는 로컬 HTTP/1.1 API 서버 (TCP 또는 Unix 소켓)
+
+    - POST   /jobs              작업 등록 (JobRequest JSON)
+    - GET    /jobs              작업 목록
+    - GET    /jobs/{id}         작업 상태
+    - GET    /jobs/{id}/results 채널-키워드별 결과 (진행 중이면 지금까지의 결과)
+    - GET    /jobs/{id}/stream  이벤트 NDJSON 스트림 (작업 종료 시 연결 종료)
+    - DELETE /jobs/{id}         작업 취소
+    - GET    /health            상태 확인
+    - GET    /metrics           Prometheus 텍스트 형식 지표
+    """
+
+    def __init__(self, manager: JobManager) -> None:
+        self._manager = manager
+
+    async def start(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        socket_path: str | None = None,
+    ) -> asyncio.AbstractServer:
+        """서버를 시작한다. `socket_path`가 주어지면 Unix 소켓으로 바인딩한다."""
+        if socket_path:
+            server = await asyncio.start_unix_server(self._serve, path=socket_path)
+            logger.info("작업 API 시작: unix:%s", socket_path)
+        else:
+            server = await asyncio.start_server(self._serve, host=host, port=port)
+            logger.info("작업 API 시작: http://%s:%s", host, port)
+        return server
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """요청 하나를 처리한다. 연결을 유지할 수 있으면 True를 반환한다."""
+        request_line = await reader.readline()
+        if not request_line:
+            return False
+
+        headers: dict[str, str] | None = None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+            headers = await self._read_headers(reader)
+            length = int(headers.get("content-length", "0"))
+            if length > MAX_BODY_BYTES:
+                raise HttpError(413, "요청 본문이 너무 큽니다")
+            body = await reader.readexactly(length) if length else b""
+
+            path = path.split("?", 1)[0].rstrip("/")
+            if method == "GET" and path.endswith("/stream"):
+                job = self._find_job(path.removesuffix("/stream"))
+                await self._stream(job, writer)
+                return False
+
+            status, payload = self._route(method, path, body)
+        except HttpError as e:
+            status, payload = e.status, {"error": str(e)}
+        except ValueError:
+            status, payload = 400, {"error": "잘못된 HTTP 요청"}
+
+        await self._respond(writer, status, payload)
+        # 요청을 끝까지 읽지 못했거나 클라이언트가 종료를 요청하면 연결을 닫는다
+        if status in (400, 413) or headers is None:
+            return False
+        return headers.get("connection", "").lower() != "close"
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return headers
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[int, object]:
+        if path == "/metrics" and method == "GET":
+            return 200, REGISTRY.render_prometheus()
+
+        if path == "/health":
+            return 200, {
+                "status": "ok",
+                "jobs": len(self._manager.list()),
+                "host_limits": self._manager.host_limits(),
+            }
+
+        if path == "/jobs":
+            if method == "GET":
+                return 200, [job.status() for job in self._manager.list()]
+            if method == "POST":
+                try:
+                    request = JobRequest.model_validate_json(body or b"{}")
+                except ValidationError as e:
+                    detail = "; ".join(
+                        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+                    )
+                    raise HttpError(400, f"잘못된 작업 요청: {detail}") from e
+                return 202, self._manager.submit(request).status()
+            raise HttpError(405, f"지원하지 않는 메서드: {method}")
+
+        if path.endswith("/results"):
+            job = self._find_job(path.removesuffix("/results"))
+            return 200, [result.model_dump(mode="json") for result in job.results()]
+
+        job = self._find_job(path)
+        if method == "GET":
+            return 200, job.status()
+        if method == "DELETE":
+            if not self._manager.cancel(job.id):
+                raise HttpError(409, f"이미 종료된 작업입니다: {job.id}")
+            return 202, job.status()
+        raise HttpError(405, f"지원하지 않는 메서드: {method}")
+
+    def _find_job(self, path: str) -> CrawlJob:
+        prefix, _, job_id = path.rpartition("/")
+        job = self._manager.get(job_id) if prefix == "/jobs" else None
+        if job is None:
+            raise HttpError(404, f"작업을 찾을 수 없습니다: {path}")
+        return job
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: object) -> None:
+        """문자열은 텍스트(Prometheus 형식)로, 나머지는 JSON으로 응답한다."""
+        if isinstance(payload, str):
+            body = payload.encode()
+            content_type = b"text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode()
+            content_type = b"application/json; charset=utf-8"
+        writer.write(
+            _status_line(status)
+            + b"Content-Type: "
+            + content_type
+            + b"\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+
+    async def _stream(self, job: CrawlJob, writer: asyncio.StreamWriter) -> None:
+        """작업 이벤트를 한 줄에 하나씩 JSON으로 흘려보낸다. 마지막 줄은 작업 상태이다."""
+        writer.write(
+            _status_line(200)
+            + b"Content-Type: application/x-ndjson; charset=utf-8\r\n"
+            + b"Connection: close\r\n\r\n"
+        )
+        async with aclosing(job.stream()) as events:
+            async for event in events:
+                writer.write(json.dumps(event.to_dict(), ensure_ascii=False).encode() + b"\n")
+                # 클라이언트가 느리면 여기서 대기한다
+                await writer.drain()
+        writer.write(
+            json.dumps({"type": "status", **job.status()}, ensure_ascii=False).encode() + b"\n"
+        )
+        await writer.drain()
+
+
+def _status_line(status: int) -> bytes:
+    return f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n".encode()
@@ -1,13 +1,43 @@
-from playwright.async_api import Browser, Playwright, async_playwright
+import asyncio
+import logging
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from src.core.exceptions import FetchError
+from src.core.metrics import BROWSER_RENDER_SECONDS, BROWSER_WAIT_SECONDS, current_request_labels
+from src.core.retry import parse_retry_after
+from src.core.tracing import TRACER
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PooledContext:
+    context: BrowserContext
+    uses: int = 0
 
 
 class BrowserClient:
-    """playwright 기반 브라우저 클라이언트"""
+    """playwright 기반 브라우저 클라이언트
+
+    페이지는 요청마다 새로 열지만 브라우저 컨텍스트는 호스트별로 쉬고 있는 것을 다시 쓴다.
+    컨텍스트 생성 비용을 줄이고, 같은 컨텍스트의 연결과 캐시(스크립트, 스타일)를
+    같은 호스트의 다음 요청이 재사용한다. 쿠키와 저장소가 다른 호스트로 섞이지 않도록
+    호스트마다 따로 두며, 쉬는 컨텍스트 수는 호스트별 최대 동시 요청 수를 넘지 않는다.
+
+    `context_max_uses`번 쓴 컨텍스트와 요청이 실패한 컨텍스트는 닫고 다음 요청에서 새로
+    만든다 (쌓인 쿠키, 메모리, 차단 상태를 오래 끌고 가지 않는다).
+    """
 
-    def __init__(self, headless: bool = True) -> None:
+    def __init__(self, headless: bool = True, context_max_uses: int = 50) -> None:
         self._headless = headless
+        self._context_max_uses = context_max_uses
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
+        # 호스트 → 쉬는 컨텍스트
+        self._idle_contexts: dict[str, list[_PooledContext]] = {}
 
     async def __aenter__(self):
         self._playwright = await async_playwright().start()
@@ -15,6 +45,9 @@ class BrowserClient:
         return self
 
     async def __aexit__(self, *exc) -> None:
+        idle = [pooled for pool in self._idle_contexts.values() for pooled in pool]
+        self._idle_contexts.clear()
+        await asyncio.gather(*(self._close(pooled) for pooled in idle))
         if self._browser:
             await self._browser.close()
         if self._playwright:
@@ -27,13 +60,59 @@ class BrowserClient:
         if not self._browser:
             raise RuntimeError("BrowserClient는 async context manager로 사용해야 합니다")
 
-        page = await self._browser.new_page()
+        host = urlsplit(url).hostname or ""
+        labels = {**current_request_labels("channel", "strategy"), "host": host}
+        idle = self._idle_contexts.get(host)
+        pooled = idle.pop() if idle else _PooledContext(await self._browser.new_context())
+        pooled.uses += 1
+        page = None
+        reusable = False
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-            if wait_selector:
-                await page.wait_for_selector(wait_selector, timeout=timeout)
-            else:
-                await page.wait_for_timeout(2000)
-            return await page.content()
+            page = await pooled.context.new_page()
+            with TRACER.span("render", "browser", url=url), BROWSER_RENDER_SECONDS.time(**labels):
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            if response and response.status >= 400:
+                raise FetchError(
+                    f"HTTP {response.status}: {url}",
+                    status_code=response.status,
+                    retry_after=parse_retry_after(response.headers.get("retry-after")),
+                )
+            with (
+                TRACER.span("wait", "browser", url=url, selector=wait_selector),
+                BROWSER_WAIT_SECONDS.time(**labels),
+            ):
+                if wait_selector:
+                    await page.wait_for_selector(wait_selector, timeout=timeout)
+                else:
+                    await page.wait_for_timeout(2000)
+            html = await page.content()
+            reusable = True
+            return html
         finally:
-            await page.close()
+            if page is not None:
+                await page.close()
+            if reusable and pooled.uses < self._context_max_uses:
+                self._idle_contexts.setdefault(host, []).append(pooled)
+            else:
+                await self._close(pooled)
+
+    @staticmethod
+    async def _close(pooled: _PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug("브라우저 컨텍스트 닫기 실패: %s", e)
+
+    async def warm_up(self, urls: list[str], contexts: int = 1) -> None:
+        """URL의 호스트마다 쉬는 브라우저 컨텍스트가 `contexts`개가 되도록 미리 만들어 둔다."""
+        if not self._browser:
+            raise RuntimeError("BrowserClient는 async context manager로 사용해야 합니다")
+        hosts = {urlsplit(url).hostname or "" for url in urls}
+        for host in hosts:
+            idle = self._idle_contexts.setdefault(host, [])
+            missing = contexts - len(idle)
+            if missing > 0:
+                created = await asyncio.gather(
+                    *(self._browser.new_context() for _ in range(missing))
+                )
+                idle.extend(_PooledContext(context) for context in created)
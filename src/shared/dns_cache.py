@@ -0,0 +1,124 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+import typing
+
+import httpcore
+
+logger = logging.getLogger(__name__)
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class DnsCache:
+    """호스트 주소 조회 결과를 TTL 동안 보관하는 캐시 (세션 단위)
+
+    같은 호스트를 동시에 조회하면 진행 중인 조회 하나를 함께 기다린다. 조회에 실패한
+    결과는 보관하지 않는다.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        self._ttl = ttl
+        # (호스트, 포트) → (만료 시각, 주소 목록 future)
+        self._entries: dict[tuple[str, int], tuple[float, asyncio.Future[list[str]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        """호스트의 IP 주소 목록 (getaddrinfo 순서)"""
+        key = (host, port)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            future = asyncio.ensure_future(self._lookup(host, port))
+            self._entries[key] = (time.monotonic() + self._ttl, future)
+            future.add_done_callback(lambda f: self._on_done(key, f))
+        else:
+            future = entry[1]
+        return await asyncio.shield(future)
+
+    def invalidate(self, host: str, port: int) -> None:
+        self._entries.pop((host, port), None)
+
+    def _on_done(self, key: tuple[str, int], future: asyncio.Future[list[str]]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
+
+    @staticmethod
+    async def _lookup(host: str, port: int) -> list[str]:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        # 같은 주소가 프로토콜별로 여러 번 나오므로 순서를 유지해 중복을 지운다
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        logger.debug("DNS 조회: %s → %s", host, addresses)
+        return addresses
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """DNS 캐시로 주소를 찾아 연결하는 httpcore network backend
+
+    TLS 인증서 검증과 SNI에는 httpcore가 요청한 호스트 이름을 따로 넘기므로 IP 주소로
+    연결해도 그대로 동작한다. 주소가 여러 개면 연결될 때까지 차례로 시도하고, 모두
+    실패하면 다음 연결에서 다시 조회하도록 캐시에서 지운다.
+    """
+
+    def __init__(self, inner: httpcore.AsyncNetworkBackend, cache: DnsCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if _is_ip(host):
+            addresses = [host]
+        else:
+            try:
+                async with asyncio.timeout(timeout):
+                    addresses = await self._cache.resolve(host, port)
+            except TimeoutError as e:
+                raise httpcore.ConnectTimeout(f"DNS 조회 시간 초과: {host}") from e
+            except OSError as e:
+                raise httpcore.ConnectError(f"DNS 조회 실패: {host}: {e}") from e
+
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        self._cache.invalidate(host, port)
+        raise error or httpcore.ConnectError(f"연결할 주소가 없습니다: {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
@@ -1,19 +1,179 @@
+import asyncio
+import codecs
+import contextlib
+import logging
+import re
+from collections.abc import AsyncIterator, Iterator
+from urllib.parse import urlsplit
+
+import httpcore
 import httpx
 
+from src.core.metrics import OVERSIZE_PAGES, record_response_bytes
+from src.shared.dns_cache import CachingNetworkBackend, DnsCache
+
+logger = logging.getLogger(__name__)
+
+# 문서 앞부분의 <meta charset="..."> 또는 <meta http-equiv content="...; charset=...">
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+_SNIFF_BYTES = 4096
+
+# httpcore 예외 → httpx 예외 (하위 클래스가 먼저 오도록 둔다)
+_ERRORS: tuple[tuple[type[Exception], type[httpx.HTTPError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _httpx_errors() -> Iterator[None]:
+    """httpcore 예외를 같은 뜻의 httpx 예외로 바꿔 던진다."""
+    try:
+        yield
+    except Exception as e:
+        for source, target in _ERRORS:
+            if isinstance(e, source):
+                raise target(str(e)) from e
+        raise
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream: AsyncIterator[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _httpx_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class _PoolTransport(httpx.AsyncBaseTransport):
+    """직접 만든 httpcore 연결 풀로 요청을 보내는 httpx transport
+
+    httpx 기본 transport는 연결 풀의 network backend를 바꿀 수 없으므로, 공개 API인
+    `httpcore.AsyncConnectionPool(network_backend=...)`로 풀을 만들어 감싼다.
+    """
+
+    def __init__(self, network_backend: httpcore.AsyncNetworkBackend) -> None:
+        limits = httpx.Limits()
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=network_backend,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def _normalize_charset(name: str | bytes | None) -> str | None:
+    """인코딩 이름을 Python 코덱 이름으로 바꾼다 (모르는 이름이면 None).
+
+    브라우저처럼 EUC-KR은 상위 집합인 CP949로 읽는다 (EUC-KR로 선언한 페이지에도
+    CP949에만 있는 글자가 섞여 있다).
+    """
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode("ascii", errors="ignore")
+    try:
+        codec = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return "cp949" if codec == "euc_kr" else codec
+
+
+def sniff_charset(content: bytes) -> str:
+    """본문으로 인코딩을 추정한다: 문서가 선언한 charset, UTF-8로 읽히면 UTF-8, 아니면 CP949"""
+    match = _META_CHARSET.search(content, 0, _SNIFF_BYTES)
+    declared = _normalize_charset(match.group(1)) if match else None
+    if declared:
+        return declared
+    try:
+        # 크기 상한에서 잘린 마지막 글자 때문에 실패하지 않도록 점진 디코더로 확인한다
+        codecs.getincrementaldecoder("utf-8")().decode(content, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8"
+
 
 class HttpClient:
-    """httpx 기반 HTTP 클라이언트"""
+    """httpx 기반 HTTP 클라이언트
+
+    호스트 주소 조회 결과는 `dns_cache_ttl`초 동안 캐시하여 새 연결마다 DNS를 다시
+    조회하지 않는다.
+
+    본문은 스트리밍으로 읽으며 URL별 크기 상한(`max_page_bytes`, `max_page_bytes_overrides`)을
+    넘으면 거기서 읽기를 멈추고 앞부분만 쓴다. 응답 헤더에 charset이 없으면 호스트별로
+    처음 한 번만 본문에서 인코딩을 추정하고 이후에는 캐시한 인코딩을 쓴다.
+    """
 
-    def __init__(self, user_agent: str, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: int = 30,
+        dns_cache_ttl: float = 300.0,
+        max_page_bytes: int = 0,
+        max_page_bytes_overrides: dict[str, int] | None = None,
+    ) -> None:
         self._user_agent = user_agent
         self._timeout = timeout
+        self._dns = DnsCache(dns_cache_ttl)
+        self._max_page_bytes = max_page_bytes
+        # "호스트/경로 접두사" → 상한. 긴 접두사부터 비교한다
+        self._max_bytes_rules = sorted(
+            (max_page_bytes_overrides or {}).items(), key=lambda rule: len(rule[0]), reverse=True
+        )
+        # 호스트 → 본문에서 알아낸 인코딩
+        self._charsets: dict[str, str] = {}
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
+        backend = CachingNetworkBackend(httpcore.AnyIOBackend(), self._dns)
         self._client = httpx.AsyncClient(
             headers={"User-Agent": self._user_agent},
             timeout=httpx.Timeout(self._timeout),
             follow_redirects=True,
+            transport=_PoolTransport(backend),
         )
         return self
 
@@ -26,6 +186,73 @@ class HttpClient:
         """URL에서 HTML을 가져온다"""
         if not self._client:
             raise RuntimeError("HttpClient는 async context manager로 사용해야 합니다")
-        response = await self._client.get(url)
-        response.raise_for_status()
-        return response.text
+        limit = self.max_bytes_for(url)
+        async with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            content = await self._read(response, limit)
+        record_response_bytes(len(content))
+        return self._decode(response, content)
+
+    def max_bytes_for(self, url: str) -> int:
+        """URL에 적용할 본문 크기 상한 (0이면 제한 없음)
+
+        `max_page_bytes_overrides`의 키는 `호스트` 또는 `호스트/경로 접두사`이며 가장 길게
+        일치하는 키의 상한을 쓴다 (예: `search.naver.com`, `www.mk.co.kr/news/`).
+        """
+        parts = urlsplit(url)
+        target = f"{parts.hostname or ''}{parts.path or '/'}"
+        for prefix, limit in self._max_bytes_rules:
+            if target.startswith(prefix) and (
+                len(target) == len(prefix) or prefix.endswith("/") or target[len(prefix)] == "/"
+            ):
+                return limit
+        return self._max_page_bytes
+
+    @staticmethod
+    async def _read(response: httpx.Response, limit: int) -> bytes:
+        if limit <= 0:
+            return await response.aread()
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > limit:
+                OVERSIZE_PAGES.inc(host=response.url.host)
+                logger.warning(
+                    "본문 크기 상한(%d바이트)을 넘어 앞부분만 사용: %s", limit, response.url
+                )
+                break
+        return b"".join(chunks)[:limit]
+
+    def _decode(self, response: httpx.Response, content: bytes) -> str:
+        """응답 헤더의 charset, 호스트별로 캐시한 인코딩, 본문 추정 순서로 디코딩한다."""
+        encoding = _normalize_charset(response.charset_encoding)
+        if encoding is None:
+            host = response.url.host
+            encoding = self._charsets.get(host)
+            if encoding is None:
+                encoding = self._charsets[host] = sniff_charset(content)
+                logger.debug("인코딩 추정: %s → %s", host, encoding)
+        return content.decode(encoding, errors="replace")
+
+    async def warm_up(self, urls: list[str], connections: int = 1) -> None:
+        """URL의 호스트마다 DNS를 미리 조회하고 연결(TCP, TLS)을 `connections`개씩 열어 둔다.
+
+        연결은 `HEAD /` 요청으로 열고 응답을 받은 뒤 연결 풀에 남겨 첫 요청이 재사용한다.
+        실패는 무시한다 (첫 요청이 평소처럼 연결한다).
+        """
+        if not self._client:
+            raise RuntimeError("HttpClient는 async context manager로 사용해야 합니다")
+        origins = {f"{parts.scheme}://{parts.netloc}" for parts in map(urlsplit, urls)}
+        await asyncio.gather(
+            *(self._preconnect(origin) for origin in origins for _ in range(connections))
+        )
+
+    async def _preconnect(self, origin: str) -> None:
+        try:
+            response = await self._client.head(f"{origin}/", follow_redirects=False)
+        except httpx.HTTPError as e:
+            logger.debug("연결 미리 열기 실패: %s (%s)", origin, e)
+            return
+        logger.debug("연결 미리 열기: %s (HTTP %d)", origin, response.status_code)
@@ -1,6 +1,10 @@
+import hashlib
 import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
-from bs4 import Tag
+if TYPE_CHECKING:
+    from bs4 import Tag
 
 
 def clean_text(text: str) -> str:
@@ -11,6 +15,45 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
-def extract_text_from_html(element: Tag) -> str:
+def extract_text_from_html(element: "Tag") -> str:
     """BeautifulSoup element에서 텍스트만 추출"""
     return clean_text(element.get_text(separator="\n"))
+
+
+_URL_OR_EMAIL = re.compile(r"https?://\S+|[\w.+-]+@[\w-]+\.[\w.]+")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+# "총 1,234건", "검색결과 총 <strong>1,234</strong>건" 같은 전체 건수 표시 (태그가 끼어 있어도 됨)
+_TOTAL_COUNT = re.compile(r"총\s*(?:<[^>]*>\s*)*([\d,]+)\s*(?:<[^>]*>\s*)*건")
+
+
+def find_total_count(html: str) -> int | None:
+    """HTML에서 "총 N건" 형식의 전체 검색 결과 수를 찾는다 (없으면 None)"""
+    match = _TOTAL_COUNT.search(html)
+    return int(match.group(1).replace(",", "")) if match else None
+
+
+def normalize_for_hash(text: str) -> str:
+    """본문 비교용 정규화: 소문자화, URL/이메일(기자 연락처) 제거, 한글/영숫자 외 문자 제거"""
+    return _NON_WORD.sub("", _URL_OR_EMAIL.sub("", text.lower()))
+
+
+def match_keywords(keywords: Iterable[str], text: str) -> list[str]:
+    """텍스트에 나오는 키워드 목록
+
+    키워드를 공백으로 나눈 단어가 모두 텍스트에 있으면 일치로 본다
+    (대소문자, 공백, 문장 부호는 무시).
+    """
+    normalized = normalize_for_hash(text)
+    return [
+        keyword
+        for keyword in keywords
+        if all(normalize_for_hash(term) in normalized for term in keyword.split())
+    ]
+
+
+def content_fingerprint(title: str, content: str) -> str:
+    """제목과 본문의 정규화 결과로 만든 지문 (공백/문장 부호만 다르면 같은 값)"""
+    normalized = f"{normalize_for_hash(title)}\n{normalize_for_hash(content)}"
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
@@ -0,0 +1,136 @@
+import re
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# 어느 채널에서도 기사를 구분하지 않는 추적용 파라미터
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "igshid",
+        "_ga",
+        "mc_cid",
+        "mc_eid",
+        "ref",
+        "ref_src",
+    }
+)
+_TRACKING_PREFIXES = ("utm_",)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass(frozen=True, slots=True)
+class UrlRules:
+    """채널별 URL 정규화 규칙
+
+    - `host_aliases`: 모바일/별칭 호스트 → 대표(데스크톱) 호스트
+    - `keep_params`: 지정하면 이 파라미터만 남긴다 (경로로 기사를 구분하는 채널은 빈 집합)
+    - `drop_params`: 공통 추적 파라미터 외에 더 지울 파라미터
+    - `path_rewrites`: (정규식, 치환 문자열) 목록. 같은 기사의 다른 경로 형식을 하나로 맞춘다
+    - `force_https`: http 링크를 https로 바꾼다
+    """
+
+    host_aliases: dict[str, str] = field(default_factory=dict)
+    keep_params: frozenset[str] | None = None
+    drop_params: frozenset[str] = frozenset()
+    path_rewrites: tuple[tuple[re.Pattern[str], str], ...] = ()
+    force_https: bool = False
+
+
+DEFAULT_RULES = UrlRules()
+
+
+def _keep_param(name: str, rules: UrlRules) -> bool:
+    if rules.keep_params is not None:
+        return name in rules.keep_params
+    lowered = name.lower()
+    return not (
+        lowered in TRACKING_PARAMS
+        or lowered.startswith(_TRACKING_PREFIXES)
+        or name in rules.drop_params
+    )
+
+
+def canonicalize_url(url: str, rules: UrlRules = DEFAULT_RULES, base: str | None = None) -> str:
+    """중복 제거 키와 캐시 키로 쓸 대표 URL을 만든다.
+
+    상대 경로는 `base` 기준으로 절대 URL로 바꾼 뒤 scheme/호스트 소문자화, 기본 포트와
+    fragment 제거, 호스트 별칭 치환, 추적 파라미터 제거와 파라미터 정렬을 적용한다.
+    http(s)가 아닌 URL은 그대로 반환한다.
+    """
+    url = url.strip()
+    if base is not None:
+        url = urljoin(base, url)
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip(".")
+    host = rules.host_aliases.get(host, host)
+    if rules.force_https:
+        scheme = "https"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    for pattern, replacement in rules.path_rewrites:
+        path = pattern.sub(replacement, path)
+
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if _keep_param(name, rules)
+    ]
+    query = urlencode(sorted(params))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+# <link rel="canonical" href="..."> 와 <meta property="og:url" content="...">
+# (속성 순서가 바뀌어도 찾도록 태그 단위로 찾은 뒤 속성을 읽는다)
+_CANONICAL_TAG = re.compile(r"<(?:link|meta)\b[^>]*>", re.IGNORECASE)
+_ATTR = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+def find_declared_url(html: str) -> str | None:
+    """페이지가 선언한 대표 URL (`rel=canonical`, 없으면 `og:url`)
+
+    `<head>`만 보면 되므로 BeautifulSoup 없이 `</head>` 앞까지 정규식으로 찾는다.
+    """
+    end = html.find("</head>")
+    head = html if end < 0 else html[:end]
+    og_url = None
+    for tag in _CANONICAL_TAG.finditer(head):
+        attrs = {
+            m.group(1).lower(): (m.group(2) or m.group(3) or "").strip()
+            for m in _ATTR.finditer(tag.group())
+        }
+        if attrs.get("rel", "").lower() == "canonical" and attrs.get("href"):
+            return attrs["href"]
+        if og_url is None and attrs.get("property", "").lower() == "og:url":
+            og_url = attrs.get("content") or None
+    return og_url
+
+
+def resolve_canonical_url(page_url: str, html: str, rules: UrlRules = DEFAULT_RULES) -> str:
+    """요청한 URL과 페이지가 선언한 대표 URL로 기사의 대표 URL을 정한다.
+
+    선언한 URL은 정규화한 호스트가 요청한 URL과 같고 경로가 루트가 아닐 때만 따른다
+    (대표 URL을 홈페이지나 다른 사이트로 잘못 선언한 페이지가 있다).
+    """
+    canonical = canonicalize_url(page_url, rules)
+    declared = find_declared_url(html)
+    if not declared:
+        return canonical
+    declared = canonicalize_url(declared, rules, base=canonical)
+    declared_parts = urlsplit(declared)
+    if declared_parts.netloc != urlsplit(canonical).netloc or declared_parts.path in ("", "/"):
+        return canonical
+    return declared
@@ -1,7 +1,54 @@
 import pytest
 
 from config.settings import CrawlerSettings
-from src.core.models import SearchResult
+from src.core.base_crawler import BaseCrawler
+from src.core.exceptions import FetchError
+from src.core.fetch_strategy import FetchStrategy
+from src.core.models import Article, SearchResult
+
+
+class FakeFetchStrategy(FetchStrategy):
+    """URL → HTML 사전으로 응답하는 테스트용 fetch 전략 (없는 URL은 404)"""
+
+    def __init__(self, pages: dict[str, str]) -> None:
+        self.pages = pages
+        self.fetched: list[str] = []
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        self.fetched.append(url)
+        if url not in self.pages:
+            raise FetchError(f"없는 페이지: {url}", status_code=404)
+        return self.pages[url]
+
+
+class FakeCrawler(BaseCrawler):
+    """테스트용 크롤러
+
+    검색 페이지 HTML은 줄마다 `url|제목` 형식이며, 기사 HTML은 그대로 본문이 된다.
+    """
+
+    @property
+    def channel_name(self) -> str:
+        return "fake"
+
+    def build_search_url(self, keyword: str, page: int) -> str:
+        return f"https://fake.test/search?q={keyword}&page={page}"
+
+    def parse_article_list(self, html: str) -> list[SearchResult]:
+        results = []
+        for line in html.splitlines():
+            url, title = line.split("|")
+            results.append(SearchResult(title=title, url=url))
+        return results
+
+    def parse_article_detail(self, html: str, search_result: SearchResult, keyword: str) -> Article:
+        return Article(
+            title=search_result.title,
+            url=search_result.url,
+            content=html,
+            channel=self.channel_name,
+            keyword=keyword,
+        )
 
 
 @pytest.fixture
@@ -23,3 +70,46 @@ def sample_search_result():
         url="https://example.com/article/123",
         snippet="테스트 기사 요약",
     )
+
+
+@pytest.fixture
+def fake_pages():
+    """FakeCrawler용 페이지: 키워드 'AI' 검색 1페이지에 기사 2건 (1건은 없는 페이지)"""
+    return {
+        "https://fake.test/search?q=AI&page=1": (
+            "https://fake.test/a/1|첫 번째 기사\nhttps://fake.test/a/missing|없는 기사"
+        ),
+        "https://fake.test/a/1": "첫 번째 본문",
+    }
+
+
+@pytest.fixture
+def fake_crawler(settings, fake_pages):
+    """FakeFetchStrategy를 사용하는 FakeCrawler"""
+    return FakeCrawler(FakeFetchStrategy(fake_pages), settings)
+
+
+@pytest.fixture
+def patched_registry(monkeypatch, settings, fake_pages):
+    """오케스트레이터의 create_crawler가 FakeCrawler를 반환하도록 교체"""
+    from src.pipeline import orchestrator as orchestrator_module
+
+    strategy = FakeFetchStrategy(fake_pages)
+
+    async def fake_create_crawler(
+        channel,
+        settings_,
+        http_client,
+        browser_client=None,
+        strategy_wrapper=None,
+        fetch_strategy=None,
+    ):
+        # 실제 create_crawler처럼 오케스트레이터의 래퍼(재시도, circuit breaker 등)를 씌운다
+        crawler_strategy = fetch_strategy or strategy
+        if strategy_wrapper:
+            crawler_strategy = strategy_wrapper(crawler_strategy)
+        return FakeCrawler(crawler_strategy, settings_)
+
+    monkeypatch.setattr(orchestrator_module, "create_crawler", fake_create_crawler)
+    monkeypatch.setattr(orchestrator_module, "has_dynamic_channel", lambda channels: False)
+    return strategy
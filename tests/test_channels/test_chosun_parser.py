@@ -50,6 +50,30 @@ class TestChosunParseSearchResults:
         results = chosun_parser.parse_search_results("<html><body></body></html>")
         assert results == []
 
+    def test_next_data_listing_date(self):
+        """__NEXT_DATA__ 검색 결과 항목의 요약과 발행일을 읽는다"""
+        html = (
+            '<script id="__NEXT_DATA__" type="application/json">'
+            '{"props": {"pageProps": {"searchResult": {"items": [{"title": "정상회담 결과", '
+            '"url": "/politics/2024/01/15/A/", "description": "양국이 합의했다.", '
+            '"display_date": "2024-01-15T09:30:00.000Z"}]}}}}</script>'
+        )
+
+        [result] = chosun_parser.parse_search_results(html)
+
+        assert result.snippet == "양국이 합의했다."
+        assert result.published_at.isoformat() == "2024-01-15T09:30:00+00:00"
+
+    def test_parse_total_count(self):
+        """__NEXT_DATA__ 검색 결과의 전체 건수를 읽고, 없으면 None"""
+        html = (
+            '<script id="__NEXT_DATA__" type="application/json">'
+            '{"props": {"pageProps": {"searchResult": {"total": 137, "items": []}}}}</script>'
+        )
+
+        assert chosun_parser.parse_total_count(html) == 137
+        assert chosun_parser.parse_total_count("<html></html>") is None
+
 
 class TestChosunParseArticle:
     """조선일보 기사 상세 파싱 테스트"""
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -58,6 +59,25 @@ class TestNaverParseSearchResults:
         results = naver_parser.parse_search_results("<html><body></body></html>")
         assert results == []
 
+    def test_snippet_and_relative_date(self):
+        """제목과 같은 원문 링크의 다른 텍스트를 요약으로, "N시간 전"을 발행일로 읽는다"""
+        html = """
+        <ul><li><div><div><div><div>
+            <a href="https://press.test/">언론사</a><span>3시간 전</span>
+            <a href="https://n.news.naver.com/mnews/article/001/0000000001">네이버뉴스</a>
+        </div></div>
+        <a href="https://press.test/news/1">반도체 수출이 다시 늘어났다는 소식</a>
+        <a href="https://press.test/news/1">산업부는 지난달 반도체 수출이 늘었다고 밝혔다.</a>
+        </div></div></li></ul>
+        """
+        before = datetime.now()
+
+        [result] = naver_parser.parse_search_results(html)
+
+        assert result.snippet == "산업부는 지난달 반도체 수출이 늘었다고 밝혔다."
+        assert result.published_at is not None
+        assert abs((before - result.published_at).total_seconds() - 3 * 3600) < 60
+
 
 class TestNaverParseArticle:
     """네이버 뉴스 기사 상세 파싱 테스트"""
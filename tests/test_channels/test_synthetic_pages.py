@@ -0,0 +1,57 @@
+import importlib
+
+import pytest
+
+from benchmarks.bench_parsers import CaseResult, compare, regressions
+from benchmarks.synthetic import CHANNELS, DEFAULT_TARGET_BYTES, article_page, search_page
+from src.core.models import SearchResult
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_search_page_yields_expected_items(channel):
+    parser = importlib.import_module(f"src.channels.{channel}.parser")
+    page = search_page(channel)
+
+    results = parser.parse_search_results(page.html)
+
+    assert page.size >= DEFAULT_TARGET_BYTES
+    assert len(results) == page.expected_items
+    assert all(r.url.startswith("http") for r in results)
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_article_page_yields_content_and_date(channel):
+    parser = importlib.import_module(f"src.channels.{channel}.parser")
+    page = article_page(channel)
+    target = SearchResult(title="제목", url="https://example.com/news/1")
+
+    article = parser.parse_article(page.html, target, "반도체")
+
+    assert page.size >= DEFAULT_TARGET_BYTES
+    assert len(article.content) > 1000
+    assert article.published_at is not None
+
+
+def test_same_seed_same_document():
+    assert search_page("mk", seed=7).html == search_page("mk", seed=7).html
+    assert search_page("mk", seed=7).html != search_page("mk", seed=8).html
+
+
+def test_compare_flags_throughput_regression():
+    baseline = {
+        "results": {"mk.search": {"docs_per_sec": 10.0}, "mk.article": {"docs_per_sec": 10.0}}
+    }
+    results = [
+        CaseResult("mk.search", 500_000, 7.0, 1024.0),
+        CaseResult("mk.article", 500_000, 9.0, 1024.0),
+        CaseResult("hani.search", 500_000, 1.0, 1024.0),
+    ]
+
+    ratios = compare(results, baseline)
+
+    assert ratios == {
+        "mk.search": pytest.approx(0.7),
+        "mk.article": pytest.approx(0.9),
+        "hani.search": None,
+    }
+    assert regressions(ratios, threshold=0.2) == ["mk.search"]
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from src.core.adaptive import AdaptiveConcurrency, AdaptiveFetchStrategy, AimdLimiter
+from src.core.exceptions import FetchError
+from tests.conftest import FakeFetchStrategy
+
+
+class _Clock:
+    """monotonic 시계를 대신하는 테스트용 시계"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr("src.core.adaptive.time.monotonic", clock)
+    return clock
+
+
+class TestAimdLimiter:
+    """AimdLimiter 테스트"""
+
+    def test_additive_increase(self, clock):
+        """성공할 때마다 상한이 1/상한씩 올라 대략 상한만큼 성공하면 1 오른다"""
+        limiter = AimdLimiter("a.test", initial_limit=2, max_limit=4)
+        for _ in range(2):
+            limiter.on_success(0.1, saturated=True)
+        assert limiter.limit == 2
+        limiter.on_success(0.1, saturated=True)
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            limiter.on_success(0.1, saturated=True)
+        assert limiter.limit == 4
+
+    def test_idle_success_keeps_limit(self, clock):
+        """상한까지 차지 않은 상태의 성공은 상한을 올리지 않는다"""
+        limiter = AimdLimiter("a.test", initial_limit=2, max_limit=8)
+        for _ in range(20):
+            limiter.on_success(0.1, saturated=False)
+        assert limiter.limit == 2
+
+    async def test_acquire_reports_saturation(self):
+        limiter = AimdLimiter("a.test", initial_limit=2)
+
+        assert not await limiter.acquire()
+        assert await limiter.acquire()
+
+    def test_multiplicative_decrease_is_damped(self, clock):
+        """과부하 신호에 상한을 절반으로 줄이고, 기준 지연 시간 안의 신호는 한 번만 반영한다"""
+        limiter = AimdLimiter("a.test", initial_limit=8, backoff_ratio=0.5)
+        limiter.on_success(0.5, saturated=True)
+
+        limiter.on_overload("HTTP 429")
+        limiter.on_overload("HTTP 429")
+        assert limiter.limit == 4
+
+        clock.now += 1.0
+        limiter.on_overload("HTTP 429")
+        assert limiter.limit == 2
+
+        clock.now += 1.0
+        limiter.on_overload("HTTP 429")
+        limiter.on_overload("HTTP 429")
+        assert limiter.limit == 1
+
+    def test_latency_spike_decreases(self, clock):
+        """기준 지연 시간의 배수를 넘는 응답은 과부하로 본다"""
+        limiter = AimdLimiter("a.test", initial_limit=8, latency_tolerance=3.0)
+        limiter.on_success(0.1, saturated=True)
+        limiter.on_success(0.5, saturated=True)
+        assert limiter.limit == 4
+
+    async def test_acquire_waits_for_free_slot(self):
+        """상한만큼 점유 중이면 슬롯이 반납될 때까지 대기한다"""
+        limiter = AimdLimiter("a.test", initial_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release()
+        await asyncio.wait_for(waiter, 1.0)
+        assert limiter.in_flight == 1
+
+
+class _SlowFetchStrategy(FakeFetchStrategy):
+    """동시 요청 수를 기록하는 느린 fetch 전략"""
+
+    def __init__(self, status_code: int | None = None) -> None:
+        super().__init__({})
+        self.status_code = status_code
+        self.running = 0
+        self.peak = 0
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if self.status_code:
+            raise FetchError(f"HTTP {self.status_code}: {url}", status_code=self.status_code)
+        return "<html></html>"
+
+
+class TestAdaptiveFetchStrategy:
+    """AdaptiveFetchStrategy 테스트"""
+
+    async def test_limits_in_flight_requests_per_host(self, settings):
+        """호스트별 동시 요청 수가 상한을 넘지 않는다"""
+        settings = settings.model_copy(
+            update={"adaptive_initial_limit": 2, "adaptive_max_limit": 2}
+        )
+        inner = _SlowFetchStrategy()
+        concurrency = AdaptiveConcurrency(settings)
+        strategy = AdaptiveFetchStrategy(inner, concurrency)
+
+        await asyncio.gather(*(strategy.fetch(f"https://a.test/{i}") for i in range(6)))
+
+        assert inner.peak == 2
+        assert concurrency.limits() == {"a.test": 2}
+
+    async def test_overload_response_lowers_limit(self, settings):
+        """429 응답이면 해당 호스트 상한을 줄인다"""
+        settings = settings.model_copy(update={"adaptive_initial_limit": 4})
+        concurrency = AdaptiveConcurrency(settings)
+        strategy = AdaptiveFetchStrategy(_SlowFetchStrategy(status_code=429), concurrency)
+
+        with pytest.raises(FetchError):
+            await strategy.fetch("https://a.test/1")
+
+        assert concurrency.limits() == {"a.test": 2}
+
+    async def test_not_found_keeps_limit(self, settings):
+        """404는 과부하 신호가 아니다"""
+        settings = settings.model_copy(update={"adaptive_initial_limit": 4})
+        concurrency = AdaptiveConcurrency(settings)
+        strategy = AdaptiveFetchStrategy(_SlowFetchStrategy(status_code=404), concurrency)
+
+        with pytest.raises(FetchError):
+            await strategy.fetch("https://a.test/1")
+
+        assert concurrency.limits() == {"a.test": 4}
+
+    async def test_sequential_requests_keep_limit(self, settings):
+        """한 번에 하나씩 요청하면 상한까지 차지 않으므로 상한이 오르지 않는다"""
+        settings = settings.model_copy(update={"adaptive_initial_limit": 2})
+        concurrency = AdaptiveConcurrency(settings)
+        strategy = AdaptiveFetchStrategy(_SlowFetchStrategy(), concurrency)
+
+        for i in range(10):
+            await strategy.fetch(f"https://a.test/{i}")
+
+        assert concurrency.limits() == {"a.test": 2}
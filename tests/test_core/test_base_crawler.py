@@ -0,0 +1,144 @@
+from datetime import datetime
+
+from src.core.models import CrawlEvent, SearchResult
+from tests.conftest import FakeCrawler, FakeFetchStrategy
+
+
+class TotalCountCrawler(FakeCrawler):
+    """검색 1페이지에 전체 결과 3건을 표시하는 채널"""
+
+    def parse_total_count(self, html: str) -> int | None:
+        return 3
+
+
+class TestBaseCrawler:
+    """BaseCrawler 크롤링 흐름 테스트"""
+
+    async def test_crawl_iter_yields_articles_and_errors(self, fake_crawler):
+        """기사와 에러가 발생 순서대로 이벤트로 전달된다"""
+        events = [event async for event in fake_crawler.crawl_iter("AI")]
+
+        assert all(isinstance(e, CrawlEvent) for e in events)
+        assert events[0].article is not None
+        assert events[0].article.content == "첫 번째 본문"
+        assert events[0].article.keyword == "AI"
+        assert events[1].article is None
+        assert "기사 수집 실패" in events[1].error
+
+    async def test_crawl_collects_events(self, fake_crawler):
+        """crawl()은 crawl_iter의 이벤트를 CrawlResult로 모은다"""
+        result = await fake_crawler.crawl("AI")
+
+        assert result.channel == "fake"
+        assert result.keyword == "AI"
+        assert [a.url for a in result.articles] == ["https://fake.test/a/1"]
+        assert len(result.errors) == 1
+
+    async def test_search_page_failure_recorded(self, fake_crawler):
+        """검색 페이지 실패는 에러로 기록하고 계속 진행한다"""
+        result = await fake_crawler.crawl("없는키워드", max_pages=2)
+
+        assert result.articles == []
+        assert len(result.errors) == 2
+        assert result.errors[0].startswith("페이지 1 검색 실패")
+
+    async def test_fetch_article_uses_declared_canonical_url(self, settings):
+        """상세 페이지가 선언한 대표 URL을 기사 URL로 쓰고 목록 URL은 metadata에 남긴다"""
+        sr = SearchResult("제목", "https://fake.test/a/1?from=list")
+        html = '<head><link rel="canonical" href="/a/1?utm_source=feed"></head>본문'
+        crawler = FakeCrawler(FakeFetchStrategy({sr.url: html}), settings)
+
+        article = await crawler.fetch_article(sr, "AI")
+
+        assert article.url == "https://fake.test/a/1"
+        assert article.metadata["listing_url"] == sr.url
+        assert article.url_keys == (article.url, sr.url)
+
+    async def test_search_pages_stop_at_total_count(self, settings):
+        """1페이지의 전체 결과 수로 계산한 페이지까지만 검색 페이지를 요청한다"""
+        pages = {
+            "https://fake.test/search?q=AI&page=1": "https://fake.test/a/1|1\nhttps://fake.test/a/2|2",
+            "https://fake.test/search?q=AI&page=2": "https://fake.test/a/3|3",
+        }
+        strategy = FakeFetchStrategy(pages)
+        crawler = TotalCountCrawler(strategy, settings.model_copy(update={"listing_only": True}))
+
+        events = [event async for event in crawler.crawl_iter("AI", max_pages=5)]
+
+        assert [e.article.url for e in events] == [f"https://fake.test/a/{i}" for i in (1, 2, 3)]
+        assert sorted(strategy.fetched) == sorted(pages)
+
+    async def test_search_listing_reports_available_pages(self, settings):
+        """fetch_search_listing은 1페이지에서만 검색 가능한 페이지 수를 계산한다"""
+        pages = {
+            "https://fake.test/search?q=AI&page=1": "https://fake.test/a/1|1\nhttps://fake.test/a/2|2",
+            "https://fake.test/search?q=AI&page=2": "https://fake.test/a/3|3",
+        }
+        crawler = TotalCountCrawler(FakeFetchStrategy(pages), settings)
+
+        assert (await crawler.fetch_search_listing("AI", 1))[1] == 2
+        assert (await crawler.fetch_search_listing("AI", 2))[1] is None
+
+
+class TestListingArticle:
+    """검색 결과 목록만으로 기사를 만드는 listing_article 테스트"""
+
+    def _crawler(self, settings, **overrides):
+        return FakeCrawler(FakeFetchStrategy({}), settings.model_copy(update=overrides))
+
+    def test_default_requires_detail(self, settings):
+        """기본 설정에서는 상세 페이지를 생략하지 않는다"""
+        sr = SearchResult("제목", "https://fake.test/a/1", "요약", datetime(2024, 1, 15))
+        assert self._crawler(settings).listing_article(sr, "AI") is None
+
+    def test_listing_only_uses_snippet(self, settings):
+        """listing_only면 요약을 본문으로 하는 기사를 만든다"""
+        sr = SearchResult("제목", "https://fake.test/a/1", "요약", datetime(2024, 1, 15))
+
+        article = self._crawler(settings, listing_only=True).listing_article(sr, "AI")
+
+        assert article.content == "요약"
+        assert article.published_at == datetime(2024, 1, 15)
+        assert article.metadata == {"listing_only": True}
+        assert article.content_hash
+
+    def test_listing_fields_skip_only_when_present(self, settings):
+        """listing_fields가 목록에 모두 있을 때만 상세 페이지를 생략한다"""
+        crawler = self._crawler(settings, listing_fields=["title", "snippet", "published_at"])
+        complete = SearchResult("제목", "https://fake.test/a/1", "요약", datetime(2024, 1, 15))
+        no_date = SearchResult("제목", "https://fake.test/a/2", "요약")
+
+        assert crawler.listing_article(complete, "AI") is not None
+        assert crawler.listing_article(no_date, "AI") is None
+
+    async def test_crawl_iter_skips_detail_fetch(self, settings, fake_pages):
+        """목록만으로 충분하면 상세 페이지를 요청하지 않는다"""
+        strategy = FakeFetchStrategy(fake_pages)
+        crawler = FakeCrawler(strategy, settings.model_copy(update={"listing_only": True}))
+
+        events = [event async for event in crawler.crawl_iter("AI")]
+
+        assert len(events) == 2
+        assert all(e.article is not None for e in events)
+        assert strategy.fetched == ["https://fake.test/search?q=AI&page=1"]
+
+
+class TestBatchKeywords:
+    """OR 검색어로 키워드를 묶는 batch_keywords 테스트"""
+
+    def test_packs_up_to_max_length(self, fake_crawler):
+        fake_crawler.keyword_or_operator = " | "
+
+        batches = fake_crawler.batch_keywords(["AI", "반도체", "전기 차", "원전"], 15)
+
+        assert batches == [
+            ("AI | 반도체", ("AI", "반도체")),
+            ('"전기 차" | 원전', ("전기 차", "원전")),
+        ]
+        assert all(len(query) <= 15 for query, _ in batches)
+
+    def test_without_operator_keeps_keywords(self, fake_crawler):
+        assert fake_crawler.batch_keywords(["AI", "반도체"], 100) == [
+            ("AI", ("AI",)),
+            ("반도체", ("반도체",)),
+        ]
@@ -0,0 +1,94 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.exceptions import FetchError
+from src.core.metrics import BROWSER_RENDER_SECONDS, request_labels
+from src.shared.browser_client import BrowserClient
+
+
+def _page(status: int = 200) -> AsyncMock:
+    page = AsyncMock()
+    page.goto.return_value = MagicMock(status=status, headers={})
+    page.content.return_value = "<html></html>"
+    return page
+
+
+@pytest.fixture
+def browser():
+    """new_context마다 새 mock 컨텍스트를 만드는 mock 브라우저 (`created`에 기록)"""
+    browser = AsyncMock()
+    browser.created = []
+
+    async def new_context():
+        context = AsyncMock()
+        context.new_page.side_effect = lambda: _page(browser.status)
+        browser.created.append(context)
+        return context
+
+    browser.status = 200
+    browser.new_context.side_effect = new_context
+    return browser
+
+
+def _client(browser, context_max_uses: int = 50) -> BrowserClient:
+    client = BrowserClient(context_max_uses=context_max_uses)
+    client._browser = browser
+    return client
+
+
+class TestBrowserClientContextPool:
+    """BrowserClient 호스트별 컨텍스트 재사용 테스트"""
+
+    async def test_context_reused_per_host(self, browser):
+        client = _client(browser)
+
+        await client.get("https://a.test/1", wait_selector="body")
+        await client.get("https://a.test/2", wait_selector="body")
+        await client.get("https://b.test/1", wait_selector="body")
+
+        assert len(browser.created) == 2
+
+    async def test_render_metric_labelled_with_request_labels(self, browser):
+        labels = {"channel": "hani", "strategy": "dynamic", "host": "a.test"}
+        rendered = BROWSER_RENDER_SECONDS.count(**labels)
+
+        with request_labels(channel="hani", strategy="dynamic"):
+            await _client(browser).get("https://a.test/1", wait_selector="body")
+
+        assert BROWSER_RENDER_SECONDS.count(**labels) == rendered + 1
+
+    async def test_context_closed_after_max_uses(self, browser):
+        client = _client(browser, context_max_uses=2)
+
+        for i in range(3):
+            await client.get(f"https://a.test/{i}", wait_selector="body")
+
+        first, second = browser.created
+        first.close.assert_awaited_once()
+        second.close.assert_not_awaited()
+
+    async def test_context_closed_on_error(self, browser):
+        client = _client(browser)
+        browser.status = 503
+
+        with pytest.raises(FetchError):
+            await client.get("https://a.test/1", wait_selector="body")
+        browser.status = 200
+        await client.get("https://a.test/2", wait_selector="body")
+
+        assert len(browser.created) == 2
+        browser.created[0].close.assert_awaited_once()
+
+    async def test_warm_up_and_exit_close_idle_contexts(self, browser):
+        client = _client(browser)
+
+        await client.warm_up(["https://a.test/", "https://b.test/x"], contexts=2)
+        await client.get("https://a.test/1", wait_selector="body")
+        assert len(browser.created) == 4
+
+        await client.__aexit__(None, None, None)
+
+        for context in browser.created:
+            context.close.assert_awaited_once()
+        browser.close.assert_awaited_once()
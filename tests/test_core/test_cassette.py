@@ -0,0 +1,111 @@
+import gzip
+
+import pytest
+
+from src.core.cassette import (
+    Cassette,
+    CassetteEntry,
+    CassetteWriter,
+    RecordingFetchStrategy,
+    ReplayFetchStrategy,
+)
+from src.core.exceptions import FetchError
+from src.core.retry import is_retryable
+from tests.conftest import FakeFetchStrategy
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return tmp_path / "run.cassette.jsonl.gz"
+
+
+async def _record(path, pages: dict[str, str], urls: list[str]) -> FakeFetchStrategy:
+    inner = FakeFetchStrategy(pages)
+    writer = CassetteWriter(path)
+    recorder = RecordingFetchStrategy(inner, writer)
+    for url in urls:
+        try:
+            await recorder.fetch(url)
+        except FetchError:
+            pass
+    writer.close()
+    return inner
+
+
+class TestCassette:
+    """cassette 기록/재생 테스트"""
+
+    async def test_round_trip_replays_responses_and_errors(self, cassette_path):
+        """기록한 응답과 실패를 네트워크 없이 그대로 재생한다"""
+        await _record(
+            cassette_path,
+            {"https://a.test/1": "<p>본문</p>"},
+            ["https://a.test/1", "https://a.test/x"],
+        )
+
+        replay = ReplayFetchStrategy(Cassette.load(cassette_path), name="static")
+
+        assert replay.name == "static"
+        assert await replay.fetch("https://a.test/1") == "<p>본문</p>"
+        with pytest.raises(FetchError, match="없는 페이지"):
+            await replay.fetch("https://a.test/x")
+
+    async def test_unknown_url_fails_without_retry(self, cassette_path):
+        """기록에 없는 URL은 재시도하지 않는 404로 실패한다"""
+        await _record(cassette_path, {}, [])
+
+        with pytest.raises(FetchError) as exc_info:
+            await ReplayFetchStrategy(Cassette.load(cassette_path)).fetch("https://a.test/none")
+
+        assert exc_info.value.status_code == 404
+        assert not is_retryable(exc_info.value)
+
+    def test_same_url_replays_in_recorded_order(self):
+        """같은 URL의 기록은 순서대로 쓰고, 다 쓰면 마지막 기록을 반복한다"""
+        cassette = Cassette(
+            [
+                CassetteEntry("https://a.test/1", 0.1, error="HTTP 503", status_code=503),
+                CassetteEntry("https://a.test/1", 0.2, html="ok"),
+            ]
+        )
+
+        assert [cassette.next("https://a.test/1").status_code for _ in range(3)] == [
+            503,
+            None,
+            None,
+        ]
+
+    async def test_latency_mode_waits_recorded_time(self, monkeypatch):
+        """latency 모드는 기록된 응답 시간만큼 기다린다"""
+        slept: list[float] = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        cassette = Cassette([CassetteEntry("https://a.test/1", 0.25, html="ok")])
+
+        await ReplayFetchStrategy(cassette, latency=True).fetch("https://a.test/1")
+        await ReplayFetchStrategy(cassette).fetch("https://a.test/1")
+
+        assert slept == [0.25]
+
+    def test_truncated_file_loads_complete_entries(self, cassette_path):
+        """중단되어 끝이 잘린 파일도 온전한 기록까지는 읽는다"""
+        writer = CassetteWriter(cassette_path)
+        for i in range(50):
+            writer.append(CassetteEntry(f"https://a.test/{i}", 0.1, html="x" * 1000))
+        writer.close()
+        data = cassette_path.read_bytes()
+        cassette_path.write_bytes(data[: len(data) - 20])
+
+        cassette = Cassette.load(cassette_path)
+
+        assert 0 < len(cassette) <= 50
+
+    def test_rejects_unknown_format(self, cassette_path):
+        with gzip.open(cassette_path, "wt") as f:
+            f.write('{"version": 99}\n')
+
+        with pytest.raises(ValueError):
+            Cassette.load(cassette_path)
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from src.core.coalescing import CoalescingFetchStrategy, InFlightRequests
+from src.core.exceptions import FetchError
+from src.core.metrics import COALESCED_REQUESTS, count_response_bytes, record_response_bytes
+from tests.conftest import FakeFetchStrategy
+
+
+class _SlowFetchStrategy(FakeFetchStrategy):
+    """`release`가 설정될 때까지 응답을 미루는 테스트용 fetch 전략"""
+
+    def __init__(self, pages: dict[str, str]) -> None:
+        super().__init__(pages)
+        self.release = asyncio.Event()
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        self.fetched.append(url)
+        await self.release.wait()
+        if url not in self.pages:
+            raise FetchError(f"없는 페이지: {url}")
+        return self.pages[url]
+
+
+async def _settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestCoalescingFetchStrategy:
+    """CoalescingFetchStrategy 테스트"""
+
+    async def test_concurrent_same_url_fetched_once(self):
+        """같은 페이지(추적 파라미터만 다른 URL 포함)를 동시에 요청하면 한 번만 가져온다"""
+        inner = _SlowFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        inflight = InFlightRequests()
+        strategy = CoalescingFetchStrategy(inner, inflight)
+        coalesced = COALESCED_REQUESTS.value(strategy="custom")
+
+        tasks = [
+            asyncio.create_task(strategy.fetch("https://a.test/1")),
+            asyncio.create_task(strategy.fetch("https://a.test/1?utm_source=x")),
+            asyncio.create_task(strategy.fetch("https://a.test/1")),
+        ]
+        await _settle()
+        inner.release.set()
+
+        assert await asyncio.gather(*tasks) == ["<html>1</html>"] * 3
+        assert inner.fetched == ["https://a.test/1"]
+        assert COALESCED_REQUESTS.value(strategy="custom") == coalesced + 2
+        assert len(inflight) == 0
+
+    async def test_waiters_receive_reported_bytes(self):
+        """함께 기다린 호출자도 실제 요청이 알린 본문 크기를 각자 받는다"""
+        inner = _SlowFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        strategy = CoalescingFetchStrategy(inner, InFlightRequests())
+        original_fetch = inner.fetch
+
+        async def fetch(url: str, wait_selector: str | None = None) -> str:
+            html = await original_fetch(url, wait_selector)
+            record_response_bytes(100)
+            return html
+
+        inner.fetch = fetch
+
+        async def counted_fetch() -> int:
+            with count_response_bytes() as received:
+                await strategy.fetch("https://a.test/1")
+            return received.total
+
+        tasks = [asyncio.create_task(counted_fetch()) for _ in range(2)]
+        await _settle()
+        inner.release.set()
+
+        assert await asyncio.gather(*tasks) == [100, 100]
+        assert inner.fetched == ["https://a.test/1"]
+
+    async def test_finished_request_is_not_cached(self):
+        inner = FakeFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        strategy = CoalescingFetchStrategy(inner, InFlightRequests())
+
+        await strategy.fetch("https://a.test/1")
+        await strategy.fetch("https://a.test/1")
+
+        assert len(inner.fetched) == 2
+
+    async def test_different_wait_selector_not_coalesced(self):
+        inner = _SlowFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        strategy = CoalescingFetchStrategy(inner, InFlightRequests())
+
+        tasks = [
+            asyncio.create_task(strategy.fetch("https://a.test/1")),
+            asyncio.create_task(strategy.fetch("https://a.test/1", wait_selector="#body")),
+        ]
+        await _settle()
+        inner.release.set()
+        await asyncio.gather(*tasks)
+
+        assert len(inner.fetched) == 2
+
+    async def test_error_shared_with_waiters(self):
+        inner = _SlowFetchStrategy({})
+        strategy = CoalescingFetchStrategy(inner, InFlightRequests())
+
+        tasks = [asyncio.create_task(strategy.fetch("https://a.test/x")) for _ in range(2)]
+        await _settle()
+        inner.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, FetchError) for result in results)
+        assert len(inner.fetched) == 1
+
+    async def test_leader_cancel_does_not_affect_waiters(self):
+        """처음 요청한 호출자가 취소되어도 함께 기다리던 호출자는 결과를 받는다"""
+        inner = _SlowFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        strategy = CoalescingFetchStrategy(inner, InFlightRequests())
+
+        leader = asyncio.create_task(strategy.fetch("https://a.test/1"))
+        await _settle()
+        follower = asyncio.create_task(strategy.fetch("https://a.test/1"))
+        await _settle()
+        leader.cancel()
+        await _settle()
+        inner.release.set()
+
+        assert await follower == "<html>1</html>"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(inner.fetched) == 1
+
+    async def test_request_cancelled_when_all_waiters_cancel(self):
+        inner = _SlowFetchStrategy({"https://a.test/1": "<html>1</html>"})
+        inflight = InFlightRequests()
+        strategy = CoalescingFetchStrategy(inner, inflight)
+
+        tasks = [asyncio.create_task(strategy.fetch("https://a.test/1")) for _ in range(2)]
+        await _settle()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await _settle()
+
+        assert len(inflight) == 0
@@ -0,0 +1,93 @@
+import asyncio
+import socket
+
+import httpcore
+import pytest
+
+from src.shared.dns_cache import CachingNetworkBackend, DnsCache
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """loop.getaddrinfo 대신 호출 기록만 남기고 고정 주소를 돌려준다 (없는 호스트는 실패)"""
+    calls: list[str] = []
+
+    async def getaddrinfo(loop, host, port, **kwargs):
+        calls.append(host)
+        await asyncio.sleep(0)
+        if host.startswith("missing"):
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        info = (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port))
+        return [info, info, (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.2", port))]
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", getaddrinfo)
+    return calls
+
+
+class _RecordingBackend(httpcore.AsyncNetworkBackend):
+    """연결 시도한 주소를 기록하고 `refused` 주소는 연결 실패로 응답한다"""
+
+    def __init__(self, refused: set[str] = frozenset()) -> None:
+        self.refused = refused
+        self.connected: list[str] = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.connected.append(host)
+        if host in self.refused:
+            raise httpcore.ConnectError(f"refused: {host}")
+        return httpcore.AsyncMockStream([])
+
+
+class TestDnsCache:
+    """DnsCache, CachingNetworkBackend 테스트"""
+
+    async def test_concurrent_lookups_share_one_query(self, lookups):
+        cache = DnsCache()
+
+        results = await asyncio.gather(*(cache.resolve("a.test", 443) for _ in range(3)))
+        await cache.resolve("a.test", 443)
+
+        assert results == [["10.0.0.1", "10.0.0.2"]] * 3
+        assert lookups == ["a.test"]
+
+    async def test_expired_entry_looked_up_again(self, lookups):
+        cache = DnsCache(ttl=0.0)
+
+        await cache.resolve("a.test", 443)
+        await cache.resolve("a.test", 443)
+
+        assert lookups == ["a.test", "a.test"]
+
+    async def test_failure_not_cached(self, lookups):
+        cache = DnsCache()
+
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await cache.resolve("missing.test", 443)
+
+        assert lookups == ["missing.test", "missing.test"]
+        assert len(cache) == 0
+
+    async def test_backend_connects_to_next_address(self, lookups):
+        """첫 주소에 연결하지 못하면 다음 주소로 연결한다"""
+        inner = _RecordingBackend(refused={"10.0.0.1"})
+        backend = CachingNetworkBackend(inner, DnsCache())
+
+        await backend.connect_tcp("a.test", 443)
+
+        assert inner.connected == ["10.0.0.1", "10.0.0.2"]
+
+    async def test_backend_lookup_failure_is_connect_error(self, lookups):
+        backend = CachingNetworkBackend(_RecordingBackend(), DnsCache())
+
+        with pytest.raises(httpcore.ConnectError, match="DNS 조회 실패"):
+            await backend.connect_tcp("missing.test", 443)
+
+    async def test_backend_skips_lookup_for_ip(self, lookups):
+        inner = _RecordingBackend()
+        backend = CachingNetworkBackend(inner, DnsCache())
+
+        await backend.connect_tcp("127.0.0.1", 80)
+
+        assert lookups == []
+        assert inner.connected == ["127.0.0.1"]
@@ -53,9 +53,7 @@ class TestDynamicFetchStrategy:
         strategy = DynamicFetchStrategy(browser_client=mock_client)
         await strategy.fetch("https://example.com", wait_selector="div.content")
 
-        mock_client.get.assert_called_once_with(
-            "https://example.com", wait_selector="div.content"
-        )
+        mock_client.get.assert_called_once_with("https://example.com", wait_selector="div.content")
 
     async def test_fetch_failure_raises_fetch_error(self):
         """BrowserClient 실패 시 FetchError 발생"""
@@ -66,3 +64,16 @@ class TestDynamicFetchStrategy:
 
         with pytest.raises(FetchError, match="동적 페이지 가져오기 실패"):
             await strategy.fetch("https://example.com/fail")
+
+    async def test_fetch_failure_keeps_status_code(self):
+        """HTTP 상태 코드와 Retry-After를 FetchError에 전달"""
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = FetchError("HTTP 429", status_code=429, retry_after=3.0)
+
+        strategy = DynamicFetchStrategy(browser_client=mock_client)
+
+        with pytest.raises(FetchError) as exc_info:
+            await strategy.fetch("https://example.com/busy")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 3.0
@@ -0,0 +1,152 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.core.metrics import OVERSIZE_PAGES, count_response_bytes
+from src.shared import http_client as http_client_module
+from src.shared.dns_cache import DnsCache
+from src.shared.http_client import HttpClient, sniff_charset
+
+KOREAN = "한국어 기사 본문"
+
+# 경로 → (Content-Type, 본문)
+PAGES: dict[str, tuple[str, bytes]] = {
+    "/utf8": ("text/html; charset=utf-8", f"<html>{KOREAN}</html>".encode()),
+    "/meta": (
+        "text/html",
+        f'<html><head><meta charset="euc-kr"></head>{KOREAN}</html>'.encode("cp949"),
+    ),
+    "/plain": ("text/html", f"<html>{KOREAN}</html>".encode("cp949")),
+    "/big": ("text/html; charset=utf-8", b"<html>" + b"x" * 100_000 + b"</html>"),
+}
+
+
+@pytest.fixture
+async def site():
+    """경로별 고정 응답을 주는 HTTP/1.1 서버 (요청마다 연결을 닫는다)"""
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        _, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+        while await reader.readline() not in (b"\r\n", b""):
+            pass
+        status, (content_type, body) = "200 OK", PAGES.get(path, ("text/html", b""))
+        if path not in PAGES:
+            status = "404 Not Found"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    async with server:
+        yield f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+class TestHttpClient:
+    """HttpClient 스트리밍 읽기, 크기 상한, 인코딩 테스트"""
+
+    async def test_header_charset(self, site):
+        async with HttpClient("ua") as client:
+            assert KOREAN in await client.get(f"{site}/utf8")
+
+    async def test_meta_charset_cached_per_host(self, site, monkeypatch):
+        """헤더에 charset이 없으면 호스트별로 한 번만 본문에서 추정한다"""
+        sniffed: list[bytes] = []
+
+        def sniff(content: bytes) -> str:
+            sniffed.append(content)
+            return sniff_charset(content)
+
+        monkeypatch.setattr(http_client_module, "sniff_charset", sniff)
+        async with HttpClient("ua") as client:
+            first = await client.get(f"{site}/meta")
+            second = await client.get(f"{site}/plain")
+
+        assert KOREAN in first
+        assert KOREAN in second
+        assert len(sniffed) == 1
+
+    async def test_oversize_page_truncated_and_counted(self, site):
+        counted = OVERSIZE_PAGES.value(host="127.0.0.1")
+        async with HttpClient("ua", max_page_bytes=10_000) as client:
+            html = await client.get(f"{site}/big")
+
+        assert len(html) == 10_000
+        assert OVERSIZE_PAGES.value(host="127.0.0.1") == counted + 1
+
+    async def test_reports_body_bytes_read(self, site):
+        """읽은 본문 바이트 수(디코딩 전)를 현재 요청에 알린다"""
+        with count_response_bytes() as received:
+            async with HttpClient("ua") as client:
+                await client.get(f"{site}/plain")
+
+        assert received.reported
+        assert received.total == len(PAGES["/plain"][1])
+
+    async def test_host_resolved_through_dns_cache(self, site, monkeypatch):
+        resolved: list[str] = []
+        resolve = DnsCache.resolve
+
+        async def record(cache, host, port):
+            resolved.append(host)
+            return await resolve(cache, host, port)
+
+        monkeypatch.setattr(DnsCache, "resolve", record)
+        url = site.replace("127.0.0.1", "localhost")
+        async with HttpClient("ua") as client:
+            await client.get(f"{url}/utf8")
+            await client.get(f"{url}/meta")
+
+        assert resolved == ["localhost", "localhost"]
+
+    async def test_connect_error_is_httpx_error(self):
+        async with HttpClient("ua") as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://127.0.0.1:1/")
+
+    async def test_status_error_raised(self, site):
+        async with HttpClient("ua") as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get(f"{site}/missing")
+
+
+class TestMaxBytes:
+    """URL별 크기 상한 선택 테스트"""
+
+    def test_longest_prefix_wins(self):
+        client = HttpClient(
+            "ua",
+            max_page_bytes=1000,
+            max_page_bytes_overrides={"a.test": 2000, "a.test/news/": 3000, "a.test/news/big": 4},
+        )
+
+        assert client.max_bytes_for("https://a.test/") == 2000
+        assert client.max_bytes_for("https://a.test/news/1") == 3000
+        assert client.max_bytes_for("https://a.test/news/big") == 4
+        assert client.max_bytes_for("https://b.test/news/1") == 1000
+
+    def test_prefix_matches_whole_path_segment(self):
+        client = HttpClient("ua", max_page_bytes=0, max_page_bytes_overrides={"a.test/news": 5})
+
+        assert client.max_bytes_for("https://a.test/news/1") == 5
+        assert client.max_bytes_for("https://a.test/newsletter") == 0
+        assert client.max_bytes_for("https://a.testing.com/news/1") == 0
+
+
+class TestSniffCharset:
+    """sniff_charset 함수 테스트"""
+
+    def test_declared_euc_kr_read_as_cp949(self):
+        http_equiv = b'<meta http-equiv="Content-Type" content="text/html; charset=EUC-KR">'
+        assert sniff_charset(http_equiv) == "cp949"
+        assert sniff_charset(b"<meta charset='euc-kr'>") == "cp949"
+
+    def test_utf8_with_truncated_last_char(self):
+        assert sniff_charset(KOREAN.encode()[:-1]) == "utf-8"
+
+    def test_undeclared_non_utf8_falls_back_to_cp949(self):
+        assert sniff_charset(KOREAN.encode("cp949")) == "cp949"
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from src.core.metrics import (
+    DOWNLOADED_BYTES,
+    FETCH_SECONDS,
+    PARSE_SECONDS,
+    MetricsRegistry,
+    record_response_bytes,
+)
+from tests.conftest import FakeCrawler, FakeFetchStrategy
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 테스트"""
+
+    def test_counter_by_labels(self):
+        """라벨 조합별로 따로 센다"""
+        registry = MetricsRegistry()
+        counter = registry.counter("test_total", "테스트", ("channel",))
+        counter.inc(channel="a")
+        counter.inc(2, channel="a")
+        counter.inc(channel="b")
+
+        assert counter.value(channel="a") == 3
+        assert counter.value(channel="b") == 1
+
+    def test_prometheus_histogram_format(self):
+        """히스토그램은 누적 bucket, sum, count로 출력한다"""
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_seconds", "테스트", ("stage",), buckets=(0.1, 1.0))
+        hist.observe(0.05, stage="search")
+        hist.observe(0.5, stage="search")
+        hist.observe(5.0, stage="search")
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE test_seconds histogram" in text
+        assert 'test_seconds_bucket{stage="search",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{stage="search",le="1"} 2' in text
+        assert 'test_seconds_bucket{stage="search",le="+Inf"} 3' in text
+        assert 'test_seconds_count{stage="search"} 3' in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "테스트", ("name",)).inc(name='a"b')
+
+        assert 'test_total{name="a\\"b"} 1' in registry.render_prometheus()
+
+    def test_json_summary(self, tmp_path):
+        """JSON 요약에는 값이 있는 지표만 평균과 분위수 구간 상한과 함께 담긴다"""
+        registry = MetricsRegistry()
+        registry.counter("unused_total", "미사용")
+        hist = registry.histogram("test_seconds", "테스트", buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 0.5):
+            hist.observe(value)
+
+        path = registry.write_json(tmp_path / "metrics.json")
+        summary = json.loads(path.read_text(encoding="utf-8"))
+
+        assert list(summary) == ["test_seconds"]
+        values = summary["test_seconds"]["values"][0]
+        assert values["count"] == 4
+        assert values["avg"] == pytest.approx(0.275)
+        assert values["p50"] == 0.1
+        assert values["p95"] == 1.0
+
+    def test_duplicate_name_rejected(self):
+        registry = MetricsRegistry()
+        registry.counter("test_total", "테스트")
+        with pytest.raises(ValueError):
+            registry.counter("test_total", "테스트")
+
+
+class TestCrawlerMetrics:
+    """BaseCrawler 지표 기록 테스트"""
+
+    async def test_records_fetch_parse_and_bytes(self, fake_crawler):
+        labels = {"channel": "fake", "strategy": "custom", "stage": "search"}
+        fetched = FETCH_SECONDS.count(outcome="ok", **labels)
+        parsed = PARSE_SECONDS.count(**labels)
+        downloaded = DOWNLOADED_BYTES.value(**labels)
+
+        await fake_crawler.fetch_search_page("AI", 1)
+
+        assert FETCH_SECONDS.count(outcome="ok", **labels) == fetched + 1
+        assert PARSE_SECONDS.count(**labels) == parsed + 1
+        assert DOWNLOADED_BYTES.value(**labels) > downloaded
+
+    async def test_downloaded_bytes_uses_reported_size(self, settings, fake_pages):
+        """전략이 알린 본문 크기가 있으면 HTML을 다시 인코딩하지 않고 그 값을 쓴다"""
+
+        class _ReportingStrategy(FakeFetchStrategy):
+            async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+                record_response_bytes(1234)
+                return await super().fetch(url, wait_selector)
+
+        crawler = FakeCrawler(_ReportingStrategy(fake_pages), settings)
+        labels = {"channel": "fake", "strategy": "custom", "stage": "search"}
+        downloaded = DOWNLOADED_BYTES.value(**labels)
+
+        await crawler.fetch_search_page("AI", 1)
+
+        assert DOWNLOADED_BYTES.value(**labels) == downloaded + 1234
+
+    async def test_records_failed_fetch(self, fake_crawler, sample_search_result):
+        labels = {"channel": "fake", "strategy": "custom", "stage": "detail"}
+        failed = FETCH_SECONDS.count(outcome="error", **labels)
+
+        with pytest.raises(Exception):
+            await fake_crawler.fetch_article(sample_search_result, "AI")
+
+        assert FETCH_SECONDS.count(outcome="error", **labels) == failed + 1
@@ -106,6 +106,12 @@ class TestSearchResult:
 
         assert sr.snippet == ""
 
+    def test_search_result_is_lightweight(self):
+        """SearchResult는 인스턴스 __dict__가 없는 slots 레코드"""
+        sr = SearchResult(title="제목", url="https://example.com/search/3")
+
+        assert not hasattr(sr, "__dict__")
+
 
 class TestCrawlResult:
     """CrawlResult 모델 테스트"""
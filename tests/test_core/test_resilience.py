@@ -0,0 +1,153 @@
+import pytest
+
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.core.metrics import FETCH_RETRIES, request_labels
+from src.core.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    ResilientFetchStrategy,
+)
+from tests.conftest import FakeFetchStrategy
+
+
+class _Clock:
+    """monotonic 시계를 대신하는 테스트용 시계"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr("src.core.resilience.time.monotonic", clock)
+    return clock
+
+
+class _StatusFetchStrategy(FakeFetchStrategy):
+    """미리 정한 상태 코드 순서대로 실패한 뒤 성공하는 fetch 전략"""
+
+    def __init__(self, statuses: list[int | None]) -> None:
+        super().__init__({})
+        self.statuses = statuses
+
+    async def fetch(self, url: str, wait_selector: str | None = None) -> str:
+        self.fetched.append(url)
+        if self.statuses:
+            status = self.statuses.pop(0)
+            raise FetchError(f"HTTP {status}: {url}", status_code=status)
+        return "<html></html>"
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_when_error_rate_exceeds_threshold(self, clock):
+        """최소 요청 수 이상에서 실패 비율이 임계값 이상이면 open"""
+        breaker = CircuitBreaker("a.test", window=10, min_requests=4, error_threshold=0.5)
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError, match="a.test"):
+            breaker.before_request()
+
+    def test_open_duration_respects_retry_after(self, clock):
+        """Retry-After가 open 시간보다 길면 그만큼 유지"""
+        breaker = CircuitBreaker("a.test", min_requests=1, open_seconds=10.0)
+        breaker.record_failure(retry_after=60.0)
+
+        clock.now += 30
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after == pytest.approx(30.0)
+
+    def test_half_open_allows_single_probe(self, clock):
+        """open 시간이 지나면 확인 요청 1건만 통과하고 성공 시 closed"""
+        breaker = CircuitBreaker("a.test", min_requests=1, open_seconds=10.0)
+        breaker.record_failure()
+        clock.now += 10
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_request()
+
+    def test_half_open_failure_reopens(self, clock):
+        """확인 요청이 실패하면 다시 open"""
+        breaker = CircuitBreaker("a.test", min_requests=1, open_seconds=10.0)
+        breaker.record_failure()
+        clock.now += 10
+        breaker.before_request()
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestResilientFetchStrategy:
+    """ResilientFetchStrategy 테스트"""
+
+    @pytest.fixture
+    def resilient_settings(self, settings):
+        return settings.model_copy(
+            update={
+                "fetch_max_retries": 2,
+                "fetch_retry_base_delay": 0.0,
+                "fetch_retry_jitter": 0.0,
+                "circuit_min_requests": 3,
+            }
+        )
+
+    async def test_retries_server_error(self, resilient_settings):
+        """503은 재시도하여 성공하고 재시도 횟수를 요청한 채널 라벨과 함께 지표로 남긴다"""
+        inner = _StatusFetchStrategy([503, 503])
+        strategy = ResilientFetchStrategy(
+            inner, CircuitBreakerRegistry(resilient_settings), resilient_settings
+        )
+        labels = {"channel": "mk", "strategy": "custom", "status": "503"}
+        retries = FETCH_RETRIES.value(**labels)
+
+        with request_labels(channel="mk", strategy="static"):
+            assert await strategy.fetch("https://a.test/1") == "<html></html>"
+        assert len(inner.fetched) == 3
+        assert FETCH_RETRIES.value(**labels) == retries + 2
+
+    async def test_does_not_retry_not_found(self, resilient_settings):
+        """404는 재시도하지 않고 호스트 실패로도 기록하지 않음"""
+        inner = _StatusFetchStrategy([404] * 5)
+        breakers = CircuitBreakerRegistry(resilient_settings)
+        strategy = ResilientFetchStrategy(inner, breakers, resilient_settings)
+
+        for i in range(5):
+            with pytest.raises(FetchError):
+                await strategy.fetch(f"https://a.test/{i}")
+
+        assert len(inner.fetched) == 5
+        assert breakers.states() == {"a.test": CircuitState.CLOSED}
+
+    async def test_circuit_open_stops_requests(self, resilient_settings):
+        """연속 실패로 circuit이 열리면 요청하지 않고 CircuitOpenError 발생"""
+        inner = _StatusFetchStrategy([503] * 10)
+        strategy = ResilientFetchStrategy(
+            inner, CircuitBreakerRegistry(resilient_settings), resilient_settings
+        )
+
+        with pytest.raises(FetchError, match="HTTP 503"):
+            await strategy.fetch("https://a.test/1")
+        # 마지막 재시도까지 실패하면서 circuit이 열린다
+        assert len(inner.fetched) == 3
+
+        with pytest.raises(CircuitOpenError):
+            await strategy.fetch("https://a.test/2")
+        assert len(inner.fetched) == 3
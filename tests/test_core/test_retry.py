@@ -1,7 +1,11 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
 import pytest
 
-from src.core.exceptions import FetchError
-from src.core.retry import retry
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.core.retry import is_retryable, parse_retry_after, retry
 
 
 class TestRetry:
@@ -70,3 +74,99 @@ class TestRetry:
 
         # 재시도 없이 1회만 호출
         assert call_count == 1
+
+    async def test_should_retry_false_raises_immediately(self):
+        """should_retry가 False를 반환하면 재시도하지 않음"""
+        call_count = 0
+
+        @retry(max_retries=3, base_delay=0.0, should_retry=is_retryable)
+        async def not_found():
+            nonlocal call_count
+            call_count += 1
+            raise FetchError("없는 페이지", status_code=404)
+
+        with pytest.raises(FetchError):
+            await not_found()
+
+        assert call_count == 1
+
+    async def test_retry_after_sets_minimum_delay(self, monkeypatch):
+        """Retry-After가 백오프보다 길면 그만큼 대기"""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        call_count = 0
+
+        @retry(max_retries=1, base_delay=0.1, max_delay=10.0)
+        async def throttled():
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise FetchError("요청 과다", status_code=429, retry_after=5.0)
+            return "ok"
+
+        assert await throttled() == "ok"
+        assert delays == [5.0]
+
+    async def test_retry_after_longer_than_max_delay_raises(self):
+        """Retry-After가 최대 대기보다 길면 기다리지 않고 예외 발생"""
+        call_count = 0
+
+        @retry(max_retries=3, base_delay=0.0, max_delay=1.0)
+        async def throttled():
+            nonlocal call_count
+            call_count += 1
+            raise FetchError("요청 과다", status_code=503, retry_after=120.0)
+
+        with pytest.raises(FetchError):
+            await throttled()
+
+        assert call_count == 1
+
+    async def test_jitter_keeps_delay_in_range(self, monkeypatch):
+        """jitter 적용 시 대기 시간이 ±비율 범위 안에 있음"""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        @retry(max_retries=5, base_delay=1.0, backoff_factor=1.0, jitter=0.5)
+        async def always_fail():
+            raise FetchError("항상 실패")
+
+        with pytest.raises(FetchError):
+            await always_fail()
+
+        assert len(delays) == 5
+        assert all(0.5 <= d <= 1.5 for d in delays)
+
+
+class TestRetryClassification:
+    """재시도 분류와 Retry-After 파싱 테스트"""
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(None, True), (429, True), (503, True), (404, False), (403, False)],
+    )
+    def test_is_retryable(self, status_code, expected):
+        assert is_retryable(FetchError("실패", status_code=status_code)) is expected
+
+    def test_circuit_open_not_retryable(self):
+        assert is_retryable(CircuitOpenError("example.com", 10.0)) is False
+
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_parse_retry_after_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=60)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 55 <= seconds <= 60
+
+    def test_parse_retry_after_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("잘못된 값") is None
@@ -1,6 +1,13 @@
 from bs4 import BeautifulSoup
 
-from src.shared.text_cleaner import clean_text, extract_text_from_html
+from src.shared.text_cleaner import (
+    clean_text,
+    content_fingerprint,
+    extract_text_from_html,
+    find_total_count,
+    match_keywords,
+    normalize_for_hash,
+)
 
 
 class TestCleanText:
@@ -55,3 +62,48 @@ class TestExtractTextFromHtml:
 
         assert "강조" in result
         assert "텍스트" in result
+
+
+class TestContentFingerprint:
+    """normalize_for_hash, content_fingerprint 함수 테스트"""
+
+    def test_normalize_drops_punctuation_contacts_and_case(self):
+        """문장 부호, 공백, URL, 이메일을 지우고 소문자로 바꾼다"""
+        text = "AI 반도체, 수출 증가!\n홍길동 기자 hong@news.test https://news.test/a/1"
+        assert normalize_for_hash(text) == "ai반도체수출증가홍길동기자"
+
+    def test_fingerprint_ignores_whitespace_changes(self):
+        """공백과 줄바꿈만 다르면 같은 지문"""
+        assert content_fingerprint("제목", "첫 문장.\n둘째 문장.") == content_fingerprint(
+            "제목", "첫 문장.  둘째 문장."
+        )
+
+    def test_fingerprint_detects_body_change(self):
+        """본문 내용이 바뀌면 다른 지문"""
+        assert content_fingerprint("제목", "사망자 3명") != content_fingerprint(
+            "제목", "사망자 5명"
+        )
+
+
+class TestFindTotalCount:
+    """find_total_count 함수 테스트"""
+
+    def test_count_with_markup_and_commas(self):
+        """숫자를 감싼 태그와 천 단위 쉼표를 허용한다"""
+        assert find_total_count("<p>검색 결과 총 <strong>1,234</strong>건</p>") == 1234
+
+    def test_missing_count(self):
+        assert find_total_count("<p>검색 결과가 없습니다</p>") is None
+
+
+class TestMatchKeywords:
+    """match_keywords 함수 테스트"""
+
+    def test_all_terms_must_appear(self):
+        """키워드의 단어가 모두 나와야 일치 (순서, 대소문자, 문장 부호 무시)"""
+        text = "삼성, 전기차 배터리 투자… ai 반도체도"
+        assert match_keywords(["AI", "배터리 삼성", "원전", "전기 차"], text) == [
+            "AI",
+            "배터리 삼성",
+            "전기 차",
+        ]
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from src.core.tracing import TRACER, Tracer
+from src.pipeline.orchestrator import CrawlOrchestrator
+
+
+@pytest.fixture
+def tracer():
+    """기록 중인 전역 TRACER (테스트 후 정리)"""
+    TRACER.start()
+    yield TRACER
+    TRACER.stop()
+    TRACER.clear()
+
+
+class TestTracer:
+    """Tracer 테스트"""
+
+    def test_disabled_records_nothing(self):
+        tracer = Tracer()
+        with tracer.span("fetch", "fetch", url="https://a.test"):
+            pass
+
+        assert tracer.events == []
+
+    async def test_nested_spans_with_args(self, tmp_path):
+        """구간은 complete 이벤트로 기록되고 하위 구간이 상위 구간 안에 놓인다"""
+        tracer = Tracer()
+        tracer.start()
+        with tracer.span("detail", "work", channel="a"):
+            with tracer.span("fetch", "fetch", url="https://a.test/1"):
+                pass
+
+        outer, inner = sorted(tracer.events, key=lambda e: e["ts"])
+        assert (outer["name"], inner["name"]) == ("detail", "fetch")
+        assert inner["args"] == {"url": "https://a.test/1"}
+        assert outer["ph"] == inner["ph"] == "X"
+        assert outer["tid"] == inner["tid"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+        payload = json.loads(tracer.write(tmp_path / "trace.json").read_text(encoding="utf-8"))
+        names = [e["name"] for e in payload["traceEvents"]]
+        assert "thread_name" in names
+
+    def test_sampling_decided_at_root(self):
+        """최상위 구간이 샘플링되지 않으면 하위 구간도 기록하지 않는다"""
+        tracer = Tracer()
+        tracer.start(sample_rate=0.0)
+        with tracer.span("detail", "work"):
+            with tracer.span("fetch", "fetch"):
+                pass
+
+        assert tracer.events == []
+
+    def test_max_events_drops_overflow(self):
+        tracer = Tracer()
+        tracer.start(max_events=2)
+        for _ in range(5):
+            with tracer.span("parse", "parse"):
+                pass
+
+        assert len(tracer.events) == 2
+        assert tracer.dropped == 3
+
+
+class TestRunTrace:
+    """크롤링 실행 trace 테스트"""
+
+    async def test_run_records_work_fetch_parse_sleep(self, settings, patched_registry, tracer):
+        """작업 구간 아래에 요청, 파싱, 대기 구간이 채널/키워드/URL과 함께 기록된다"""
+        await CrawlOrchestrator(settings).run(["AI"], ["fake"])
+
+        events = tracer.events
+        names = {e["name"] for e in events}
+        assert {"search", "detail", "fetch", "parse", "sleep"} <= names
+
+        detail = next(e for e in events if e["name"] == "detail")
+        assert detail["args"]["channel"] == "fake"
+        assert detail["args"]["keyword"] == "AI"
+        assert detail["args"]["url"].startswith("https://fake.test/a/")
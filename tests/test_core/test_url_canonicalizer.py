@@ -0,0 +1,72 @@
+from src.channels.maeililbo.config import URL_RULES as MAEILILBO_RULES
+from src.channels.naver_news.config import URL_RULES as NAVER_RULES
+from src.shared.url_canonicalizer import (
+    canonicalize_url,
+    find_declared_url,
+    resolve_canonical_url,
+)
+
+
+class TestCanonicalizeUrl:
+    """canonicalize_url 함수 테스트"""
+
+    def test_default_rules(self):
+        """scheme/호스트 소문자화, 기본 포트·fragment·추적 파라미터 제거, 파라미터 정렬"""
+        url = "HTTPS://News.Example.COM:443/a/1?b=2&utm_source=x&a=1&fbclid=y#top"
+        assert canonicalize_url(url) == "https://news.example.com/a/1?a=1&b=2"
+
+    def test_relative_url_with_base(self):
+        assert canonicalize_url("/a/1", base="https://news.example.com") == (
+            "https://news.example.com/a/1"
+        )
+
+    def test_non_http_url_unchanged(self):
+        assert canonicalize_url("javascript:void(0)") == "javascript:void(0)"
+
+    def test_naver_mobile_and_section_param(self):
+        """네이버 모바일 주소, http, 분야 파라미터가 달라도 같은 기사는 같은 URL"""
+        variants = [
+            "https://n.news.naver.com/mnews/article/001/0014512345?sid=101",
+            "http://m.news.naver.com/article/001/0014512345",
+            "https://n.news.naver.com/article/001/0014512345/",
+        ]
+        canonical = {canonicalize_url(url, NAVER_RULES) for url in variants}
+        assert canonical == {"https://n.news.naver.com/mnews/article/001/0014512345"}
+
+    def test_keep_params_only(self):
+        """keep_params에 없는 파라미터는 모두 지운다"""
+        url = "http://m-i.kr/news/articleView.html?idxno=100001&sc_word=AI"
+        assert canonicalize_url(url, MAEILILBO_RULES) == (
+            "https://www.m-i.kr/news/articleView.html?idxno=100001"
+        )
+
+
+class TestDeclaredUrl:
+    """find_declared_url, resolve_canonical_url 함수 테스트"""
+
+    def test_canonical_preferred_over_og_url(self):
+        html = (
+            '<head><meta content="https://a.test/og" property="og:url">'
+            "<link href='https://a.test/canonical' rel='canonical'></head>"
+        )
+        assert find_declared_url(html) == "https://a.test/canonical"
+
+    def test_og_url_fallback(self):
+        html = '<head><meta property="og:url" content="https://a.test/og"></head>'
+        assert find_declared_url(html) == "https://a.test/og"
+
+    def test_ignores_tags_after_head(self):
+        html = '<head></head><body><link rel="canonical" href="https://a.test/x"></body>'
+        assert find_declared_url(html) is None
+
+    def test_resolve_follows_same_host(self):
+        html = '<head><link rel="canonical" href="/a/1?utm_medium=rss"></head>'
+        page_url = "https://a.test/a/1?from=list"
+        assert resolve_canonical_url(page_url, html) == "https://a.test/a/1"
+
+    def test_resolve_ignores_root_and_other_host(self):
+        """홈페이지나 다른 호스트를 대표 URL로 선언하면 따르지 않는다"""
+        home = '<head><link rel="canonical" href="https://a.test/"></head>'
+        other = '<head><link rel="canonical" href="https://b.test/a/1"></head>'
+        assert resolve_canonical_url("https://a.test/a/1", home) == "https://a.test/a/1"
+        assert resolve_canonical_url("https://a.test/a/1", other) == "https://a.test/a/1"
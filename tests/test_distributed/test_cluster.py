@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from src.core.exceptions import FetchError
+from src.core.models import SearchResult
+from src.distributed.coordinator import Coordinator
+from src.distributed.frontier import FrontierTask
+from src.distributed.sqlite_frontier import SqliteFrontier
+from src.distributed.worker import FrontierWorker
+
+
+class TestCoordinatorWorker:
+    """코디네이터-워커 통합 테스트 (SQLite frontier, FakeCrawler)"""
+
+    async def test_workers_share_frontier(self, settings, patched_registry, tmp_path):
+        """여러 워커가 작업을 나눠 처리하고 코디네이터가 결과를 모은다"""
+        settings = settings.model_copy(
+            update={"host_request_interval": 0.0, "frontier_poll_interval": 0.01}
+        )
+        db_path = str(tmp_path / "frontier.db")
+        coordinator_frontier = SqliteFrontier(db_path)
+        worker_frontiers = [SqliteFrontier(db_path) for _ in range(2)]
+
+        coordinator = Coordinator(coordinator_frontier, settings)
+        await coordinator.seed(["AI"], ["fake"], run_id="r1")
+        workers = [
+            FrontierWorker(frontier, settings, worker_id=f"w{i}")
+            for i, frontier in enumerate(worker_frontiers)
+        ]
+
+        results, *_ = await asyncio.gather(
+            coordinator.run(["AI"], ["fake"], run_id="r1"),
+            *(worker.run() for worker in workers),
+        )
+
+        assert len(results[0].articles) == 1
+        assert len(results[0].errors) == 1
+        # 검색 1 + 기사 1 + 없는 기사 3회 시도, 재등록된 검색 작업은 중복으로 무시된다
+        assert len(patched_registry.fetched) == 5
+        for frontier in (coordinator_frontier, *worker_frontiers):
+            await frontier.close()
+
+    async def test_reseed_starts_new_run(self, settings, tmp_path, caplog):
+        """같은 키워드로 다시 등록하면 새 실행으로 등록되고, 같은 실행이면 경고한다"""
+        frontier = SqliteFrontier(str(tmp_path / "frontier.db"))
+        coordinator = Coordinator(frontier, settings)
+
+        first = await coordinator.seed(["AI"], ["fake"], max_pages=2)
+        assert await coordinator.seed(["AI"], ["fake"], max_pages=2) == first == 2
+
+        with caplog.at_level(logging.WARNING):
+            assert await coordinator.seed(["AI"], ["fake"], max_pages=2, run_id="r1") == 2
+            assert await coordinator.seed(["AI"], ["fake"], max_pages=2, run_id="r1") == 0
+        assert "등록된 작업이 없습니다" in caplog.text
+        await frontier.close()
+
+    async def test_worker_skips_detail_page_with_listing_fields(
+        self, settings, patched_registry, tmp_path
+    ):
+        """목록의 발행일이 작업에 남아 listing_fields를 만족하면 상세 페이지를 요청하지 않는다"""
+        settings = settings.model_copy(
+            update={"listing_fields": ["published_at"], "host_request_interval": 0.0}
+        )
+        frontier = SqliteFrontier(str(tmp_path / "frontier.db"))
+        sr = SearchResult(title="기사", url="https://a.test/1", published_at=datetime(2026, 2, 10))
+        await frontier.push([FrontierTask.detail("fake", "AI", sr, "r1")])
+
+        worker = FrontierWorker(frontier, settings)
+        assert await worker.run() == 1
+
+        (event,) = await frontier.pop_results()
+        assert event["article"]["published_at"].startswith("2026-02-10")
+        assert patched_registry.fetched == []
+        await frontier.close()
+
+    async def test_retry_attempts_reserve_host_slot(self, settings, patched_registry, tmp_path):
+        """재시도 래퍼 안에서 다시 보내는 요청도 시도마다 호스트 슬롯을 예약한다"""
+        settings = settings.model_copy(
+            update={
+                "host_request_interval": 0.0,
+                "fetch_retry_base_delay": 0.0,
+                "fetch_retry_jitter": 0.0,
+            }
+        )
+        search_url = "https://fake.test/search?q=AI&page=1"
+        fetch = patched_registry.fetch
+
+        async def fail_first_search(url: str, wait_selector: str | None = None) -> str:
+            if url == search_url and search_url not in patched_registry.fetched:
+                patched_registry.fetched.append(url)
+                raise FetchError("HTTP 503", status_code=503)
+            return await fetch(url, wait_selector)
+
+        patched_registry.fetch = fail_first_search
+        frontier = SqliteFrontier(str(tmp_path / "frontier.db"))
+        await frontier.push([FrontierTask.search("fake", "AI", 1, "r1")])
+        reserved: list[str] = []
+        reserve_host = frontier.reserve_host
+
+        async def record_reserve(host: str, interval: float) -> float:
+            reserved.append(host)
+            return await reserve_host(host, interval)
+
+        frontier.reserve_host = record_reserve
+
+        await FrontierWorker(frontier, settings).run()
+
+        assert patched_registry.fetched.count(search_url) == 2
+        assert len(reserved) == len(patched_registry.fetched)
+        await frontier.close()
+
+    async def test_crawler_creation_failure_fails_task(
+        self, settings, patched_registry, tmp_path, monkeypatch
+    ):
+        """크롤러를 만들지 못한 채널의 작업은 실패로 기록되고 다른 채널 작업은 계속된다"""
+        from src.pipeline import orchestrator as orchestrator_module
+
+        create_crawler = orchestrator_module.create_crawler
+
+        async def flaky_create_crawler(channel, *args, **kwargs):
+            if channel == "broken":
+                raise RuntimeError("브라우저 시작 실패")
+            return await create_crawler(channel, *args, **kwargs)
+
+        monkeypatch.setattr(orchestrator_module, "create_crawler", flaky_create_crawler)
+        settings = settings.model_copy(update={"host_request_interval": 0.0})
+        frontier = SqliteFrontier(str(tmp_path / "frontier.db"))
+        await frontier.push(
+            [
+                FrontierTask.search("broken", "AI", 1, "r1"),
+                FrontierTask.search("fake", "AI", 1, "r1"),
+            ]
+        )
+
+        # 검색 1 + 기사 1 (없는 기사와 broken 채널은 실패)
+        assert await FrontierWorker(frontier, settings).run() == 2
+
+        errors = [e["error"] for e in await frontier.pop_results() if e.get("error")]
+        assert any("브라우저 시작 실패" in e for e in errors)
+        await frontier.close()
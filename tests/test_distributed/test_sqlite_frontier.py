@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import pytest
+
+from src.core.models import SearchResult
+from src.distributed.frontier import FrontierTask
+from src.distributed.sqlite_frontier import SqliteFrontier
+from src.pipeline.scheduler import WorkKind
+
+
+@pytest.fixture
+async def frontier(tmp_path):
+    backend = SqliteFrontier(str(tmp_path / "frontier.db"))
+    yield backend
+    await backend.close()
+
+
+def _detail(url: str, keyword: str = "금리", run_id: str = "r1") -> FrontierTask:
+    return FrontierTask.detail("mk", keyword, SearchResult(title="기사", url=url), run_id)
+
+
+class TestSqliteFrontier:
+    """SqliteFrontier 테스트"""
+
+    async def test_dedups_detail_urls(self, frontier):
+        """같은 기사 URL은 한 번만 등록된다"""
+        assert await frontier.push([_detail("https://a.test/1"), _detail("https://a.test/1")]) == 1
+        assert await frontier.push([_detail("https://a.test/1")]) == 0
+
+    async def test_dedup_scoped_to_run_and_keyword(self, frontier):
+        """다른 실행이나 다른 키워드의 같은 기사 URL은 따로 등록된다"""
+        await frontier.push([_detail("https://a.test/1")])
+
+        assert await frontier.push([_detail("https://a.test/1", keyword="환율")]) == 1
+        assert await frontier.push([_detail("https://a.test/1", run_id="r2")]) == 1
+        assert await frontier.push([FrontierTask.search("mk", "금리", 1, "r2")]) == 1
+
+    async def test_detail_tasks_leased_first(self, frontier):
+        """기사 작업이 검색 작업보다 먼저 임대된다"""
+        await frontier.push([FrontierTask.search("mk", "금리", 1), _detail("https://a.test/1")])
+
+        task = await frontier.lease("w1", 60)
+
+        assert task.kind is WorkKind.DETAIL
+        assert task.search_result.url == "https://a.test/1"
+        assert task.attempts == 1
+
+    async def test_published_at_round_trip(self, frontier):
+        published_at = datetime(2026, 2, 10, 9, 30)
+        sr = SearchResult(title="기사", url="https://a.test/1", published_at=published_at)
+        await frontier.push([FrontierTask.detail("mk", "금리", sr, "r1")])
+
+        task = await frontier.lease("w1", 60)
+
+        assert task.search_result == sr
+
+    async def test_expired_lease_is_released(self, frontier):
+        """임대가 만료된 작업은 다른 워커가 가져가고, 원래 워커의 완료는 무시된다"""
+        await frontier.push([_detail("https://a.test/1")])
+        stale = await frontier.lease("w1", -1)
+
+        task = await frontier.lease("w2", 60)
+
+        assert task.id == stale.id
+        assert task.attempts == 2
+        assert not await frontier.complete(stale, "w1", [{"type": "error"}], [])
+        assert await frontier.complete(task, "w2", [], [_detail("https://a.test/2")])
+        stats = await frontier.stats()
+        assert (stats.pending, stats.done, stats.results) == (1, 1, 0)
+
+    async def test_fail_retries_then_records_error(self, frontier):
+        """시도 횟수가 남으면 재시도하고, 모두 쓰면 에러 이벤트를 남긴다"""
+        await frontier.push([_detail("https://a.test/1")])
+
+        assert await frontier.fail(await frontier.lease("w1", 60), "w1", "실패", max_attempts=2)
+        assert not await frontier.fail(await frontier.lease("w1", 60), "w1", "실패", max_attempts=2)
+
+        assert (await frontier.stats()).drained
+        assert await frontier.pop_results() == [
+            {"channel": "mk", "keyword": "금리", "type": "error", "error": "실패"}
+        ]
+
+    async def test_reserve_host_spaces_requests(self, frontier):
+        """같은 호스트의 요청 슬롯은 interval 간격으로 예약된다"""
+        first = await frontier.reserve_host("a.test", 10)
+        second = await frontier.reserve_host("a.test", 10)
+        other = await frontier.reserve_host("b.test", 10)
+
+        assert first == 0
+        assert 9 < second <= 10
+        assert other == 0
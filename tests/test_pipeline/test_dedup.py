@@ -0,0 +1,140 @@
+from src.core.models import Article
+from src.pipeline.dedup import DedupMode, DedupStage, NearDuplicateIndex, simhash
+from src.pipeline.orchestrator import CrawlOrchestrator
+
+WIRE_STORY = (
+    "정부가 반도체 산업 경쟁력 강화를 위해 내년까지 총 26조원 규모의 지원 방안을 발표했다. "
+    "기획재정부는 이날 비상경제장관회의를 열고 설비 투자 세액 공제를 확대하고 "
+    "용인 반도체 클러스터의 전력과 용수 기반 시설을 조기에 구축하겠다고 밝혔다. "
+    "업계는 이번 대책이 글로벌 보조금 경쟁에 대응하는 데 도움이 될 것으로 기대했다. "
+    "정부는 연구개발 인력 양성을 위해 대학과 기업이 함께 운영하는 계약학과를 늘리고 "
+    "소재와 부품, 장비 기업의 기술 개발 과제에 정책 금융을 우선 배정하기로 했다. "
+    "시스템 반도체 설계 기업을 위한 시제품 제작 지원도 두 배로 확대된다. "
+    "다만 야당은 대기업에 혜택이 집중된다며 중소 협력사 지원을 보완해야 한다고 지적했다. "
+    "정부는 다음 달 국회에 관련 법 개정안을 제출하고 하반기부터 시행할 계획이다."
+)
+OTHER_STORY = (
+    "서울 아파트 매매 가격이 여섯 주 연속 상승하면서 전세 시장에도 불안감이 커지고 있다. "
+    "한국부동산원에 따르면 이번 주 서울 아파트값은 지난주보다 소폭 올랐고 "
+    "강남과 서초 등 주요 지역의 상승 폭이 컸다. 전문가들은 금리 인하 기대감이 "
+    "매수 심리를 자극한 것으로 분석했다."
+)
+
+
+def _article(url: str, content: str) -> Article:
+    return Article(title="제목", url=url, content=content, channel="fake", keyword="AI")
+
+
+class TestNearDuplicateIndex:
+    """NearDuplicateIndex 테스트"""
+
+    def test_wire_copies_share_cluster(self):
+        """기자 서명과 문장 부호만 다른 전재 기사는 첫 기사의 군집으로 묶인다"""
+        index = NearDuplicateIndex()
+        first, first_dup = index.add(WIRE_STORY)
+        copy = "[연합뉴스] " + WIRE_STORY.replace(".", "!") + "\n홍길동 기자 hong@yna.co.kr"
+
+        cluster, duplicate = index.add(copy)
+
+        assert not first_dup
+        assert duplicate
+        assert cluster == first
+
+    def test_distinct_stories_get_own_clusters(self):
+        """내용이 다른 기사는 중복으로 보지 않는다"""
+        index = NearDuplicateIndex()
+        first, _ = index.add(WIRE_STORY)
+
+        cluster, duplicate = index.add(OTHER_STORY)
+
+        assert not duplicate
+        assert cluster != first
+        assert (simhash(WIRE_STORY) ^ simhash(OTHER_STORY)).bit_count() > 3
+
+    def test_short_text_is_not_indexed(self):
+        """정규화한 본문이 min_chars보다 짧으면 중복 판정하지 않는다"""
+        index = NearDuplicateIndex()
+
+        assert not index.add("짧은 본문")[1]
+        assert not index.add("짧은 본문")[1]
+        assert len(index) == 0
+
+    def test_candidate_scan_is_capped(self):
+        """버킷당 최근 max_candidates건까지만 비교한다"""
+        index = NearDuplicateIndex(max_candidates=1)
+        index.add(WIRE_STORY)
+        index.add(OTHER_STORY)
+
+        assert index.add(WIRE_STORY)[1]
+
+
+class TestDedupStage:
+    """DedupStage 테스트"""
+
+    def test_annotate_keeps_duplicates(self):
+        """ANNOTATE 모드는 군집 id만 표시하고 모두 내보낸다"""
+        stage = DedupStage(DedupMode.ANNOTATE)
+        first = _article("https://a.test/1", WIRE_STORY)
+        copy = _article("https://b.test/1", WIRE_STORY + " 끝.")
+
+        assert stage.process(first)
+        assert stage.process(copy)
+        assert copy.metadata["cluster_id"] == first.metadata["cluster_id"]
+        assert len(first.metadata["cluster_id"]) == 16
+        assert copy.metadata["near_duplicate"] is True
+        assert first.metadata["near_duplicate"] is False
+
+    def test_drop_filters_duplicates(self):
+        """DROP 모드는 먼저 나온 기사와 거의 같은 기사를 제외한다"""
+        stage = DedupStage(DedupMode.DROP)
+
+        assert stage.process(_article("https://a.test/1", WIRE_STORY))
+        assert not stage.process(_article("https://b.test/1", WIRE_STORY))
+        assert stage.dropped == 1
+
+    def test_same_url_for_another_keyword_kept(self):
+        """여러 키워드에 걸린 같은 기사는 키워드마다 내보내고 한 번만 색인한다"""
+        stage = DedupStage(DedupMode.DROP)
+        first = _article("https://a.test/1", WIRE_STORY)
+        again = first.model_copy(deep=True)
+        again.keyword = "반도체"
+
+        assert stage.process(first)
+        assert stage.process(again)
+        assert again.metadata == first.metadata
+        assert len(stage.index) == 1
+        assert not stage.process(_article("https://b.test/1", WIRE_STORY))
+
+
+async def test_orchestrator_drops_near_duplicates(settings, patched_registry):
+    """dedup_mode가 drop이면 run_iter는 근접 중복 기사를 내보내지 않는다"""
+    patched_registry.pages = {
+        "https://fake.test/search?q=AI&page=1": (
+            "https://fake.test/a/1|원문\n"
+            "https://fake.test/a/2|전재\n"
+            "https://fake.test/a/3|다른 기사"
+        ),
+        "https://fake.test/a/1": WIRE_STORY,
+        "https://fake.test/a/2": WIRE_STORY + "\n무단 전재 및 재배포 금지",
+        "https://fake.test/a/3": OTHER_STORY,
+    }
+    settings = settings.model_copy(update={"dedup_mode": "drop", "max_workers": 1})
+
+    events = [e async for e in CrawlOrchestrator(settings).run_iter(["AI"], ["fake"])]
+
+    urls = sorted(e.article.url for e in events if e.article)
+    assert urls == ["https://fake.test/a/1", "https://fake.test/a/3"]
+
+
+async def test_orchestrator_keeps_shared_article_per_keyword(settings, patched_registry):
+    """drop 모드에서도 두 키워드에 걸린 같은 기사는 키워드마다 내보낸다"""
+    patched_registry.pages = {
+        "https://fake.test/search?q=AI&page=1": "https://fake.test/a/1|원문",
+        "https://fake.test/search?q=ML&page=1": "https://fake.test/a/1|원문",
+        "https://fake.test/a/1": WIRE_STORY,
+    }
+    settings = settings.model_copy(update={"dedup_mode": "drop"})
+
+    events = [e async for e in CrawlOrchestrator(settings).run_iter(["AI", "ML"], ["fake"])]
+
+    assert sorted(e.keyword for e in events if e.article) == ["AI", "ML"]
@@ -0,0 +1,83 @@
+import pytest
+
+from src.core.models import Article
+from src.pipeline.fingerprint_store import ChangeDetector, ChangeKind, FingerprintStore
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.shared.text_cleaner import content_fingerprint
+
+
+def _article(url: str, content: str) -> Article:
+    return Article(
+        title="제목",
+        url=url,
+        content=content,
+        channel="fake",
+        keyword="AI",
+        content_hash=content_fingerprint("제목", content),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with FingerprintStore(str(tmp_path / "fingerprints.db")) as s:
+        yield s
+
+
+class TestFingerprintStore:
+    """FingerprintStore 테스트"""
+
+    def test_classify_new_unchanged_updated(self, store):
+        """저장된 지문과 비교해 새 기사, 그대로인 기사, 바뀐 기사를 구분한다"""
+        article = _article("https://fake.test/a/1", "첫 보도")
+        assert store.classify(article) is ChangeKind.NEW
+
+        store.record([article])
+
+        assert store.classify(article) is ChangeKind.UNCHANGED
+        assert store.classify(_article(article.url, "정정 보도")) is ChangeKind.UPDATED
+
+    def test_change_count_and_volatility(self, store):
+        """지문이 바뀔 때만 변경 횟수가 늘어난다"""
+        url = "https://fake.test/a/1"
+        store.record([_article(url, "1보")])
+        store.record([_article(url, "1보")])
+        store.record([_article(url, "2보")])
+        store.record([_article(url, "3보")])
+        store.record([_article("https://fake.test/a/2", "그대로")])
+
+        assert store.change_count(url) == 2
+        assert store.most_volatile() == [(url, 2)]
+
+    def test_detector_records_only_on_commit(self, store):
+        """commit 전에는 지문을 저장하지 않는다"""
+        detector = ChangeDetector(store)
+        article = _article("https://fake.test/a/1", "본문")
+
+        assert detector.process(article)
+        assert article.metadata["updated"] is False
+        assert store.get(article.url) is None
+
+        detector.commit()
+        assert store.get(article.url) == article.content_hash
+
+
+async def test_recrawl_emits_only_changed_articles(settings, patched_registry, tmp_path):
+    """재수집 시 본문이 바뀐 기사만 updated로 표시해 내보낸다"""
+    patched_registry.pages = {
+        "https://fake.test/search?q=AI&page=1": (
+            "https://fake.test/a/1|속보\nhttps://fake.test/a/2|해설"
+        ),
+        "https://fake.test/a/1": "사망자 3명",
+        "https://fake.test/a/2": "해설 본문",
+    }
+    settings = settings.model_copy(update={"fingerprint_db": str(tmp_path / "fp.db")})
+
+    first = [e async for e in CrawlOrchestrator(settings).run_iter(["AI"], ["fake"])]
+    patched_registry.pages["https://fake.test/a/1"] = "사망자 5명"
+    second = [e async for e in CrawlOrchestrator(settings).run_iter(["AI"], ["fake"])]
+
+    assert len(first) == 2
+    assert all(e.article.metadata["updated"] is False for e in first)
+    assert [(e.article.url, e.article.metadata["updated"]) for e in second] == [
+        ("https://fake.test/a/1", True)
+    ]
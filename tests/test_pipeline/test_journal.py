@@ -0,0 +1,199 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.models import Article, CrawlEvent, SearchResult
+from src.pipeline.journal import RunJournal
+from src.pipeline.orchestrator import CrawlOrchestrator
+
+
+def _event(url: str) -> CrawlEvent:
+    article = Article(title="기사", url=url, content="본문", channel="fake", keyword="AI")
+    return CrawlEvent("fake", "AI", article=article)
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return str(tmp_path / "journal")
+
+
+class TestRunJournal:
+    """RunJournal 테스트"""
+
+    def test_load_restores_progress(self, journal_dir):
+        """기록된 검색 페이지와 기사로 진행 상태를 복원한다"""
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 2, run_id="r1")
+        journal.record_search(
+            "fake",
+            "AI",
+            1,
+            [
+                SearchResult("첫 기사", "https://fake.test/a/1"),
+                SearchResult("둘", "https://fake.test/a/2"),
+            ],
+        )
+        journal.record_article(_event("https://fake.test/a/1"))
+        journal.close()
+
+        state = RunJournal.load(journal_dir, "r1").state
+
+        assert (state.keywords, state.channels, state.max_pages) == (["AI"], ["fake"], 2)
+        assert [sr.url for sr in state.pending_details("fake", "AI", 1)] == [
+            "https://fake.test/a/2"
+        ]
+        assert [e.article.url for e in state.articles] == ["https://fake.test/a/1"]
+
+    def test_errors_restored_and_not_pending(self, journal_dir):
+        """실패한 검색 페이지와 기사 URL은 완료로 보고 에러 이벤트를 복원한다"""
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 2, run_id="r1")
+        journal.record_search(
+            "fake",
+            "AI",
+            1,
+            [
+                SearchResult("첫", "https://fake.test/a/1"),
+                SearchResult("둘", "https://fake.test/a/2"),
+            ],
+        )
+        journal.record_error(
+            "fake", "AI", [CrawlEvent("fake", "AI", error="기사 실패")], url="https://fake.test/a/1"
+        )
+        journal.record_error("fake", "AI", [CrawlEvent("fake", "AI", error="검색 실패")], page=2)
+        journal.close()
+
+        resumed = RunJournal.load(journal_dir, "r1")
+        state = resumed.state
+
+        assert [sr.url for sr in state.pending_details("fake", "AI", 1)] == [
+            "https://fake.test/a/2"
+        ]
+        assert resumed.is_search_done("fake", "AI", 2)
+        assert [e.error for e in state.errors] == ["기사 실패", "검색 실패"]
+
+    def test_shared_article_pending_per_keyword(self, journal_dir):
+        """한 키워드에서 수집한 기사도 다른 키워드에서는 아직 수집하지 않은 기사로 남는다"""
+        journal = RunJournal.create(journal_dir, ["AI", "ML"], ["fake"], 1, run_id="r1")
+        shared = [SearchResult("공유", "https://fake.test/a/1")]
+        journal.record_search("fake", "AI", 1, shared)
+        journal.record_search("fake", "ML", 1, shared)
+        journal.record_search("fake", "AI OR ML", 1, shared)
+        journal.record_article(_event("https://fake.test/a/1"))
+        journal.close()
+
+        state = RunJournal.load(journal_dir, "r1").state
+
+        assert state.pending_details("fake", "AI", 1) == []
+        assert state.pending_details("fake", "ML", 1) == shared
+        assert state.pending_details("fake", "AI OR ML", 1, ("AI", "ML")) == []
+
+    def test_listing_fields_round_trip(self, journal_dir):
+        """검색 결과의 요약과 목록 발행일을 복원한다 (발행일 없는 이전 기록도 읽는다)"""
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+        sr = SearchResult("기사", "https://fake.test/a/1", "요약", datetime(2024, 1, 15, 9, 30))
+        journal.record_search("fake", "AI", 1, [sr])
+        journal._append(
+            {
+                "type": "search",
+                "channel": "fake",
+                "keyword": "AI",
+                "page": 2,
+                "results": [["이전", "https://fake.test/a/2", ""]],
+            }
+        )
+        journal.close()
+
+        state = RunJournal.load(journal_dir, "r1").state
+
+        assert state.pending_details("fake", "AI", 1) == [sr]
+        assert state.pending_details("fake", "AI", 2)[0].published_at is None
+
+    def test_load_drops_torn_tail(self, journal_dir):
+        """기록 도중 잘린 마지막 줄은 버리고 이어서 기록할 수 있다"""
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+        journal.record_article(_event("https://fake.test/a/1"))
+        journal.close()
+        with journal.path.open("a", encoding="utf-8") as f:
+            f.write('{"type": "article", "ev')
+
+        resumed = RunJournal.load(journal_dir, "r1")
+        resumed.record_article(_event("https://fake.test/a/2"))
+        resumed.close()
+
+        assert len(RunJournal.load(journal_dir, "r1").state.articles) == 2
+
+    def test_duplicate_run_id_rejected(self, journal_dir):
+        """이미 있는 실행 ID로는 새 journal을 만들 수 없다"""
+        RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1").close()
+
+        with pytest.raises(FileExistsError):
+            RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+
+    def test_finish_compacts_journal(self, journal_dir, tmp_path):
+        """완료 시 journal은 시작·완료 기록만 남긴다"""
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+        journal.record_article(_event("https://fake.test/a/1"))
+
+        journal.finish(tmp_path / "crawl_r1.json")
+
+        lines = [json.loads(line) for line in journal.path.read_text().splitlines()]
+        assert [line["type"] for line in lines] == ["start", "finish"]
+        state = RunJournal.load(journal_dir, "r1").state
+        assert state.finished
+        assert state.output_path.endswith("crawl_r1.json")
+
+
+class TestOrchestratorResume:
+    """journal을 사용한 오케스트레이터 재개 테스트"""
+
+    async def test_resume_skips_completed_work(self, settings, patched_registry, journal_dir):
+        """재개하면 완료된 작업은 건너뛰고 이전 기사를 포함한 결과를 반환한다"""
+        urls = [f"https://fake.test/a/{i}" for i in range(3)]
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI&page=1": "\n".join(f"{u}|기사" for u in urls),
+            **{u: "본문" for u in urls},
+        }
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+        # 검색 페이지와 기사 1건까지 처리한 뒤 중단된 상황
+        journal.record_search("fake", "AI", 1, [SearchResult("기사", u) for u in urls])
+        journal.record_article(_event(urls[0]))
+        journal.close()
+
+        resumed = RunJournal.load(journal_dir, "r1")
+        results = await CrawlOrchestrator(settings).run(["AI"], ["fake"], journal=resumed)
+
+        assert patched_registry.fetched == urls[1:]
+        assert sorted(a.url for a in results[0].articles) == urls
+
+    async def test_resume_replays_errors(self, settings, patched_registry, journal_dir):
+        """재개하면 실패한 기사는 다시 요청하지 않고 기록된 에러를 결과에 남긴다"""
+        urls = [f"https://fake.test/a/{i}" for i in range(2)]
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI&page=1": "\n".join(f"{u}|기사" for u in urls),
+            urls[1]: "본문",
+        }
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+        journal.record_search("fake", "AI", 1, [SearchResult("기사", u) for u in urls])
+        journal.record_error("fake", "AI", [CrawlEvent("fake", "AI", error="실패")], url=urls[0])
+        journal.close()
+
+        resumed = RunJournal.load(journal_dir, "r1")
+        results = await CrawlOrchestrator(settings).run(["AI"], ["fake"], journal=resumed)
+
+        assert patched_registry.fetched == urls[1:]
+        assert results[0].errors == ["실패"]
+        assert [a.url for a in results[0].articles] == urls[1:]
+
+    async def test_errors_recorded_during_run(self, settings, patched_registry, journal_dir):
+        """실행 중 실패한 작업은 journal에 에러로 기록된다"""
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI&page=1": "https://fake.test/x|없음"
+        }
+        journal = RunJournal.create(journal_dir, ["AI"], ["fake"], 1, run_id="r1")
+
+        await CrawlOrchestrator(settings).run(["AI"], ["fake"], journal=journal)
+        journal.close()
+
+        state = RunJournal.load(journal_dir, "r1").state
+        assert len(state.errors) == 1
+        assert state.pending_details("fake", "AI", 1) == []
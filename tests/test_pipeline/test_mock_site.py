@@ -0,0 +1,71 @@
+import importlib
+
+import pytest
+
+from benchmarks.mock_site import MockNewsSite, MockSiteConfig, MockSiteFetchStrategy, route
+from src.pipeline.channel_registry import CHANNEL_MAP
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.shared.http_client import HttpClient
+from tests.conftest import FakeFetchStrategy
+
+
+@pytest.fixture
+async def mock_site():
+    site = MockNewsSite(MockSiteConfig(latency=0.0, page_bytes=20_000, items_per_page=3))
+    server = await site.start()
+    site.base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    async with server:
+        yield site
+
+
+class TestMockSite:
+    """부하 테스트용 mock 뉴스 사이트 테스트"""
+
+    @pytest.mark.parametrize("channel", list(CHANNEL_MAP))
+    def test_search_urls_route_to_search_pages(self, channel, settings):
+        """각 채널 크롤러의 검색 URL은 해당 채널의 검색 결과 페이지로 연결된다"""
+        module_path, class_name, _ = CHANNEL_MAP[channel]
+        crawler = getattr(importlib.import_module(module_path), class_name)(None, settings)
+        strategy = MockSiteFetchStrategy(FakeFetchStrategy({}), "http://mock", [])
+
+        path = strategy.rewrite(crawler.build_search_url("AI", 2)).removeprefix("http://mock")
+
+        assert route(path.split("?", 1)[0]) == (channel, "search")
+
+    async def test_orchestrator_crawls_static_channels(self, settings, mock_site):
+        """오케스트레이터가 네트워크 대신 mock 사이트에서 검색/기사 페이지를 가져온다"""
+        latencies: list[float] = []
+        orchestrator = CrawlOrchestrator(
+            settings,
+            strategy_wrapper=lambda s: MockSiteFetchStrategy(s, mock_site.base_url, latencies),
+        )
+
+        results = await orchestrator.run(["AI"], ["naver_news", "maeililbo"])
+
+        assert [len(r.articles) for r in results] == [3, 3]
+        assert not any(r.errors for r in results)
+        assert len(latencies) == mock_site.requests == 8
+
+    async def test_http_client_warm_up_keeps_connections(self, mock_site):
+        """연결 미리 열기는 호스트마다 HEAD 요청으로 연결을 열고, 이후 GET이 그 연결을 쓴다"""
+        url = f"{mock_site.base_url}/www.m-i.kr/news/articleView.html?idxno=1"
+        async with HttpClient("ua") as client:
+            await client.warm_up([url, f"{mock_site.base_url}/www.mk.co.kr/"], connections=2)
+            html = await client.get(url)
+
+        assert mock_site.head_requests == 2
+        assert mock_site.requests == 1
+        assert "<html" in html
+
+    async def test_error_rate_returns_503(self, settings, mock_site):
+        """에러 비율만큼 503(Retry-After 포함)으로 응답한다"""
+        mock_site.config.error_rate = 1.0
+        settings = settings.model_copy(update={"fetch_max_retries": 0})
+        orchestrator = CrawlOrchestrator(
+            settings, strategy_wrapper=lambda s: MockSiteFetchStrategy(s, mock_site.base_url, [])
+        )
+
+        results = await orchestrator.run(["AI"], ["naver_news"])
+
+        assert not results[0].articles
+        assert "정적 페이지 가져오기 실패" in results[0].errors[0]
@@ -0,0 +1,340 @@
+import asyncio
+from contextlib import aclosing
+
+from src.core.exceptions import CircuitOpenError, FetchError
+from src.core.metrics import BATCHED_SEARCH_SAVED, TIME_TO_FIRST_ARTICLE
+from src.pipeline.orchestrator import CrawlOrchestrator
+from tests.conftest import FakeCrawler, FakeFetchStrategy
+
+
+def _fail_once(strategy: FakeFetchStrategy, url: str, status: int) -> None:
+    """`url`의 첫 요청만 HTTP `status`로 실패시킨다."""
+    original_fetch = strategy.fetch
+    failures = {url: 1}
+
+    async def fetch(url: str, wait_selector: str | None = None) -> str:
+        if failures.get(url, 0) > 0:
+            failures[url] -= 1
+            strategy.fetched.append(url)
+            raise FetchError(f"HTTP {status}", status_code=status)
+        return await original_fetch(url, wait_selector)
+
+    strategy.fetch = fetch
+
+
+class TestCrawlOrchestrator:
+    """CrawlOrchestrator 테스트"""
+
+    async def test_run_iter_streams_events(self, settings, patched_registry):
+        """run_iter는 채널-키워드 조합의 이벤트를 모두 전달한다"""
+        orchestrator = CrawlOrchestrator(settings)
+
+        events = [e async for e in orchestrator.run_iter(["AI"], ["fake"])]
+
+        assert len(events) == 2
+        assert sum(e.article is not None for e in events) == 1
+
+    async def test_run_groups_results(self, settings, patched_registry):
+        """run은 채널-키워드 조합 순서대로 CrawlResult를 반환한다"""
+        orchestrator = CrawlOrchestrator(settings)
+
+        results = await orchestrator.run(["AI", "반도체"], ["fake"])
+
+        assert [(r.channel, r.keyword) for r in results] == [("fake", "AI"), ("fake", "반도체")]
+        assert len(results[0].articles) == 1
+        assert len(results[1].errors) == 1
+
+    async def test_listing_only_skips_detail_pages(self, settings, patched_registry):
+        """listing_only면 검색 페이지만 요청하고 목록 항목을 기사로 내보낸다"""
+        settings = settings.model_copy(update={"listing_only": True})
+        orchestrator = CrawlOrchestrator(settings)
+
+        events = [e async for e in orchestrator.run_iter(["AI"], ["fake"])]
+
+        assert [e.article.url for e in events] == [
+            "https://fake.test/a/1",
+            "https://fake.test/a/missing",
+        ]
+        assert all(e.article.metadata["listing_only"] for e in events)
+        assert patched_registry.fetched == ["https://fake.test/search?q=AI&page=1"]
+
+    async def test_search_fan_out_stops_at_available_pages(
+        self, settings, patched_registry, monkeypatch
+    ):
+        """1페이지에서 알아낸 페이지 수까지만 나머지 검색 페이지 작업을 넣는다"""
+        monkeypatch.setattr(FakeCrawler, "parse_total_count", lambda self, html: 3)
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI&page=1": "https://fake.test/a/1|1\nhttps://fake.test/a/2|2",
+            "https://fake.test/search?q=AI&page=2": "https://fake.test/a/3|3",
+        }
+        settings = settings.model_copy(update={"listing_only": True, "max_pages": 5})
+
+        events = [e async for e in CrawlOrchestrator(settings).run_iter(["AI"], ["fake"])]
+
+        assert sorted(e.article.url for e in events) == [
+            f"https://fake.test/a/{i}" for i in (1, 2, 3)
+        ]
+        assert sorted(patched_registry.fetched) == sorted(patched_registry.pages)
+
+    async def test_search_fan_out_without_total(self, settings, patched_registry):
+        """전체 결과 수를 모르면 max_pages까지 모두 요청한다"""
+        settings = settings.model_copy(update={"max_pages": 3})
+
+        events = [e async for e in CrawlOrchestrator(settings).run_iter(["AI"], ["fake"])]
+
+        searched = [url for url in patched_registry.fetched if "/search" in url]
+        assert len(searched) == 3
+        assert sum("검색 실패" in e.error for e in events if e.error) == 2
+
+    async def test_keyword_batch_attributes_results(self, settings, patched_registry, monkeypatch):
+        """묶음 검색 결과를 목록이나 본문에 나오는 키워드에 배정한다"""
+        monkeypatch.setattr(FakeCrawler, "keyword_or_operator", " | ")
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI | 반도체&page=1": (
+                "https://fake.test/a/1|AI 반도체 설계 경쟁\n"
+                "https://fake.test/a/2|수출 실적 발표\n"
+                "https://fake.test/a/3|관련 없는 기사"
+            ),
+            "https://fake.test/a/1": "본문",
+            "https://fake.test/a/2": "반도체 수출이 늘었다",
+            "https://fake.test/a/3": "날씨가 맑다",
+        }
+        settings = settings.model_copy(update={"keyword_batch_max_length": 20})
+        saved = BATCHED_SEARCH_SAVED.value(channel="fake")
+
+        results = await CrawlOrchestrator(settings).run(["AI", "반도체"], ["fake"])
+
+        urls = {r.keyword: [a.url for a in r.articles] for r in results}
+        assert urls["AI"] == ["https://fake.test/a/1"]
+        assert sorted(urls["반도체"]) == ["https://fake.test/a/1", "https://fake.test/a/2"]
+        assert results[1].articles[0].keyword == "반도체"
+        assert [u for u in patched_registry.fetched if "/search" in u] == [
+            "https://fake.test/search?q=AI | 반도체&page=1"
+        ]
+        assert BATCHED_SEARCH_SAVED.value(channel="fake") == saved + 1
+
+    async def test_bounded_buffer_applies_backpressure(self, settings, patched_registry):
+        """버퍼가 가득 차면 소비자가 읽을 때까지 크롤링이 진행되지 않는다"""
+        urls = [f"https://fake.test/a/{i}" for i in range(10)]
+        patched_registry.pages = {
+            "https://fake.test/search?q=AI&page=1": "\n".join(f"{u}|기사" for u in urls),
+            **{u: "본문" for u in urls},
+        }
+        settings = settings.model_copy(update={"stream_buffer_size": 1, "max_workers": 1})
+        orchestrator = CrawlOrchestrator(settings)
+
+        async with aclosing(orchestrator.run_iter(["AI"], ["fake"])) as events:
+            await anext(events)
+            await asyncio.sleep(0.05)
+            # 검색 1 + 소비된 기사 1 + 버퍼의 기사 1 + put 대기 중인 기사 1
+            assert len(patched_registry.fetched) == 4
+
+    async def test_session_reuses_clients_and_crawlers(self, settings, patched_registry):
+        """세션 안에서는 여러 번 실행해도 클라이언트와 크롤러를 재사용한다"""
+        async with CrawlOrchestrator(settings) as orchestrator:
+            http_client = orchestrator._http_client
+            await orchestrator.run(["AI"], ["fake"])
+            crawler = orchestrator._crawlers["fake"]
+            await orchestrator.run(["반도체"], ["fake"])
+
+            assert orchestrator._http_client is http_client
+            assert orchestrator._crawlers["fake"] is crawler
+
+        assert orchestrator._http_client is None
+
+    async def test_warm_up_once_per_crawler_and_reports_ttfa(
+        self, settings, patched_registry, monkeypatch
+    ):
+        """크롤러를 만들 때 한 번만 연결을 미리 준비하고, 첫 기사까지 걸린 시간을 기록한다"""
+        warmed: list[int] = []
+
+        async def warm_up(self, connections: int = 1) -> None:
+            warmed.append(connections)
+
+        monkeypatch.setattr(FakeCrawler, "warm_up", warm_up)
+        observed = TIME_TO_FIRST_ARTICLE.count(warmup="on")
+
+        async with CrawlOrchestrator(settings) as orchestrator:
+            await orchestrator.run(["AI"], ["fake"])
+            await orchestrator.run(["반도체"], ["fake"])
+
+        assert warmed == [settings.warmup_connections]
+        assert TIME_TO_FIRST_ARTICLE.count(warmup="on") == observed + 1
+
+    async def test_warm_up_disabled(self, settings, patched_registry, monkeypatch):
+        async def warm_up(self, connections: int = 1) -> None:
+            raise AssertionError("연결 미리 준비를 끄면 호출하지 않아야 합니다")
+
+        monkeypatch.setattr(FakeCrawler, "warm_up", warm_up)
+        settings = settings.model_copy(update={"warmup_connections": 0})
+        observed = TIME_TO_FIRST_ARTICLE.count(warmup="off")
+
+        await CrawlOrchestrator(settings).run(["AI"], ["fake"])
+
+        assert TIME_TO_FIRST_ARTICLE.count(warmup="off") == observed + 1
+
+    async def test_circuit_open_defers_then_gives_up(self, settings, patched_registry):
+        """circuit open이면 작업을 미뤘다가 다시 실행하고, 미룬 횟수를 넘으면 에러로 기록한다"""
+        original_fetch = patched_registry.fetch
+        open_urls = {"https://fake.test/search?q=AI&page=1": 1, "https://fake.test/a/1": 99}
+
+        async def fetch(url: str, wait_selector: str | None = None) -> str:
+            if open_urls.get(url, 0) > 0:
+                open_urls[url] -= 1
+                raise CircuitOpenError("fake.test", 0.01)
+            return await original_fetch(url, wait_selector)
+
+        patched_registry.fetch = fetch
+        settings = settings.model_copy(update={"circuit_max_deferrals": 2})
+
+        results = await CrawlOrchestrator(settings).run(["AI"], ["fake"])
+
+        errors = results[0].errors
+        assert len(errors) == 2
+        assert any("circuit open" in e for e in errors)
+
+    async def test_retryable_error_retried_by_wrapper(self, settings, patched_registry):
+        """503 응답은 오케스트레이터가 씌운 재시도 래퍼가 다시 요청해 수집한다"""
+        _fail_once(patched_registry, "https://fake.test/a/1", 503)
+        settings = settings.model_copy(
+            update={"fetch_retry_base_delay": 0.0, "fetch_retry_jitter": 0.0}
+        )
+
+        results = await CrawlOrchestrator(settings).run(["AI"], ["fake"])
+
+        assert [a.url for a in results[0].articles] == ["https://fake.test/a/1"]
+        assert len(results[0].errors) == 1  # 없는 기사(404)는 재시도하지 않는다
+        assert patched_registry.fetched.count("https://fake.test/a/1") == 2
+        assert patched_registry.fetched.count("https://fake.test/a/missing") == 1
+
+    async def test_open_circuit_defers_item(self, settings, patched_registry):
+        """실패로 circuit이 열리면 재시도 대신 작업을 미뤘다가 닫힌 뒤 수집한다"""
+        _fail_once(patched_registry, "https://fake.test/a/1", 503)
+        settings = settings.model_copy(
+            update={
+                "fetch_retry_base_delay": 0.0,
+                "fetch_retry_jitter": 0.0,
+                "circuit_min_requests": 2,
+                "circuit_error_threshold": 0.3,
+                "circuit_open_seconds": 0.05,
+            }
+        )
+
+        async with CrawlOrchestrator(settings) as orchestrator:
+            results = await orchestrator.run(["AI"], ["fake"])
+
+        assert [a.url for a in results[0].articles] == ["https://fake.test/a/1"]
+        assert not any("circuit open" in e for e in results[0].errors)
+        # 열린 circuit에서는 재시도 요청을 보내지 않으므로 실패 1회 + 닫힌 뒤 1회
+        assert patched_registry.fetched.count("https://fake.test/a/1") == 2
+
+    async def test_adaptive_limit_grows_above_channel_concurrency(
+        self, settings, patched_registry, fake_pages
+    ):
+        """적응형 제어를 켜면 호스트 상한과 동시 요청 수가 channel_concurrency 위로 오른다"""
+        urls = [f"https://fake.test/a/{i}" for i in range(60)]
+        fake_pages["https://fake.test/search?q=AI&page=1"] = "\n".join(
+            f"{url}|기사 {i}" for i, url in enumerate(urls)
+        )
+        fake_pages.update({url: "본문" for url in urls})
+        settings = settings.model_copy(
+            update={
+                "channel_concurrency": 2,
+                "adaptive_initial_limit": 2,
+                "adaptive_max_limit": 8,
+                "max_workers": 16,
+            }
+        )
+        original_fetch = patched_registry.fetch
+        active = peak = 0
+
+        async def fetch(url: str, wait_selector: str | None = None) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.005)
+                return await original_fetch(url, wait_selector)
+            finally:
+                active -= 1
+
+        patched_registry.fetch = fetch
+
+        async with CrawlOrchestrator(settings) as orchestrator:
+            results = await orchestrator.run(["AI"], ["fake"])
+            limits = orchestrator.host_limits()
+
+        assert len(results[0].articles) == 60
+        assert limits["fake.test"] > settings.channel_concurrency
+        assert peak > settings.channel_concurrency
+
+    async def test_channel_concurrency_shared_across_runs_in_session(
+        self, settings, patched_registry, fake_pages
+    ):
+        """한 세션에서 동시에 도는 실행(daemon 작업)들은 채널별 상한을 함께 지킨다"""
+        for keyword in ("AI", "반도체"):
+            urls = [f"https://fake.test/{keyword}/{i}" for i in range(8)]
+            fake_pages[f"https://fake.test/search?q={keyword}&page=1"] = "\n".join(
+                f"{url}|기사" for url in urls
+            )
+            fake_pages.update({url: "본문" for url in urls})
+        settings = settings.model_copy(
+            update={"channel_concurrency": 2, "adaptive_concurrency": False, "max_workers": 8}
+        )
+        original_fetch = patched_registry.fetch
+        active = peak = 0
+
+        async def fetch(url: str, wait_selector: str | None = None) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.005)
+                return await original_fetch(url, wait_selector)
+            finally:
+                active -= 1
+
+        patched_registry.fetch = fetch
+
+        async with CrawlOrchestrator(settings) as orchestrator:
+            results = await asyncio.gather(
+                orchestrator.run(["AI"], ["fake"]), orchestrator.run(["반도체"], ["fake"])
+            )
+
+        assert [len(r[0].articles) for r in results] == [8, 8]
+        assert peak == settings.channel_concurrency
+
+    async def test_replay_runs_channel_without_network(self, settings, tmp_path, monkeypatch):
+        """cassette 재생 중에는 동적 채널도 브라우저 없이 기록된 응답으로 크롤링한다"""
+        from benchmarks.synthetic import article_page, search_page
+        from src.channels.mk.crawler import MkCrawler
+        from src.core.cassette import CassetteEntry, CassetteWriter
+
+        search_url = MkCrawler(None, settings).build_search_url("AI", 1)
+        writer = CassetteWriter(tmp_path / "mk.cassette.jsonl.gz")
+        writer.append(CassetteEntry(search_url, 0.3, html=search_page("mk", items=2).html))
+        writer.append(
+            CassetteEntry(
+                "https://www.mk.co.kr/news/economy/11000000",
+                0.2,
+                html=article_page("mk", target_bytes=10_000).html,
+            )
+        )
+        writer.append(
+            CassetteEntry(
+                "https://www.mk.co.kr/news/economy/11000001", 0.2, error="HTTP 404", status_code=404
+            )
+        )
+        writer.close()
+
+        async def no_browser(self):
+            raise AssertionError("재생 중에는 브라우저를 띄우지 않아야 합니다")
+
+        monkeypatch.setattr(CrawlOrchestrator, "start_browser", no_browser)
+        settings = settings.model_copy(update={"replay_cassette": str(writer.path)})
+
+        results = await CrawlOrchestrator(settings).run(["AI"], ["mk"])
+
+        assert len(results[0].articles) == 1
+        assert results[0].articles[0].url == "https://www.mk.co.kr/news/economy/11000000"
+        assert len(results[0].errors) == 1
@@ -0,0 +1,142 @@
+import asyncio
+
+from src.pipeline.scheduler import ChannelSlots, WorkItem, WorkKind, WorkScheduler
+from tests.conftest import FakeCrawler, FakeFetchStrategy
+
+
+class _ChannelCrawler(FakeCrawler):
+    """채널 이름을 지정할 수 있는 FakeCrawler"""
+
+    def __init__(self, name: str, settings) -> None:
+        super().__init__(FakeFetchStrategy({}), settings)
+        self._name = name
+
+    @property
+    def channel_name(self) -> str:
+        return self._name
+
+
+class TestWorkScheduler:
+    """WorkScheduler 테스트"""
+
+    async def test_runs_all_items_including_submitted_by_handler(self, settings):
+        """핸들러가 추가한 작업까지 모두 처리한 뒤 종료한다"""
+        crawler = _ChannelCrawler("a", settings)
+        handled: list[WorkKind] = []
+
+        async def handler(item: WorkItem) -> None:
+            handled.append(item.kind)
+            if item.kind is WorkKind.SEARCH:
+                scheduler.submit(WorkItem(WorkKind.DETAIL, crawler, item.keyword))
+
+        scheduler = WorkScheduler(handler, workers=2, slots=ChannelSlots(2))
+        scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, "AI", page=1))
+        stats = await scheduler.run()
+
+        assert handled == [WorkKind.SEARCH, WorkKind.DETAIL]
+        assert stats.completed == 2
+        assert stats.queue_depth == 0
+
+    async def test_channel_limit_respected(self, settings):
+        """채널별 동시 실행 수가 상한을 넘지 않는다"""
+        crawlers = {name: _ChannelCrawler(name, settings) for name in ("a", "b")}
+        running = {"a": 0, "b": 0}
+        peak = {"a": 0, "b": 0}
+
+        async def handler(item: WorkItem) -> None:
+            running[item.channel] += 1
+            peak[item.channel] = max(peak[item.channel], running[item.channel])
+            await asyncio.sleep(0.01)
+            running[item.channel] -= 1
+
+        scheduler = WorkScheduler(handler, workers=8, slots=ChannelSlots(3, {"b": 1}))
+        for name, crawler in crawlers.items():
+            for page in range(10):
+                scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, "AI", page=page))
+        await scheduler.run()
+
+        assert peak == {"a": 3, "b": 1}
+
+    async def test_detail_before_search_and_round_robin(self, settings):
+        """기사 작업이 먼저 실행되고, 같은 종류는 키워드 간 번갈아 실행된다"""
+        crawler = _ChannelCrawler("a", settings)
+        order: list[tuple[WorkKind, str]] = []
+
+        async def handler(item: WorkItem) -> None:
+            order.append((item.kind, item.keyword))
+
+        scheduler = WorkScheduler(handler, workers=1, slots=ChannelSlots(1))
+        for keyword in ("k1", "k2"):
+            for page in range(2):
+                scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, keyword, page=page))
+        scheduler.submit(WorkItem(WorkKind.DETAIL, crawler, "k2"))
+        await scheduler.run()
+
+        assert order == [
+            (WorkKind.DETAIL, "k2"),
+            (WorkKind.SEARCH, "k1"),
+            (WorkKind.SEARCH, "k2"),
+            (WorkKind.SEARCH, "k1"),
+            (WorkKind.SEARCH, "k2"),
+        ]
+
+    async def test_handler_exception_does_not_stop_worker(self, settings):
+        """핸들러 예외가 나도 나머지 작업을 계속 처리한다"""
+        crawler = _ChannelCrawler("a", settings)
+        handled: list[int] = []
+
+        async def handler(item: WorkItem) -> None:
+            handled.append(item.page)
+            if item.page == 0:
+                raise RuntimeError("실패")
+
+        scheduler = WorkScheduler(handler, workers=1, slots=ChannelSlots(1))
+        for page in range(3):
+            scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, "AI", page=page))
+        stats = await scheduler.run()
+
+        assert handled == [0, 1, 2]
+        assert stats.completed == 3
+        assert 0.0 <= stats.utilization <= 1.0
+
+    async def test_paused_channel_yields_to_other_channels(self, settings):
+        """멈춘 채널의 작업은 재개 시각까지 배정되지 않고 다른 채널이 먼저 실행된다"""
+        crawlers = {name: _ChannelCrawler(name, settings) for name in ("a", "b")}
+        order: list[str] = []
+
+        async def handler(item: WorkItem) -> None:
+            order.append(f"{item.channel}{item.page}")
+            if item.channel == "a" and item.page == 0:
+                scheduler.pause("a", 0.05)
+            await asyncio.sleep(0.01)
+
+        scheduler = WorkScheduler(handler, workers=1, slots=ChannelSlots(1))
+        for page in range(2):
+            scheduler.submit(WorkItem(WorkKind.SEARCH, crawlers["a"], "AI", page=page))
+        for page in range(2):
+            scheduler.submit(WorkItem(WorkKind.SEARCH, crawlers["b"], "AI", page=page))
+        await scheduler.run()
+
+        assert order == ["a0", "b0", "b1", "a1"]
+
+    async def test_shared_slots_limit_channel_across_schedulers(self, settings):
+        """슬롯을 공유하는 스케줄러들은 채널별 상한을 함께 지킨다"""
+        crawler = _ChannelCrawler("a", settings)
+        running = peak = 0
+
+        async def handler(item: WorkItem) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        slots = ChannelSlots(2)
+        schedulers = [WorkScheduler(handler, workers=4, slots=slots) for _ in range(3)]
+        for scheduler in schedulers:
+            for page in range(4):
+                scheduler.submit(WorkItem(WorkKind.SEARCH, crawler, "AI", page=page))
+        stats = await asyncio.gather(*(scheduler.run() for scheduler in schedulers))
+
+        assert peak == 2
+        assert [s.completed for s in stats] == [4, 4, 4]
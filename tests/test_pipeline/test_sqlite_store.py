@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import pytest
+
+from src.core.models import Article, CrawlResult
+from src.pipeline.sqlite_store import SqliteStore
+
+
+def _article(url: str, title: str, content: str, published_at: datetime | None = None) -> Article:
+    return Article(
+        title=title,
+        url=url,
+        content=content,
+        published_at=published_at,
+        channel="mk",
+        keyword="금리",
+        metadata={"source": "test"},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SqliteStore(str(tmp_path / "articles.db"), batch_size=2) as s:
+        yield s
+
+
+class TestSqliteStore:
+    """SqliteStore 테스트"""
+
+    def test_write_and_search(self, store):
+        """저장한 기사를 전문 검색으로 찾는다"""
+        result = CrawlResult(
+            channel="mk",
+            keyword="금리",
+            articles=[
+                _article("https://example.com/1", "기준금리 동결", "한국은행이 금리를 동결했다"),
+                _article("https://example.com/2", "반도체 수출 회복", "반도체가 수출을 이끌었다"),
+            ],
+        )
+
+        assert store.write([result]) == 2
+
+        found = store.search("반도체")
+        assert [a.url for a in found] == ["https://example.com/2"]
+        assert found[0].metadata == {"source": "test"}
+
+    def test_duplicate_url_ignored(self, store):
+        """같은 URL은 한 번만 저장된다"""
+        articles = [
+            _article("https://example.com/1", "제목", "본문"),
+            _article("https://example.com/1", "제목", "본문"),
+            _article("https://example.com/2", "제목", "본문"),
+        ]
+
+        assert store.insert_articles(articles) == 2
+        assert store.insert_articles(articles) == 0
+
+    def test_prefix_search_matches_korean_suffix(self, store):
+        """조사가 붙은 단어도 접두사 검색으로 찾는다"""
+        store.insert_articles([_article("https://example.com/1", "제목", "금리가 올랐다")])
+
+        assert len(store.search("금리")) == 1
+        assert store.search("금리", prefix=False) == []
+
+    def test_search_date_filter(self, store):
+        """since/until 범위 밖의 기사는 제외한다"""
+        store.insert_articles(
+            [
+                _article("https://example.com/old", "금리", "본문", datetime(2024, 1, 1)),
+                _article("https://example.com/new", "금리", "본문", datetime(2024, 1, 10)),
+            ]
+        )
+
+        found = store.search("금리", since=datetime(2024, 1, 5))
+        assert [a.url for a in found] == ["https://example.com/new"]
+
+    def test_count_by_day(self, store):
+        """날짜별 언급 기사 수 집계"""
+        store.insert_articles(
+            [
+                _article("https://example.com/1", "금리", "본문", datetime(2024, 1, 1, 9)),
+                _article("https://example.com/2", "금리", "본문", datetime(2024, 1, 1, 18)),
+                _article("https://example.com/3", "금리", "본문", datetime(2024, 1, 2, 9)),
+            ]
+        )
+
+        assert store.count_by_day("금리") == [("2024-01-01", 2), ("2024-01-02", 1)]
+
+    @pytest.mark.parametrize("query", ["", "   ", "!!", "... ?"])
+    def test_empty_or_punctuation_query_returns_nothing(self, store, query):
+        """검색할 단어가 없는 검색어는 FTS5 문법 오류 없이 빈 결과를 반환한다"""
+        store.insert_articles([_article("https://example.com/1", "금리", "본문")])
+
+        assert store.search(query) == []
+        assert store.count_by_day(query) == []
+
+    def test_punctuation_terms_ignored(self, store):
+        """문장 부호만 있는 단어는 빼고 나머지 단어로 검색한다"""
+        store.insert_articles([_article("https://example.com/1", "제목", "금리가 올랐다")])
+
+        assert [a.url for a in store.search("금리 !!")] == ["https://example.com/1"]
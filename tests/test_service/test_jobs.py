@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.service import jobs as jobs_module
+from src.service.jobs import JobManager, JobRequest, JobState
+
+
+@pytest.fixture
+def manager(monkeypatch, settings, patched_registry):
+    """FakeCrawler로 동작하는 warm 오케스트레이터 기반 JobManager"""
+    monkeypatch.setattr(jobs_module, "get_available_channels", lambda: ["fake"])
+    orchestrator = CrawlOrchestrator(settings)
+    orchestrator._http_client = object()  # 세션이 열린 상태로 간주
+    return JobManager(orchestrator, settings)
+
+
+def _many_articles(strategy, count: int) -> None:
+    urls = [f"https://fake.test/a/{i}" for i in range(count)]
+    strategy.pages = {
+        "https://fake.test/search?q=AI&page=1": "\n".join(f"{u}|기사" for u in urls),
+        **{u: "본문" for u in urls},
+    }
+
+
+class TestJobRequest:
+    """JobRequest 검증 테스트"""
+
+    def test_requires_keywords(self):
+        """키워드가 없으면 거부한다"""
+        with pytest.raises(ValidationError):
+            JobRequest(keywords=[])
+
+    def test_rejects_unknown_channel(self):
+        """등록되지 않은 채널은 거부한다"""
+        with pytest.raises(ValidationError):
+            JobRequest(keywords=["AI"], channels=["unknown"])
+
+
+class TestJobManager:
+    """JobManager 테스트"""
+
+    async def test_job_completes_with_results(self, manager):
+        """작업이 끝나면 상태와 결과를 조회할 수 있다"""
+        job = manager.submit(JobRequest(keywords=["AI"], channels=["fake"]))
+        await job.task
+
+        assert job.state is JobState.COMPLETED
+        assert job.status()["articles"] == 1
+        assert job.status()["errors"] == 1
+        [result] = job.results()
+        assert (result.channel, result.keyword) == ("fake", "AI")
+
+    async def test_stream_replays_and_follows(self, manager):
+        """stream은 이미 수집된 이벤트부터 작업 종료까지 모두 전달한다"""
+        job = manager.submit(JobRequest(keywords=["AI"], channels=["fake"]))
+
+        events = [e async for e in job.stream()]
+
+        assert len(events) == 2
+        assert job.finished
+        status = job.status()
+        assert (status["articles"], status["errors"]) == (1, 1)
+
+    async def test_max_articles_stops_job(self, manager, patched_registry):
+        """기사 수 제한에 도달하면 작업을 완료 처리한다"""
+        _many_articles(patched_registry, 20)
+
+        job = manager.submit(JobRequest(keywords=["AI"], channels=["fake"], max_articles=3))
+        await job.task
+
+        assert job.state is JobState.COMPLETED
+        assert job.article_count == 3
+
+    async def test_cancel_running_job(self, manager, patched_registry):
+        """실행 중인 작업을 취소할 수 있다"""
+        _many_articles(patched_registry, 20)
+        manager._settings.request_delay = 0.05
+
+        job = manager.submit(JobRequest(keywords=["AI"], channels=["fake"]))
+        await asyncio.sleep(0.01)
+        assert manager.cancel(job.id)
+        await asyncio.gather(job.task, return_exceptions=True)
+
+        assert job.state is JobState.CANCELLED
+        assert not manager.cancel(job.id)
+
+    async def test_timeout_fails_job(self, manager, patched_registry):
+        """제한 시간을 넘긴 작업은 실패 처리한다"""
+        _many_articles(patched_registry, 20)
+        manager._settings.request_delay = 0.05
+
+        job = manager.submit(JobRequest(keywords=["AI"], channels=["fake"], timeout=0.02))
+        await job.task
+
+        assert job.state is JobState.FAILED
+        assert "제한 시간" in job.error
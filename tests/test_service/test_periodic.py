@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.pipeline.result_writer import ResultWriter
+from src.service import periodic as periodic_module
+from src.service.periodic import PeriodicRunner, ScheduleSpec, SeenUrlState
+
+
+@pytest.fixture
+def spec(monkeypatch, tmp_path):
+    monkeypatch.setattr(periodic_module, "get_available_channels", lambda: ["fake"])
+    return ScheduleSpec(
+        groups=[
+            {"name": "ai", "keywords": ["AI"], "channels": ["fake"], "interval": 0.01},
+        ],
+        state_path=str(tmp_path / "state.json"),
+    )
+
+
+@pytest.fixture
+def runner(settings, patched_registry, spec, tmp_path):
+    orchestrator = CrawlOrchestrator(settings)
+    return PeriodicRunner(orchestrator, spec, ResultWriter(str(tmp_path / "out")))
+
+
+class TestScheduleSpec:
+    """ScheduleSpec 검증 테스트"""
+
+    def test_rejects_duplicate_group_names(self):
+        """그룹 이름이 중복되면 거부한다"""
+        group = {"name": "a", "keywords": ["AI"], "interval": 60}
+        with pytest.raises(ValidationError):
+            ScheduleSpec(groups=[group, group])
+
+    def test_from_file(self, tmp_path):
+        """JSON 파일에서 작업 명세를 읽는다"""
+        path = tmp_path / "spec.json"
+        path.write_text(json.dumps({"groups": [{"name": "a", "keywords": ["AI"], "interval": 60}]}))
+
+        spec = ScheduleSpec.from_file(str(path))
+
+        assert spec.groups[0].jitter == 0.1
+
+
+class TestPeriodicRunner:
+    """PeriodicRunner 테스트"""
+
+    async def test_second_tick_skips_seen_articles(self, runner, spec, patched_registry):
+        """이전 tick에서 수집한 기사는 다시 요청하지 않는다"""
+        await runner.run_tick(spec.groups[0])
+        patched_registry.fetched.clear()
+
+        results = await runner.run_tick(spec.groups[0])
+
+        assert patched_registry.fetched == [
+            "https://fake.test/search?q=AI&page=1",
+            "https://fake.test/a/missing",
+        ]
+        assert results[0].articles == []
+
+    async def test_state_persists_across_runners(self, runner, spec):
+        """수집 상태는 파일로 저장되어 재시작 후에도 유지된다"""
+        await runner.run_tick(spec.groups[0])
+
+        state = SeenUrlState(spec.state_path, spec.seen_ttl)
+
+        assert state.is_seen("AI", "https://fake.test/a/1")
+        assert not state.is_seen("반도체", "https://fake.test/a/1")
+
+    async def test_run_writes_only_ticks_with_new_articles(self, runner, tmp_path):
+        """새 기사가 있는 tick만 결과 파일을 남긴다"""
+        await runner.run(max_ticks=2)
+
+        assert len(list((tmp_path / "out").glob("crawl_ai_*.json"))) == 1
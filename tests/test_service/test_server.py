@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.service import jobs as jobs_module
+from src.service.jobs import JobManager
+from src.service.server import JobApiServer
+
+
+@pytest.fixture
+async def api(monkeypatch, settings, patched_registry):
+    """임의 포트에서 실행되는 작업 API 서버의 (host, port)"""
+    monkeypatch.setattr(jobs_module, "get_available_channels", lambda: ["fake"])
+    orchestrator = CrawlOrchestrator(settings)
+    orchestrator._http_client = object()  # 세션이 열린 상태로 간주
+    manager = JobManager(orchestrator, settings)
+    server = await JobApiServer(manager).start(host="127.0.0.1", port=0)
+    yield server.sockets[0].getsockname()[:2]
+    server.close()
+    await manager.shutdown()
+
+
+async def _request(address, method: str, path: str, body: dict | None = None):
+    """요청 하나를 보내고 (상태 코드, 응답 본문)을 반환한다."""
+    reader, writer = await asyncio.open_connection(*address)
+    payload = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode()
+        + payload
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), content
+
+
+class TestJobApiServer:
+    """JobApiServer 테스트"""
+
+    async def test_submit_and_stream(self, api):
+        """작업을 등록하고 NDJSON 스트림으로 이벤트를 받는다"""
+        status, body = await _request(
+            api, "POST", "/jobs", {"keywords": ["AI"], "channels": ["fake"]}
+        )
+        assert status == 202
+        job_id = json.loads(body)["id"]
+
+        status, body = await _request(api, "GET", f"/jobs/{job_id}/stream")
+        lines = [json.loads(line) for line in body.splitlines()]
+
+        assert status == 200
+        assert [line["type"] for line in lines] == ["article", "error", "status"]
+        assert lines[-1]["state"] == "completed"
+
+        status, body = await _request(api, "GET", f"/jobs/{job_id}/results")
+        assert status == 200
+        assert len(json.loads(body)[0]["articles"]) == 1
+
+    async def test_invalid_request(self, api):
+        """잘못된 작업 요청은 400을 반환한다"""
+        status, _ = await _request(api, "POST", "/jobs", {"keywords": []})
+
+        assert status == 400
+
+    async def test_unknown_job(self, api):
+        """없는 작업은 404를 반환한다"""
+        status, _ = await _request(api, "GET", "/jobs/job-999")
+
+        assert status == 404
+
+    async def test_metrics_endpoint(self, api):
+        """작업 실행 후 /metrics는 Prometheus 텍스트 형식 지표를 반환한다"""
+        status, body = await _request(
+            api, "POST", "/jobs", {"keywords": ["AI"], "channels": ["fake"]}
+        )
+        job_id = json.loads(body)["id"]
+        await _request(api, "GET", f"/jobs/{job_id}/stream")
+
+        status, body = await _request(api, "GET", "/metrics")
+        text = body.decode()
+
+        assert status == 200
+        assert "# TYPE crawler_fetch_seconds histogram" in text
+        assert 'crawler_fetch_seconds_count{channel="fake"' in text
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# `import main`(--help 경로)의 누적 import 시간 상한 (밀리초)
+STARTUP_BUDGET_MS = int(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "150"))
+
+# CLI 파싱 단계에서 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ("playwright", "httpx", "pydantic", "pydantic_settings", "bs4", "lxml")
+
+# 정적 채널만 사용하는 실행에서 main()이 import하는 경로를 재현한다
+STATIC_RUN_CODE = """
+import asyncio
+import main
+from config.settings import CrawlerSettings
+from src.pipeline.channel_registry import create_crawler
+from src.pipeline.orchestrator import CrawlOrchestrator
+from src.pipeline.result_writer import ResultWriter
+from src.shared.http_client import HttpClient
+
+asyncio.run(create_crawler("naver_news", CrawlerSettings(), HttpClient("ua")))
+"""
+
+
+def _importtime(*args: str) -> dict[str, int]:
+    """`python -X importtime` 실행 결과를 {모듈명: 누적 import 시간(µs)}으로 반환한다."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _loaded(modules: dict[str, int], package: str) -> bool:
+    return any(name == package or name.startswith(f"{package}.") for name in modules)
+
+
+class TestStartupImports:
+    """CLI 시작 시 import 비용 테스트"""
+
+    def test_help_does_not_import_heavy_modules(self):
+        """--help는 무거운 의존성을 로드하지 않는다"""
+        modules = _importtime("main.py", "--help")
+
+        loaded = [pkg for pkg in HEAVY_MODULES if _loaded(modules, pkg)]
+        assert loaded == []
+
+    def test_main_import_within_budget(self):
+        """main 모듈의 누적 import 시간이 예산 이내이다"""
+        modules = _importtime("-c", "import main")
+
+        assert modules["main"] / 1000 < STARTUP_BUDGET_MS
+
+    def test_static_run_does_not_import_browser(self):
+        """정적 채널만 사용하는 실행은 playwright를 로드하지 않는다"""
+        modules = _importtime("-c", STATIC_RUN_CODE)
+
+        assert _loaded(modules, "httpx")
+        assert not _loaded(modules, "playwright")